@@ -0,0 +1,42 @@
+"""add user search indexes
+
+Revision ID: 5c2e8f1a9b47
+Revises: 3a1d75e99904
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8f1a9b47'
+down_revision: Union[str, Sequence[str], None] = '3a1d75e99904'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #  ILIKE '%검색어%' 검색을 인덱스로 처리하기 위한 pg_trgm 확장
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.batch_alter_table('users', schema='usr') as batch_op:
+        batch_op.create_index('ix_usr_users_login_id_trgm', ['login_id'], unique=False,
+                              postgresql_using='gin', postgresql_ops={'login_id': 'gin_trgm_ops'})
+        batch_op.create_index('ix_usr_users_name_trgm', ['name'], unique=False,
+                              postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+        batch_op.create_index('ix_usr_users_email_trgm', ['email'], unique=False,
+                              postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+        batch_op.create_index('ix_usr_users_department_id_id', ['department_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users', schema='usr') as batch_op:
+        batch_op.drop_index('ix_usr_users_department_id_id')
+        batch_op.drop_index('ix_usr_users_email_trgm')
+        batch_op.drop_index('ix_usr_users_name_trgm')
+        batch_op.drop_index('ix_usr_users_login_id_trgm')
+    #  pg_trgm 확장은 다른 객체가 사용할 수 있으므로 제거하지 않습니다.
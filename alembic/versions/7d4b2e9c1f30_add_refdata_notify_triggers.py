@@ -0,0 +1,48 @@
+"""add refdata notify triggers
+
+Revision ID: 7d4b2e9c1f30
+Revises: 5c2e8f1a9b47
+Create Date: 2026-10-17 14:05:12.518734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4b2e9c1f30'
+down_revision: Union[str, Sequence[str], None] = '5c2e8f1a9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#  참조 데이터 캐시(wims/cache.py)가 LISTEN하는 채널과 알림을 보내는 테이블
+CHANNEL = 'wims_refdata'
+TABLES = ['departments', 'users']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #  변경된 테이블 이름("스키마.테이블")을 알림으로 보냅니다. 알림은 커밋 시점에 전달됩니다.
+    #  문장 단위 트리거이므로 여러 행을 바꾸는 문도 알림은 한 번이며, 같은 트랜잭션의 중복 알림은 합쳐집니다.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION usr.notify_refdata_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_refdata
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON usr.{table}
+            FOR EACH STATEMENT EXECUTE FUNCTION usr.notify_refdata_change()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_refdata ON usr.{table}")
+    op.execute("DROP FUNCTION IF EXISTS usr.notify_refdata_change()")
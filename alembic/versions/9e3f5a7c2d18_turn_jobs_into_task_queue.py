@@ -0,0 +1,62 @@
+"""turn jobs into task queue
+
+Revision ID: 9e3f5a7c2d18
+Revises: 7d4b2e9c1f30
+Create Date: 2026-10-17 15:40:27.913056
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# [추가] SQLModel를 인식하도록 추가
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3f5a7c2d18'
+down_revision: Union[str, Sequence[str], None] = '7d4b2e9c1f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('jobs', schema='usr') as batch_op:
+        batch_op.alter_column('description', server_default='')
+        batch_op.add_column(sa.Column('queue', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False, server_default='default'))
+        batch_op.add_column(sa.Column('task', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False, server_default=''))
+        batch_op.add_column(sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        #  기존 행은 실행할 작업이 없으므로 완료 상태로 둡니다.
+        batch_op.add_column(sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False, server_default='succeeded'))
+        batch_op.add_column(sa.Column('priority', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='5'))
+        batch_op.add_column(sa.Column('timeout_seconds', sa.Integer(), nullable=False, server_default='300'))
+        batch_op.add_column(sa.Column('run_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False))
+        batch_op.add_column(sa.Column('locked_until', sa.TIMESTAMP(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column('locked_by', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True))
+        batch_op.add_column(sa.Column('last_error', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+        batch_op.add_column(sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        batch_op.add_column(sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True))
+        batch_op.add_column(sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True))
+        batch_op.add_column(sa.Column('finished_at', sa.TIMESTAMP(timezone=True), nullable=True))
+        batch_op.create_index('ix_usr_jobs_claim', ['queue', sa.text('priority DESC'), 'run_at', 'id'], unique=False,
+                              postgresql_where=sa.text("status = 'queued'"))
+        batch_op.create_index('ix_usr_jobs_lease', ['queue', 'locked_until'], unique=False,
+                              postgresql_where=sa.text("status = 'running'"))
+    #  새 작업은 add_job()이 상태를 지정하므로 기본값을 대기 상태로 바꿉니다.
+    op.alter_column('jobs', 'status', server_default='queued', schema='usr')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('jobs', schema='usr') as batch_op:
+        batch_op.drop_index('ix_usr_jobs_lease')
+        batch_op.drop_index('ix_usr_jobs_claim')
+        for column in ('finished_at', 'updated_at', 'created_at', 'result', 'last_error', 'locked_by',
+                       'locked_until', 'run_at', 'timeout_seconds', 'max_attempts', 'attempts', 'priority',
+                       'status', 'payload', 'task', 'queue'):
+            batch_op.drop_column(column)
+        batch_op.alter_column('description', server_default=None)
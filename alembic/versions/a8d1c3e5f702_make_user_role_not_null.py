@@ -0,0 +1,36 @@
+"""make user role not null
+
+Revision ID: a8d1c3e5f702
+Revises: f2c8d4e6a1b3
+Create Date: 2026-10-18 10:21:07.518334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d1c3e5f702'
+down_revision: Union[str, Sequence[str], None] = 'f2c8d4e6a1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#  UserRole.GENERAL_USER
+GENERAL_USER = 100
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    #  역할 없이 저장된 사용자는 일반 사용자로 봅니다. (UserRole(None)으로 목록/로그인이 실패하던 행)
+    op.execute(f"UPDATE usr.users SET role = {GENERAL_USER} WHERE role IS NULL")
+    with op.batch_alter_table('users', schema='usr') as batch_op:
+        batch_op.alter_column('role', existing_type=sa.Integer(), nullable=False,
+                              server_default=sa.text(str(GENERAL_USER)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users', schema='usr') as batch_op:
+        batch_op.alter_column('role', existing_type=sa.Integer(), nullable=True, server_default=None)
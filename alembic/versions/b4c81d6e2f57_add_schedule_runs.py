@@ -0,0 +1,44 @@
+"""add schedule runs
+
+Revision ID: b4c81d6e2f57
+Revises: 9e3f5a7c2d18
+Create Date: 2026-10-17 17:05:12.480391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# [추가] SQLModel를 인식하도록 추가
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c81d6e2f57'
+down_revision: Union[str, Sequence[str], None] = '9e3f5a7c2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('jobs', schema='usr') as batch_op:
+        batch_op.add_column(sa.Column('started_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.create_table('schedule_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('schedule', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('scheduled_for', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['usr.jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('schedule', 'scheduled_for'),
+    schema='usr'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('schedule_runs', schema='usr')
+    with op.batch_alter_table('jobs', schema='usr') as batch_op:
+        batch_op.drop_column('started_at')
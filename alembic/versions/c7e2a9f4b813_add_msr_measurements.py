@@ -0,0 +1,82 @@
+"""add msr measurements
+
+Revision ID: c7e2a9f4b813
+Revises: b4c81d6e2f57
+Create Date: 2026-10-17 18:21:47.215604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# [추가] SQLModel를 인식하도록 추가
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9f4b813'
+down_revision: Union[str, Sequence[str], None] = 'b4c81d6e2f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#  참조 데이터 캐시 무효화 알림 트리거를 다는 테이블 (리비전 7d4b2e9c1f30의 함수 사용)
+REFDATA_TABLES = ['sites', 'tags']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SCHEMA IF NOT EXISTS msr")
+    op.create_table('sites',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('code', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code'),
+    schema='msr'
+    )
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('code', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('kind', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('unit', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['site_id'], ['msr.sites.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code'),
+    schema='msr'
+    )
+    op.create_index('ix_msr_tags_site_id', 'tags', ['site_id', 'kind'], unique=False, schema='msr')
+    #  월 단위 파티션은 wims.domains.msr.partitions가 적재 시점/주기 작업으로 만듭니다.
+    op.create_table('measurements',
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('ts', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('value', sa.Float(precision=53), nullable=False),
+    sa.Column('quality', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('tag_id', 'ts'),
+    schema='msr',
+    postgresql_partition_by='RANGE (ts)'
+    )
+    op.create_index('ix_msr_measurements_ts_brin', 'measurements', ['ts'], unique=False, schema='msr',
+                    postgresql_using='brin')
+    for table in REFDATA_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_refdata
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON msr.{table}
+            FOR EACH STATEMENT EXECUTE FUNCTION usr.notify_refdata_change()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('measurements', schema='msr')
+    op.drop_table('tags', schema='msr')
+    op.drop_table('sites', schema='msr')
+    op.execute("DROP SCHEMA IF EXISTS msr")
@@ -0,0 +1,44 @@
+"""add msr rollups
+
+Revision ID: d3a6f0c5e921
+Revises: c7e2a9f4b813
+Create Date: 2026-10-17 19:02:33.640118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a6f0c5e921'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a9f4b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ['rollup_1m', 'rollup_1h', 'rollup_1d']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ROLLUP_TABLES:
+        op.create_table(table,
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column('min_value', sa.Float(), nullable=False),
+        sa.Column('max_value', sa.Float(), nullable=False),
+        sa.Column('sum_value', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('last_ts', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column('last_value', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('tag_id', 'bucket'),
+        schema='msr'
+        )
+    #  이미 적재된 측정값의 집계는 msr.rebuild_rollups 작업으로 채웁니다.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(ROLLUP_TABLES):
+        op.drop_table(table, schema='msr')
@@ -0,0 +1,36 @@
+"""add msr archived months
+
+Revision ID: e5f1b7a3c690
+Revises: d3a6f0c5e921
+Create Date: 2026-10-17 21:14:08.312554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f1b7a3c690'
+down_revision: Union[str, Sequence[str], None] = 'd3a6f0c5e921'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archived_months',
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('rows', sa.BigInteger(), nullable=False),
+    sa.Column('archived_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('month', 'site_id'),
+    schema='msr'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    #  보관소의 Parquet 파일은 지우지 않습니다. 다시 올리기 전에 Postgres로 되돌려야 합니다.
+    op.drop_table('archived_months', schema='msr')
@@ -0,0 +1,51 @@
+"""add dash kpi snapshots
+
+Revision ID: f2c8d4e6a1b3
+Revises: e5f1b7a3c690
+Create Date: 2026-10-17 22:03:41.904217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+# [추가] SQLModel를 인식하도록 추가
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8d4e6a1b3'
+down_revision: Union[str, Sequence[str], None] = 'e5f1b7a3c690'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SCHEMA IF NOT EXISTS dash")
+    op.create_table('kpi_snapshots',
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('key', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('section', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+    sa.Column('label', sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+    sa.Column('value', sa.Float(precision=53), nullable=True),
+    sa.Column('unit', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=8), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=False),
+    sa.Column('observed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('site_id', 'key'),
+    schema='dash'
+    )
+    #  스냅샷이 바뀌면 참조 데이터 캐시(wims/cache.py)의 대시보드 항목을 무효화합니다.
+    op.execute("""
+        CREATE TRIGGER kpi_snapshots_notify_refdata
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON dash.kpi_snapshots
+        FOR EACH STATEMENT EXECUTE FUNCTION usr.notify_refdata_change()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('kpi_snapshots', schema='dash')
+    op.execute("DROP SCHEMA IF EXISTS dash")
@@ -1,4 +1,5 @@
 # run_backend.py
+#  개발/디버깅용 단일 워커 실행입니다. 운영 환경은 python -m wims.serve (wims/serve.py)로 실행합니다.
 import uvicorn
 
 if __name__ == "__main__":
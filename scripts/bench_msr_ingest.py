@@ -0,0 +1,79 @@
+"""
+측정값 적재 파이프라인의 단계별 처리량 측정.
+
+- 파싱: SCADA CSV(tag,ts,value,quality)를 열 단위 배열로 변환하는 시간
+- 인코딩: 배치를 COPY 바이너리 형식으로 만드는 시간
+- COPY(--db): 임시 테이블(msr.measurements와 같은 열과 기본 키)에 COPY하는 시간.
+  실제 테이블에는 쓰지 않습니다. (DB 연결 필요)
+
+목표: 한 노드에서 초당 50,000점 이상을 지속 적재.
+
+실행: python scripts/bench_msr_ingest.py [점 수] [태그 수] [--db]
+"""
+
+import sys
+import os
+import io
+import time
+from datetime import datetime, timedelta
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import rxconfig  # noqa: F401, E402
+
+from wims.domains.msr import ingest  # noqa: E402
+
+
+def make_csv(points: int, tags: int) -> bytes:
+    start = datetime(2026, 10, 1, 0, 0, 0)
+    lines = ["tag,ts,value,quality"]
+    for i in range(points):
+        moment = start + timedelta(seconds=i // tags)
+        lines.append(f"S01-TAG-{i % tags:04d},{moment:%Y-%m-%d %H:%M:%S},{(i % 997) * 0.125:.3f},0")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def bench_copy(batch: ingest.PointBatch) -> float:
+    from wims import db
+
+    with db.sync_session() as session:
+        cursor = session.connection().connection.cursor()
+        cursor.execute("CREATE TEMP TABLE bench_measurements (LIKE msr.measurements INCLUDING DEFAULTS, PRIMARY KEY (tag_id, ts))")
+        start = time.perf_counter()
+        cursor.copy_expert(
+            ingest._COPY_SQL.format(table="bench_measurements"),
+            io.BytesIO(ingest.encode_copy_binary(batch)), size=1 << 20,
+        )
+        session.commit()
+        elapsed = time.perf_counter() - start
+        cursor.close()
+    return elapsed
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    points = int(args[0]) if args else 500_000
+    tags = int(args[1]) if len(args) > 1 else 200
+    tag_ids = {f"S01-TAG-{i:04d}": i + 1 for i in range(tags)}
+
+    data = make_csv(points, tags)
+    start = time.perf_counter()
+    batch, report = ingest.parse_csv(io.BytesIO(data), tag_ids, ingest.SCADA_TZ)
+    parse = time.perf_counter() - start
+    assert len(batch) == points and not report.errors
+    print(f"파싱 {points:,}점 ({len(data) / 1e6:.1f} MB): {parse * 1000:.0f} ms ({points / parse:,.0f} 점/s)")
+
+    start = time.perf_counter()
+    payload = ingest.encode_copy_binary(batch)
+    encode = time.perf_counter() - start
+    print(f"COPY 인코딩 {points:,}점 ({len(payload) / 1e6:.1f} MB): {encode * 1000:.0f} ms ({points / encode:,.0f} 점/s)")
+
+    if "--db" in sys.argv:
+        copy = bench_copy(batch)
+        print(f"COPY {points:,}점 (임시 테이블): {copy * 1000:.0f} ms ({points / copy:,.0f} 점/s)")
+        print(f"전체: {points / (parse + encode + copy):,.0f} 점/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+측정값 집계/다운샘플링의 DB를 제외한 처리 시간 측정.
+
+- 적재 시 집계: 배치를 분/시/일 단위로 집계하는 시간 (적재 처리량에 더해지는 비용)
+- 차트: 1년 구간을 시 집계(8,760행)로 읽었다고 보고 화면 폭만큼 다시 묶는 시간,
+  원시 값 RAW_FETCH_LIMIT개를 LTTB/최솟값·최댓값으로 줄이는 시간
+  (DB 조회는 해상도 선택으로 행 수 상한이 있으므로 차트 응답 시간은 구간 길이와 무관합니다)
+
+실행: python scripts/bench_msr_rollup.py [배치 점 수] [화면 폭]
+"""
+
+import sys
+import os
+import time
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import rxconfig  # noqa: F401, E402
+import numpy as np  # noqa: E402
+
+from wims.domains.msr import downsample, rollups  # noqa: E402
+
+_US = 1_000_000
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 1200
+    rng = np.random.default_rng(0)
+
+    tags = 200
+    tag_id = (np.arange(points) % tags).astype(np.int32)
+    ts = (1_790_000_000 + np.arange(points) // tags).astype(np.int64) * _US
+    value = rng.normal(size=points)
+    quality = np.zeros(points, dtype=np.int16)
+    result, elapsed = timed(rollups.rollup_points, tag_id, ts, value, quality)
+    rows = sum(len(agg) for agg in result.values())
+    print(f"적재 집계 {points:,}점 -> {rows:,}행: {elapsed:.1f} ms ({points / elapsed * 1000:,.0f} 점/s)")
+
+    hours = 365 * 24
+    hourly = downsample.Aggregates(
+        tag_id=np.ones(hours, dtype=np.int32),
+        bucket=np.arange(hours, dtype=np.int64) * 3600 * _US,
+        min=value[:hours] - 1, max=value[:hours] + 1, sum=value[:hours] * 3600,
+        count=np.full(hours, 3600, dtype=np.int64),
+        last_ts=np.arange(hours, dtype=np.int64) * 3600 * _US + 3599 * _US, last_value=value[:hours],
+    )
+    pixel = hours * 3600 * _US // width
+    merged, elapsed = timed(downsample.aggregate, hourly, hourly.bucket // pixel * pixel)
+    print(f"1년 시 집계 {hours:,}행 -> {len(merged):,}픽셀 구간: {elapsed:.1f} ms")
+
+    raw = rollups.RAW_FETCH_LIMIT
+    x = np.arange(raw, dtype=np.int64) * _US
+    y = np.sin(np.arange(raw) / 500) + rng.normal(size=raw) * 0.1
+    kept, elapsed = timed(downsample.lttb, x, y, width * rollups.POINTS_PER_PIXEL)
+    print(f"LTTB {raw:,}점 -> {len(kept):,}점: {elapsed:.1f} ms")
+    kept, elapsed = timed(downsample.minmax_decimate, x, y, width)
+    print(f"최솟값/최댓값 {raw:,}점 -> {len(kept):,}점: {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+세션 상태 크기 비교: logged_in_user에 User ORM 객체를 저장할 때와 Principal을 저장할 때.
+
+- pickle: 상태 관리자(disk/redis)에 세션별로 저장되는 크기
+- json: 값이 바뀔 때 클라이언트로 전송되는 delta 크기
+- state pickle: BaseState 인스턴스 전체를 직렬화한 크기
+
+실행: python scripts/bench_session_state.py
+"""
+
+import sys
+import os
+import pickle
+from datetime import datetime, timezone
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import rxconfig  # noqa: F401, E402
+from reflex.utils.format import json_dumps  # noqa: E402
+
+from wims.domains.usr.models import User, UserRole  # noqa: E402
+from wims.state.base import BaseState, Principal  # noqa: E402
+
+
+def make_user() -> User:
+    """운영 데이터와 비슷한 길이의 사용자 레코드를 만듭니다."""
+    now = datetime.now(timezone.utc)
+    return User(
+        id=1024,
+        login_id="operator.kim",
+        password_hash="$2b$12$" + "x" * 53,
+        email="operator.kim@wims.example.com",
+        name="김운영",
+        department_id=3,
+        role=UserRole.FACILITY_MANAGER,
+        code="W2024-0193",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def state_size(value) -> int:
+    """logged_in_user만 채운 BaseState 인스턴스의 pickle 크기를 반환합니다."""
+    state = BaseState(_reflex_internal_init=True)
+    object.__setattr__(state, "dirty_vars", set())
+    state.__dict__["logged_in_user"] = value
+    return len(pickle.dumps(state))
+
+
+def main():
+    user = make_user()
+    principal = Principal.from_user(user)
+
+    rows = [
+        ("pickle (state manager)", len(pickle.dumps(user)), len(pickle.dumps(principal))),
+        ("json (websocket delta)", len(json_dumps(user).encode()), len(json_dumps(principal).encode())),
+    ]
+    try:
+        rows.append(("BaseState pickle", state_size(user), state_size(principal)))
+    except Exception as e:  # noqa: BLE001 - reflex 내부 API가 바뀌어도 나머지 수치는 출력합니다.
+        print(f"(BaseState pickle 측정 생략: {e})")
+
+    print(f"{'':<24} | {'User':>8} | {'Principal':>9} | {'saved':>6}")
+    print("-" * 56)
+    for label, before, after in rows:
+        print(f"{label:<24} | {before:>7}B | {after:>8}B | {1 - after / before:>6.0%}")
+    print()
+    print("json(User)     :", json_dumps(user))
+    print("json(Principal):", json_dumps(principal))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+시작 시간 측정: 진입점별 import 시간과 백엔드의 첫 요청까지 걸리는 시간.
+
+측정마다 새 파이썬 프로세스를 띄우므로(콜드 import) 릴리스 사이에 비교할 수 있습니다.
+
+- models: wims.models (alembic 등 모델 메타데이터만 필요한 곳)
+- worker: 작업 워커와 TASK_MODULES
+- app: wims.wims (Reflex 백엔드가 불러오는 앱 모듈)
+- first request: app import + ASGI 앱 생성(컴파일 생략, 운영 백엔드처럼 상태를 새로 만드는 페이지만 평가) + lifespan + GET /ping
+- --top: app import에서 누적 시간이 큰 모듈 (python -X importtime)
+
+백엔드 측정은 빈 임시 디렉터리에서 실행하므로 프로젝트의 .web에는 아무것도 쓰지 않습니다.
+DB에 연결하지 않습니다.
+
+실행: python scripts/bench_startup.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+#  자식 프로세스에서 실행할 코드. 마지막 줄에 측정값(JSON)을 출력합니다.
+_PRELUDE = """
+import json, time
+started = time.perf_counter()
+"""
+
+ENTRYPOINTS = {
+    "models": """
+import rxconfig, wims.models
+print(json.dumps({"import": time.perf_counter() - started}))
+""",
+    "worker": """
+import importlib
+import wims.tasks.worker as worker
+for module in worker.TASK_MODULES:
+    importlib.import_module(module)
+print(json.dumps({"import": time.perf_counter() - started}))
+""",
+    "app": """
+import rxconfig, wims.wims
+print(json.dumps({"import": time.perf_counter() - started}))
+""",
+    "first request": """
+from reflex.environment import environment
+environment.REFLEX_SKIP_COMPILE.set(True)
+import rxconfig, wims.wims
+imported = time.perf_counter()
+asgi = wims.wims.app()
+created = time.perf_counter()
+from starlette.testclient import TestClient
+with TestClient(asgi) as client:
+    response = client.get("/ping")
+    response.raise_for_status()
+    done = time.perf_counter()
+print(json.dumps({"import": imported - started, "app()": created - imported, "ping": done - created,
+                  "total": done - started}))
+""",
+}
+
+
+def run(code: str, workdir: str, *python_args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+    return subprocess.run(
+        [sys.executable, *python_args, "-c", _PRELUDE + code],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def measure(code: str, runs: int, workdir: str) -> dict:
+    """runs번 새 프로세스에서 실행해 항목별 중앙값(초)을 반환합니다."""
+    samples = [json.loads(run(code, workdir).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def import_profile(top: int, workdir: str):
+    """app import의 누적 시간 상위 모듈을 (마이크로초, 모듈) 목록으로 반환합니다."""
+    stderr = run(ENTRYPOINTS["app"], workdir, "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), module.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="진입점별 측정 횟수 (중앙값)")
+    parser.add_argument("--top", type=int, default=0, help="app import에서 느린 모듈 상위 N개 표시")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="wims-startup-") as workdir:
+        #  첫 실행은 바이트코드 컴파일이 섞이므로 버립니다.
+        run(ENTRYPOINTS["first request"], workdir)
+        print(f"{'entrypoint':<16}median (ms)")
+        for name, code in ENTRYPOINTS.items():
+            result = measure(code, args.runs, workdir)
+            detail = "  ".join(f"{key} {seconds * 1000:,.0f}" for key, seconds in result.items())
+            print(f"{name:<16}{detail}")
+
+        if args.top:
+            print(f"\napp import: 누적 시간 상위 {args.top}개 모듈")
+            for cumulative, module in import_profile(args.top, workdir):
+                print(f"{cumulative / 1000:>10,.0f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
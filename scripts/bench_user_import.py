@@ -0,0 +1,77 @@
+"""
+사용자 일괄 등록 파이프라인의 DB를 제외한 단계별 처리 시간 측정.
+
+- 파싱/검증: 10,000행 CSV를 스트리밍으로 읽고 형식과 파일 내 중복을 검사하는 시간
+- 해싱: 표본 비밀번호를 한 프로세스에서 순차로 해싱할 때와 hash_many()로 병렬 해싱할 때의 처리량
+  (bcrypt 비용이 전체 시간을 좌우하므로 10,000명 기준 예상 시간도 함께 출력합니다)
+
+실행: python scripts/bench_user_import.py [행 수] [해싱 표본 수]
+"""
+
+import sys
+import os
+import io
+import time
+import asyncio
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import rxconfig  # noqa: F401, E402
+
+from wims.domains.usr import importer  # noqa: E402
+from wims.hashing import hasher  # noqa: E402
+from wims.utils import get_password_hash  # noqa: E402
+
+
+def make_csv(rows: int) -> bytes:
+    lines = ["login_id,password,email,name,role,department_code,code"]
+    for i in range(rows):
+        lines.append(f"site.user{i:05d},Init-{i:05d}!,site.user{i:05d}@wims.example.com,사용자{i},LAB_ANALYST,LAB,S{i:07d}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def bench_parse(rows: int) -> float:
+    data = make_csv(rows)
+    start = time.perf_counter()
+    report = importer.ImportReport()
+    parsed = importer.parse_records(importer.iter_records(io.BytesIO(data), "bench.csv"), report)
+    elapsed = time.perf_counter() - start
+    assert len(parsed) == rows and not report.errors
+    return elapsed
+
+
+async def bench_hash(samples: int):
+    passwords = [f"Init-{i:05d}!" for i in range(samples)]
+
+    start = time.perf_counter()
+    for password in passwords:
+        get_password_hash(password)
+    serial = time.perf_counter() - start
+
+    #  풀 생성(spawn) 비용이 측정에 섞이지 않도록 먼저 한 번 실행합니다.
+    await hasher.hash_many(passwords[:1])
+    start = time.perf_counter()
+    await hasher.hash_many(passwords)
+    pooled = time.perf_counter() - start
+    return serial, pooled
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    samples = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+    parse = bench_parse(rows)
+    print(f"파싱/검증 {rows}행: {parse * 1000:.0f} ms ({rows / parse:,.0f} 행/s)")
+
+    serial, pooled = asyncio.run(bench_hash(samples))
+    print(f"해싱 {samples}개 순차: {serial:.2f} s  -> {rows}명 예상 {serial / samples * rows:,.0f} s")
+    print(
+        f"해싱 {samples}개 hash_many (워커 {hasher.max_workers}): {pooled:.2f} s"
+        f"  -> {rows}명 예상 {pooled / samples * rows:,.0f} s"
+    )
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+사용자 목록 체크박스 토글 비용 벤치마크.
+
+이전 방식(토글마다 전체 행을 UserList로 다시 투영하고 ID 집합을 만들어 issubset 검사)과
+현재 방식(조회 시 한 번 투영 + 미리 계산한 ID 집합/선택 수로 O(1) 판단)을
+행 수를 늘려가며 비교합니다. 현재 방식의 토글당 비용은 행 수와 관계없이 일정해야 합니다.
+
+실행: python scripts/bench_user_selection.py
+"""
+
+import sys
+import os
+import time
+
+# [추가] 스크립트의 상위 폴더(프로젝트 루트)를 파이썬 경로에 추가합니다.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import rxconfig  # noqa: F401, E402
+from wims.domains.usr.models import Department, User, UserRole  # noqa: E402
+from wims.domains.usr.projection import (  # noqa: E402
+    count_selected, is_all_selected, project_users, to_user_list, toggle_selection
+)
+
+ROW_COUNTS = [100, 1_000, 10_000, 50_000]
+TOGGLES = 200
+LEGACY_TOGGLES = 10
+
+
+def make_users(count: int) -> list[User]:
+    """벤치마크용 사용자 객체를 DB 없이 메모리에서 생성합니다."""
+    dept = Department(id=1, code="LAB", name="실험실")
+    return [
+        User(
+            id=i, login_id=f"user{i}", password_hash="x", email=f"user{i}@example.com",
+            name=f"사용자{i}", role=UserRole.GENERAL_USER, department_id=1, department=dept,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def bench_legacy(users: list[User]) -> float:
+    """이전 방식: 토글할 때마다 display_users 재투영 + ID 집합 생성 + issubset."""
+    selected: set[int] = set()
+    start = time.perf_counter()
+    for i in range(LEGACY_TOGGLES):
+        user_id = users[i % len(users)].id
+        selected.symmetric_difference_update({user_id})
+        displayed_ids = {u.id for u in [to_user_list(user) for user in users]}
+        displayed_ids.issubset(selected)
+    return (time.perf_counter() - start) / LEGACY_TOGGLES
+
+
+def bench_current(users: list[User]) -> float:
+    """현재 방식: 조회 시 한 번 투영한 뒤 토글은 O(1) 계산만 수행."""
+    display_users, _ = project_users(users, {})
+    displayed_ids = {user.id for user in display_users}
+    selected: set[int] = set()
+    selected_on_page = count_selected(displayed_ids, selected)
+
+    start = time.perf_counter()
+    for i in range(TOGGLES):
+        user_id = users[i % len(users)].id
+        selected_on_page = toggle_selection(user_id, displayed_ids, selected, selected_on_page)
+        is_all_selected(displayed_ids, selected_on_page)
+    return (time.perf_counter() - start) / TOGGLES
+
+
+def bench_reproject(users: list[User]) -> float:
+    """한 행만 바뀐 상태에서 다시 투영할 때의 비용 (변경된 행만 새로 변환)."""
+    _, cache = project_users(users, {})
+    users[0].name = "변경된 이름"
+    start = time.perf_counter()
+    project_users(users, cache)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'rows':>8} | {'legacy/toggle':>14} | {'current/toggle':>15} | {'reproject(1 changed)':>21}")
+    print("-" * 68)
+    for count in ROW_COUNTS:
+        users = make_users(count)
+        #  이전 방식은 토글마다 전체를 재투영하므로 토글 횟수를 줄여 측정합니다.
+        legacy = bench_legacy(users)
+        current = bench_current(users)
+        reproject = bench_reproject(users)
+        print(f"{count:>8} | {legacy * 1e6:>11.1f} us | {current * 1e6:>12.2f} us | {reproject * 1e3:>18.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+# /wims_project/wims/api.py
+"""
+Reflex 이벤트(웹소켓)가 아닌 일반 HTTP로 제공하는 엔드포인트를 모으는 FastAPI 앱입니다.
+wims.py에서 rx.App(api_transformer=api)로 Reflex 백엔드에 연결됩니다.
+"""
+
+from fastapi import FastAPI
+
+from . import domains, ops
+
+api = FastAPI(title="WIMS API")
+
+#  운영 점검 (wims/ops.py)
+api.include_router(ops.router)
+
+#  도메인별 라우터 등록 (각 도메인 패키지의 DOMAIN.routers)
+for router in domains.routers():
+    api.include_router(router)
@@ -0,0 +1,231 @@
+# /wims_project/wims/cache.py
+"""
+프로세스 전역 참조 데이터(부서, 역할, 처리시설, 자재 등 선택 목록) 캐시입니다.
+
+- 도메인은 register()로 이름, 로더 함수(동기 Session을 받는 조회 함수), 의존 테이블을 등록하고
+  이벤트 핸들러는 `await cache.get(이름)`으로 값을 받습니다. 같은 워커의 모든 세션이 한 값을 공유하므로
+  캐시가 유효한 동안 페이지 로드는 참조 데이터 조회 쿼리를 실행하지 않습니다.
+- 항목은 로드 시작 시점의 의존 테이블 버전을 함께 저장합니다. 테이블이 무효화되면 버전이 올라가
+  해당 항목은 다음 조회 때 다시 로드됩니다. (로드 도중 무효화된 경우도 포함)
+- 무효화는 PostgreSQL LISTEN/NOTIFY로 받습니다. usr 테이블의 트리거가 커밋 시 'wims_refdata' 채널로
+  테이블 이름을 보내고, 워커마다 하나씩 있는 수신 스레드가 즉시 버전을 올립니다.
+- 알림 연결이 끊긴 동안의 변경을 놓치지 않도록 재연결 시 전체를 무효화하며,
+  TTL과 최대 항목 수(LRU)는 알림을 받지 못하는 경우의 안전장치입니다.
+
+반환된 값은 모든 세션이 공유하므로 호출자가 수정하면 안 됩니다. (State에는 복사해서 넣습니다)
+
+환경 변수:
+    WIMS_REFDATA_TTL: 항목 유효 시간(초, 기본값: 300)
+    WIMS_REFDATA_MAX_ENTRIES: 최대 항목 수 (기본값: 256)
+"""
+
+import asyncio
+import logging
+import os
+import select
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from . import db
+
+logger = logging.getLogger(__name__)
+
+#  usr 테이블 트리거가 알림을 보내는 채널 (alembic 리비전 7d4b2e9c1f30 참고)
+NOTIFY_CHANNEL = "wims_refdata"
+
+CacheKey = Tuple[str, Tuple[Hashable, ...]]
+
+
+@dataclass(frozen=True)
+class _Loader:
+    fn: Callable[..., Any]
+    tables: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    versions: Tuple[int, ...]
+    loaded_at: float
+
+
+class RefDataCache:
+    """버전과 TTL/LRU로 관리하는 참조 데이터 캐시"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._loaders: Dict[str, _Loader] = {}
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._table_versions: Dict[str, int] = {}
+        #  전체 무효화 횟수. 모든 항목의 버전에 포함됩니다.
+        self._epoch = 0
+        #  무효화는 수신 스레드에서, 조회는 이벤트 루프에서 일어나므로 잠금으로 보호합니다.
+        self._lock = threading.Lock()
+        #  같은 항목을 여러 세션이 동시에 로드하지 않도록 하는 키별 잠금
+        self._load_locks: Dict[CacheKey, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "RefDataCache":
+        return cls(
+            ttl=float(os.getenv("WIMS_REFDATA_TTL", 300)),
+            max_entries=int(os.getenv("WIMS_REFDATA_MAX_ENTRIES", 256)),
+        )
+
+    def register(self, name: str, fn: Callable[..., Any], tables: Sequence[str]):
+        """
+        참조 데이터 로더를 등록합니다.
+
+        Args:
+            name (str): 캐시 이름 (예: "usr.department_options").
+            fn (Callable[..., Any]): `fn(session, *args)` 형태의 조회 함수.
+            tables (Sequence[str]): 값이 의존하는 "스키마.테이블" 목록. 이 테이블이 바뀌면 항목이 무효화됩니다.
+        """
+        self._loaders[name] = _Loader(fn=fn, tables=tuple(tables))
+
+    def _versions(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        return (self._epoch,) + tuple(self._table_versions.get(table, 0) for table in tables)
+
+    def _lookup(self, key: CacheKey, loader: _Loader) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.versions != self._versions(loader.tables) or time.monotonic() - entry.loaded_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    async def get(self, name: str, *args: Hashable) -> Any:
+        """캐시된 값을 반환합니다. 없거나 무효화되었으면 DB에서 한 번만 로드합니다."""
+        loader = self._loaders[name]
+        key: CacheKey = (name, args)
+        if (entry := self._lookup(key, loader)) is not None:
+            self.hits += 1
+            return entry.value
+
+        lock = self._load_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            #  잠금을 기다리는 동안 다른 세션이 로드했을 수 있습니다.
+            if (entry := self._lookup(key, loader)) is not None:
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+            with self._lock:
+                versions = self._versions(loader.tables)
+            value = await db.run(loader.fn, *args)
+            with self._lock:
+                self._entries[key] = _Entry(value=value, versions=versions, loaded_at=time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+
+    def loaded_at(self, name: str, *args: Hashable) -> Optional[float]:
+        """현재 항목이 로드된 시각(time.monotonic). 값이 다시 로드되었는지 판단할 때 사용합니다."""
+        with self._lock:
+            entry = self._entries.get((name, args))
+            return entry.loaded_at if entry is not None else None
+
+    def invalidate_table(self, table: str):
+        """테이블에 의존하는 모든 항목을 무효화합니다."""
+        with self._lock:
+            self._table_versions[table] = self._table_versions.get(table, 0) + 1
+
+    def invalidate_all(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class _NotifyListener(threading.Thread):
+    """동기 DB URL로 별도 연결을 열어 LISTEN하고, 받은 테이블 이름으로 캐시를 무효화하는 데몬 스레드"""
+
+    def __init__(self, cache: RefDataCache):
+        super().__init__(name="wims-refdata-listener", daemon=True)
+        self.cache = cache
+
+    def _connect(self):
+        import psycopg2
+
+        url = db.engine().url
+        connection = psycopg2.connect(**url.translate_connect_args(username="user", database="dbname"))
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        return connection
+
+    def run(self):
+        backoff = 1.0
+        connected_before = False
+        while True:
+            try:
+                connection = self._connect()
+            except ImportError:
+                logger.warning("psycopg2가 없어 참조 데이터 무효화 알림을 받을 수 없습니다. TTL로만 갱신합니다.")
+                return
+            except Exception:  # noqa: BLE001 - 연결 실패 시 TTL에 의존하며 재시도합니다.
+                logger.warning("참조 데이터 알림 연결 실패, %.0f초 후 재시도합니다.", backoff, exc_info=True)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+
+            #  연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 재연결 시 전체를 무효화합니다.
+            if connected_before:
+                self.cache.invalidate_all()
+            connected_before = True
+            backoff = 1.0
+            try:
+                while True:
+                    if select.select([connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        self.cache.invalidate_table(connection.notifies.pop(0).payload)
+            except Exception:  # noqa: BLE001
+                logger.warning("참조 데이터 알림 연결이 끊겼습니다. 다시 연결합니다.", exc_info=True)
+            finally:
+                connection.close()
+
+
+#  프로세스 전역 캐시
+refdata = RefDataCache.from_env()
+
+_listener: Optional[_NotifyListener] = None
+_listener_lock = threading.Lock()
+
+
+def start_listener():
+    """무효화 알림 수신 스레드를 워커 프로세스당 한 번 시작합니다."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = _NotifyListener(refdata)
+            _listener.start()
+
+
+def register(name: str, fn: Callable[..., Any], tables: Sequence[str]):
+    """refdata.register()의 단축 함수"""
+    refdata.register(name, fn, tables)
+
+
+async def get(name: str, *args: Hashable) -> Any:
+    """refdata.get()의 단축 함수. 처음 호출될 때 알림 수신 스레드를 시작합니다."""
+    if _listener is None:
+        start_listener()
+    return await refdata.get(name, *args)
+
+
+def loaded_at(name: str, *args: Hashable) -> Optional[float]:
+    """refdata.loaded_at()의 단축 함수"""
+    return refdata.loaded_at(name, *args)
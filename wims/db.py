@@ -0,0 +1,143 @@
+# /wims_project/wims/db.py
+"""
+이벤트 핸들러에서 사용하는 데이터베이스 접근 진입점입니다.
+
+조회/저장 로직은 동기 Session을 인자로 받는 일반 함수로 작성하고,
+핸들러에서는 `await db.run(함수, 인자...)`로 실행합니다.
+배포 환경마다 아래 두 가지 방식 중 하나를 WIMS_DB_MODE 환경 변수로 선택합니다.
+
+- async (기본값): rxconfig의 async_db_url(asyncpg)로 AsyncSession을 열고
+  AsyncSession.run_sync()로 함수를 실행합니다. I/O 대기 중에는 이벤트 루프가 다른 요청을 처리합니다.
+- sync: db_url(psycopg2)의 동기 Session을 스레드 풀에서 실행합니다.
+  asyncpg를 사용할 수 없는 환경을 위한 대안이며, 이 경우에도 이벤트 루프는 막히지 않습니다.
+
+엔진(연결 풀)은 프로세스마다 동기/비동기 하나씩 처음 사용할 때 만듭니다. 풀 설정(크기, 초과 허용,
+대기 시간 제한, pre-ping, 재생성 주기)은 rxconfig의 db_pool_*, db_max_overflow 값(환경 변수로 지정)을 따릅니다.
+웹 워커를 여러 개 띄우면 DB 연결 수는 (워커 수 x 풀 크기)가 되므로 운영 실행기(wims.serve)가
+워커 수에 맞춰 크기를 나눠 줍니다. 풀 사용 현황은 pool_stats()로 조회합니다. (wims.dbpool)
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import reflex as rx
+from reflex.config import get_config
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from . import metrics
+from .dbpool import InstrumentedAsyncPool, InstrumentedQueuePool, describe
+
+T = TypeVar("T")
+
+DB_MODE_ASYNC = "async"
+DB_MODE_SYNC = "sync"
+
+#  배포별 DB 접근 방식 스위치
+DB_MODE = os.getenv("WIMS_DB_MODE", DB_MODE_ASYNC).lower()
+if DB_MODE not in (DB_MODE_ASYNC, DB_MODE_SYNC):
+    raise ValueError(f"WIMS_DB_MODE는 '{DB_MODE_ASYNC}' 또는 '{DB_MODE_SYNC}'여야 합니다: {DB_MODE!r}")
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_sessions: Optional[async_sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+def _engine_args(url: str, poolclass: type) -> dict:
+    """Reflex의 기본 엔진 설정(echo 등)에 rxconfig의 풀 설정을 더합니다."""
+    config = get_config()
+    return {
+        **rx.model.get_engine_args(url),
+        "poolclass": poolclass,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "pool_recycle": config.db_pool_recycle,
+    }
+
+
+def engine() -> Engine:
+    """rxconfig의 db_url(psycopg2) 엔진. 처음 호출할 때 만듭니다."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                url = get_config().db_url
+                _engine = create_engine(url, **_engine_args(url, InstrumentedQueuePool))
+    return _engine
+
+
+def _async_session_factory() -> async_sessionmaker:
+    global _async_engine, _async_sessions
+    sessions = _async_sessions
+    if sessions is None:
+        with _engine_lock:
+            if _async_sessions is None:
+                url = get_config().async_db_url
+                _async_engine = create_async_engine(url, **_engine_args(url, InstrumentedAsyncPool))
+                _async_sessions = async_sessionmaker(bind=_async_engine, class_=AsyncSession, expire_on_commit=False)
+            sessions = _async_sessions
+    return sessions
+
+
+def async_engine() -> AsyncEngine:
+    """rxconfig의 async_db_url(asyncpg) 엔진. 처음 호출할 때 만듭니다."""
+    return _async_session_factory().kw["bind"]
+
+
+def pool_stats() -> List[Dict[str, object]]:
+    """이 프로세스에서 만든 엔진별 풀 현황과 누적 지표 (연결 대기 시간 히스토그램, 초과 연결/시간 초과 횟수 등)"""
+    with _engine_lock:
+        engines = {"sync": _engine, "async": _async_engine}
+    return describe({name: engine_.pool if engine_ is not None else None for name, engine_ in engines.items()})
+
+
+async def dispose():
+    """열려 있는 연결을 모두 닫습니다. (워커 종료 시)"""
+    global _engine, _async_engine, _async_sessions
+    with _engine_lock:
+        engine_, async_engine_ = _engine, _async_engine
+        _engine = _async_engine = _async_sessions = None
+    if engine_ is not None:
+        engine_.dispose()
+    if async_engine_ is not None:
+        await async_engine_.dispose()
+
+
+def sync_session() -> Session:
+    """
+    동기 Session을 생성합니다.
+    커밋 후에도 반환된 객체의 속성을 읽을 수 있도록 expire_on_commit=False로 엽니다.
+    (async 모드의 세션과 같은 설정)
+    """
+    return Session(engine(), expire_on_commit=False)
+
+
+def _run_sync(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    with sync_session() as session:
+        return fn(session, *args, **kwargs)
+
+
+async def run(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    동기 Session을 첫 번째 인자로 받는 함수를 이벤트 루프를 막지 않고 실행합니다.
+
+    Args:
+        fn (Callable[..., T]): `fn(session, *args, **kwargs)` 형태로 호출될 함수.
+            세션이 닫힌 뒤에도 사용할 수 있도록 필요한 관계는 미리 로드해서 반환해야 합니다.
+
+    Returns:
+        T: fn의 반환값.
+    """
+    #  이벤트 핸들러에서 호출하면 걸린 시간이 핸들러의 DB 시간으로 집계됩니다. (wims.metrics)
+    with metrics.db_timer():
+        if DB_MODE == DB_MODE_ASYNC:
+            async with _async_session_factory()() as session:
+                return await session.run_sync(fn, *args, **kwargs)
+        return await asyncio.to_thread(_run_sync, fn, *args, **kwargs)
@@ -0,0 +1,107 @@
+# /wims_project/wims/dbpool.py
+"""
+DB 연결 풀 계측입니다. wims.db의 엔진은 아래 풀 클래스로 만들어지며, 풀마다 다음 값을 모읍니다.
+
+- 연결을 얻기까지 기다린 시간 히스토그램 (풀에 남은 연결이 있으면 0에 가깝고, 풀이 모자라면 길어짐)
+- 초과 연결(max_overflow 범위에서 pool_size를 넘어 새로 연) 횟수와 pool_timeout 초과로 실패한 횟수
+- 현재/최대 대여 중인 연결 수
+
+적재가 몰리거나 교대 시간에 로그인이 몰릴 때 대기 시간과 초과/시간 초과가 늘면 풀이 모자란 것입니다.
+값은 워커 프로세스마다 따로 모이며 GET /api/ops/db-pool(wims.ops)로 조회합니다. (/api/ops/metrics에도 포함)
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import Histogram
+
+#  대기 시간 히스토그램 구간 상한(초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolStats:
+    """풀 하나의 누적 지표"""
+
+    def __init__(self):
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.checkouts = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self._lock = threading.Lock()
+
+    def checked_out(self, waited: float, checked_out: int, overflowed: bool):
+        self.wait.observe(waited)
+        with self._lock:
+            self.checkouts += 1
+            self.overflow_events += overflowed
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def timed_out(self, waited: float):
+        self.wait.observe(waited)
+        with self._lock:
+            self.timeouts += 1
+
+
+class _InstrumentedPool:
+    """QueuePool 계열에 섞어 쓰는 계측. 연결을 꺼낼 때마다(_do_get) 대기 시간과 초과 연결 여부를 기록합니다."""
+
+    stats: PoolStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        overflow = self.overflow()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timed_out(time.perf_counter() - started)
+            raise
+        #  pool_size를 넘은 상태에서 새 연결을 열었으면 초과 연결입니다. (동시 대여 시 근사값)
+        self.stats.checked_out(
+            time.perf_counter() - started, self.checkedout(), self.overflow() > max(overflow, 0),
+        )
+        return connection
+
+    def recreate(self):
+        #  dispose() 후 다시 만들어진 풀도 같은 누적 지표를 이어 씁니다.
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def describe(self) -> Dict[str, object]:
+        """현재 상태와 누적 지표"""
+        stats = self.stats
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "peak_checked_out": stats.peak_checked_out,
+            "checkouts": stats.checkouts,
+            "overflow_events": stats.overflow_events,
+            "timeouts": stats.timeouts,
+            "wait_seconds": stats.wait.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    """동기 엔진(psycopg2)용"""
+
+
+class InstrumentedAsyncPool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    """비동기 엔진(asyncpg)용"""
+
+
+def describe(pools: Dict[str, Optional[_InstrumentedPool]]) -> List[Dict[str, object]]:
+    """이름 -> 풀 목록을 조회용 목록으로 바꿉니다. 아직 만들지 않은 엔진(None)은 건너뜁니다."""
+    return [{"engine": name, **pool.describe()} for name, pool in pools.items() if pool is not None]
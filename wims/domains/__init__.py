@@ -0,0 +1,141 @@
+# /wims_project/wims/domains/__init__.py
+"""
+도메인 레지스트리입니다.
+
+각 도메인 패키지는 자신의 __init__.py에 DOMAIN = Domain(...)으로 모델/상태/페이지/메뉴/라우터/작업 모듈을
+'모듈 경로' 문자열로만 선언합니다. 패키지 __init__.py는 이 모듈 외에는 아무것도 import하지 않으므로
+선언을 읽는 것만으로는 도메인 코드가 로드되지 않고, 각 진입점이 필요한 부분만 불러옵니다.
+
+- 마이그레이션(alembic)/스크립트: load_models()로 모델 모듈만 불러옵니다.
+- 작업 워커: job_modules()의 작업 모듈만 불러옵니다. (페이지/상태 없음)
+- 웹 앱(wims.py): 메뉴와 상태, 라우터는 시작할 때 불러오고, 페이지는 add_pages()가 LazyPage로 등록해
+  Reflex가 페이지를 평가(컴파일)할 때 처음 import하고 만듭니다.
+  (상태 클래스는 이벤트 처리에 필요하므로 백엔드 시작 시 모두 등록되어야 합니다.)
+
+새 도메인은 패키지에 DOMAIN을 선언하고 DOMAIN_PACKAGES에 추가합니다.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+#  등록된 도메인 패키지 (메뉴/페이지 등록 순서)
+DOMAIN_PACKAGES = [
+    "wims.domains.usr",
+    "wims.domains.msr",
+    "wims.domains.dash",
+    "wims.domains.lims",
+    "wims.domains.inv",
+]
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    도메인 페이지 선언.
+
+    Attributes:
+        route (str): 페이지 경로.
+        component (str): 페이지 내용을 만드는 함수. "모듈:함수" 형식이며 공통 템플릿으로 감싸 등록합니다.
+        on_load (str): 로드 이벤트 핸들러. "모듈:클래스.메서드" 형식이며 비워 두면 공통 가드(BaseState.guard_page).
+    """
+    route: str
+    component: str
+    on_load: str = ""
+
+
+@dataclass(frozen=True)
+class Domain:
+    """도메인 하나가 제공하는 모듈 선언. 모듈 경로는 모두 문자열이며 필요할 때 import합니다."""
+    name: str
+    models: Tuple[str, ...] = ()
+    #  사이드바 메뉴와 경로 권한을 등록하는 모듈 (import 시 register_menu 호출)
+    menus: Tuple[str, ...] = ()
+    #  rx.State 하위 클래스를 정의하는 모듈
+    states: Tuple[str, ...] = ()
+    pages: Tuple[Page, ...] = ()
+    #  FastAPI 라우터. "모듈:속성" 형식
+    routers: Tuple[str, ...] = ()
+    #  @task/@periodic을 등록하는 모듈 (작업 워커가 import)
+    jobs: Tuple[str, ...] = ()
+    #  @kpi_source를 등록하는 모듈 (대시보드 지표 갱신이 import)
+    kpis: Tuple[str, ...] = ()
+
+
+def resolve(path: str) -> Any:
+    """'모듈:이름[.속성...]' 형식의 경로를 import해 객체를 반환합니다."""
+    module_name, _, attribute = path.partition(":")
+    target = importlib.import_module(module_name)
+    for name in attribute.split(".") if attribute else ():
+        target = getattr(target, name)
+    return target
+
+
+def domains() -> List[Domain]:
+    """등록된 도메인 선언 목록. 패키지 __init__.py만 import합니다."""
+    return [importlib.import_module(package).DOMAIN for package in DOMAIN_PACKAGES]
+
+
+def _import_all(modules: List[str]):
+    for module in modules:
+        importlib.import_module(module)
+
+
+def load_models():
+    """모든 도메인의 모델 모듈을 import해 rx.Model.metadata에 테이블을 등록합니다."""
+    _import_all([module for domain in domains() for module in domain.models])
+
+
+def load_menus():
+    """모든 도메인의 사이드바 메뉴와 경로 권한을 등록합니다."""
+    _import_all([module for domain in domains() for module in domain.menus])
+
+
+def load_states():
+    """모든 도메인의 상태 클래스를 등록합니다."""
+    _import_all([module for domain in domains() for module in domain.states])
+
+
+def routers() -> list:
+    """모든 도메인의 FastAPI 라우터"""
+    return [resolve(path) for domain in domains() for path in domain.routers]
+
+
+def job_modules() -> List[str]:
+    return [module for domain in domains() for module in domain.jobs]
+
+
+def kpi_modules() -> List[str]:
+    return [module for domain in domains() for module in domain.kpis]
+
+
+class LazyPage:
+    """
+    add_page()에 넘기는 페이지 함수. Reflex가 페이지를 평가할 때 처음 호출되며,
+    그때 페이지 모듈을 import하고 내용을 wrap(예: 공통 템플릿)으로 감쌉니다.
+    (프런트엔드 컴파일 시 다른 프로세스로 넘길 수 있도록 클로저 대신 클래스로 둡니다.)
+    """
+
+    def __init__(self, component: str, wrap: Optional[Callable[..., Any]] = None):
+        self.component = component
+        self.wrap = wrap
+        self.__name__ = component.rpartition(":")[2].rpartition(".")[2]
+
+    def __call__(self):
+        content = resolve(self.component)()
+        return self.wrap(page_content=content) if self.wrap is not None else content
+
+
+def add_pages(app, wrap: Callable[..., Any], default_on_load):
+    """
+    모든 도메인의 페이지를 앱에 등록합니다. 페이지 내용은 평가될 때까지 만들지 않습니다.
+
+    Args:
+        app (rx.App): 페이지를 등록할 앱.
+        wrap: 페이지 내용을 감쌀 템플릿. page_content 키워드 인자를 받습니다.
+        default_on_load: on_load를 선언하지 않은 페이지의 로드 핸들러.
+    """
+    for domain in domains():
+        for page in domain.pages:
+            on_load = resolve(page.on_load) if page.on_load else default_on_load
+            app.add_page(LazyPage(page.component, wrap), route=page.route, on_load=on_load)
@@ -0,0 +1,20 @@
+# /wims_project/wims/domains/dash/__init__.py
+"""'dash'(대시보드) 도메인 선언입니다. (wims.domains 레지스트리 참고)"""
+
+from .. import Domain, Page
+
+#  로그인 후 이동하는 경로. 메뉴와 경로 권한은 wims.navigation에서 공통 항목으로 등록합니다.
+DASHBOARD_ROUTE = "/dashboard"
+
+DOMAIN = Domain(
+    name="dash",
+    models=("wims.domains.dash.models",),
+    states=("wims.domains.dash.state",),
+    pages=(
+        Page(
+            DASHBOARD_ROUTE, "wims.domains.dash.pages:dashboard_page",
+            on_load="wims.domains.dash.state:DashboardState.load_dashboard",
+        ),
+    ),
+    jobs=("wims.domains.dash.jobs",),
+)
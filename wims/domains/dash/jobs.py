@@ -0,0 +1,18 @@
+# /wims_project/wims/domains/dash/jobs.py
+"""
+'dash' 도메인의 주기 작업입니다. 작업 큐 워커(python -m wims.tasks.worker)에서 실행됩니다.
+"""
+
+from datetime import datetime, timezone
+
+from ... import db
+from ...tasks.scheduler import periodic
+from .kpis import refresh
+
+
+#  다음 실행이 곧 다시 계산하므로 재시도하지 않고, 밀린 실행도 따라잡지 않습니다.
+@periodic("* * * * *", name="dash.refresh_kpis", misfire_grace=0, max_attempts=1, timeout=120)
+def refresh_kpis(payload: dict) -> dict:
+    """대시보드 지표 스냅샷을 다시 계산해 바뀐 값만 반영합니다. (kpis.refresh)"""
+    with db.sync_session() as session:
+        return refresh(session, datetime.now(timezone.utc))
@@ -0,0 +1,142 @@
+# /wims_project/wims/domains/dash/kpis.py
+"""
+대시보드 지표(KPI) 출처 레지스트리와 스냅샷 갱신, 캐시 조회입니다.
+
+- 각 도메인은 자신의 kpis.py에서 @kpi_source(이름)으로 `fn(session, now) -> List[KpiValue]`를 등록합니다.
+  출처 모듈은 도메인 선언(DOMAIN.kpis)에 적어 두며 refresh()가 처음 실행될 때 import합니다.
+  (작업 워커의 TASK_MODULES와 같은 방식)
+- refresh()는 모든 출처의 값을 계산해 현재 스냅샷과 비교하고, 바뀐 행만 INSERT ... ON CONFLICT로 갱신하며
+  사라진 키는 삭제합니다. 한 출처가 실패하면 그 출처의 기존 값은 그대로 둡니다.
+- dash.kpi_snapshots의 트리거가 커밋 시 알림을 보내 모든 워커의 캐시 항목이 무효화되고,
+  대시보드는 다음 조회 때 스냅샷을 한 번 다시 읽습니다. 바뀐 값이 없으면 알림도 없습니다.
+- 대시보드 로드는 캐시 조회(get_snapshot)만 하므로 방문자 수와 관계없이 집계 쿼리를 실행하지 않습니다.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, func, select
+
+from ... import cache
+from .. import kpi_modules
+from .models import KpiSnapshot, KpiStatus
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT = "dash.kpi_snapshot"
+
+
+@dataclass(frozen=True)
+class KpiValue:
+    """출처가 계산한 지표 하나. key는 '<출처 이름>.'으로 시작해야 합니다."""
+    site_id: int
+    key: str
+    section: str
+    label: str
+    value: Optional[float]
+    unit: str = ""
+    status: str = KpiStatus.OK
+    sort_order: int = 0
+    observed_at: Optional[datetime] = None
+
+
+KpiSourceFn = Callable[[Session, datetime], List[KpiValue]]
+
+_sources: Dict[str, KpiSourceFn] = {}
+_sources_loaded = False
+_sources_lock = threading.Lock()
+
+#  스냅샷 행과 비교/갱신하는 열
+_VALUE_FIELDS = tuple(f.name for f in fields(KpiValue) if f.name not in ("site_id", "key"))
+
+
+def kpi_source(name: str):
+    """지표 출처 함수를 등록하는 데코레이터. name은 지표 키의 앞부분이 됩니다."""
+    def decorator(fn: KpiSourceFn) -> KpiSourceFn:
+        if name in _sources and _sources[name] is not fn:
+            raise ValueError(f"이미 등록된 지표 출처입니다: {name}")
+        _sources[name] = fn
+        return fn
+    return decorator
+
+
+def _load_sources():
+    global _sources_loaded
+    with _sources_lock:
+        if not _sources_loaded:
+            for module in kpi_modules():
+                importlib.import_module(module)
+            _sources_loaded = True
+
+
+def _changed(row: KpiSnapshot, value: KpiValue) -> bool:
+    return any(getattr(row, name) != getattr(value, name) for name in _VALUE_FIELDS)
+
+
+def refresh(session: Session, now: datetime) -> Dict[str, object]:
+    """
+    모든 출처의 지표를 계산해 스냅샷에 반영하고 커밋합니다.
+
+    Returns:
+        dict: 갱신/삭제한 행 수와 실패한 출처 이름 목록.
+    """
+    _load_sources()
+    current = {(row.site_id, row.key): row for row in session.exec(select(KpiSnapshot)).all()}
+
+    computed: Dict[Tuple[int, str], KpiValue] = {}
+    failed: List[str] = []
+    for name, fn in sorted(_sources.items()):
+        try:
+            #  실패한 출처의 쿼리가 트랜잭션 전체를 중단시키지 않도록 savepoint 안에서 실행합니다.
+            with session.begin_nested():
+                values = fn(session, now)
+        except Exception:  # noqa: BLE001 - 한 출처의 실패가 다른 지표 갱신을 막지 않도록 합니다.
+            logger.exception("지표 출처 %s 계산에 실패했습니다. 이전 값을 유지합니다.", name)
+            failed.append(name)
+            continue
+        for value in values:
+            if not value.key.startswith(f"{name}."):
+                raise ValueError(f"지표 키는 '{name}.'으로 시작해야 합니다: {value.key}")
+            computed[(value.site_id, value.key)] = value
+
+    changed = [value for key, value in computed.items() if key not in current or _changed(current[key], value)]
+    removed = [
+        key for key in current
+        if key not in computed and not any(key[1].startswith(f"{name}.") for name in failed)
+    ]
+    if changed:
+        insert = pg_insert(KpiSnapshot).values([
+            {"site_id": value.site_id, "key": value.key, **{name: getattr(value, name) for name in _VALUE_FIELDS}}
+            for value in changed
+        ])
+        session.execute(insert.on_conflict_do_update(
+            index_elements=["site_id", "key"],
+            set_={**{name: insert.excluded[name] for name in _VALUE_FIELDS}, "updated_at": func.now()},
+        ))
+    if removed:
+        session.execute(delete(KpiSnapshot).where(tuple_(KpiSnapshot.site_id, KpiSnapshot.key).in_(removed)))
+    session.commit()
+    return {"changed": len(changed), "removed": len(removed), "failed": failed}
+
+
+def fetch_snapshot(session: Session) -> Dict[int, Tuple[KpiSnapshot, ...]]:
+    """처리시설 ID -> 지표 목록 (정렬 순서순)"""
+    statement = select(KpiSnapshot).order_by(KpiSnapshot.site_id, KpiSnapshot.sort_order, KpiSnapshot.key)
+    by_site: Dict[int, List[KpiSnapshot]] = {}
+    for row in session.exec(statement).all():
+        by_site.setdefault(row.site_id, []).append(row)
+    return {site_id: tuple(rows) for site_id, rows in by_site.items()}
+
+
+cache.register(SNAPSHOT, fetch_snapshot, tables=["dash.kpi_snapshots"])
+
+
+async def get_snapshot() -> Dict[int, Tuple[KpiSnapshot, ...]]:
+    """캐시된 지표 스냅샷을 반환합니다. (수정하지 말 것)"""
+    return await cache.get(SNAPSHOT)
@@ -0,0 +1,48 @@
+# /wims_project/wims/domains/dash/models.py
+"""
+'dash'(대시보드) 도메인의 데이터베이스 ORM 모델을 정의하는 모듈입니다.
+여러 도메인의 지표를 미리 계산해 둔 스냅샷(KpiSnapshot)을 다룹니다.
+"""
+
+from typing import Optional
+from datetime import datetime, timezone
+
+from sqlmodel import Column, Field, Float, TIMESTAMP, func
+
+import reflex as rx
+
+
+class KpiStatus:
+    """지표 상태 (DB에는 문자열로 저장)"""
+    OK = "ok"          # 정상
+    WARN = "warn"      # 주의 (품질 의심, 기준 초과 등)
+    STALE = "stale"    # 값이 오래됨 (수집 지연)
+    BAD = "bad"        # 이상 (센서/통신 불량 등)
+
+
+class KpiSnapshot(rx.Model, table=True):
+    """
+    PostgreSQL의 dash.kpi_snapshots 테이블에 매핑되는 모델.
+    주기 작업(dash.refresh_kpis)이 처리시설별 지표를 계산해 바뀐 행만 갱신하며,
+    대시보드는 이 테이블 전체를 프로세스 캐시에 올려 두고 읽습니다.
+    key는 '<지표 출처>.<항목>' 형식입니다. (예: msr.latest.12)
+    """
+    __tablename__ = "kpi_snapshots"  # type: ignore
+    __table_args__ = {'schema': 'dash'}
+
+    site_id: int = Field(primary_key=True, description="처리시설 ID")
+    key: str = Field(primary_key=True, max_length=64, description="지표 키")
+    section: str = Field(max_length=32, description="표시 묶음 (예: 현재값, 오늘 평균)")
+    label: str = Field(max_length=100, description="지표 이름")
+    value: Optional[float] = Field(default=None, sa_column=Column(Float(53)), description="값")
+    unit: str = Field(default="", max_length=16, description="단위")
+    status: str = Field(default=KpiStatus.OK, max_length=8, description="상태 (KpiStatus)")
+    sort_order: int = Field(default=0, description="처리시설 안 표시 순서. 같은 묶음의 지표는 연속된 값을 씁니다.")
+    observed_at: Optional[datetime] = Field(
+        default=None, sa_type=TIMESTAMP(timezone=True), description="값의 기준 시각 (측정 시각 등)"
+    )
+    updated_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()),
+        description="레코드 마지막 업데이트 일시"
+    )
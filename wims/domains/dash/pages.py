@@ -0,0 +1,94 @@
+# /wims_project/wims/domains/dash/pages.py
+"""대시보드 페이지의 UI 컴포넌트를 정의합니다."""
+
+import reflex as rx
+
+from .models import KpiStatus
+from .state import DashboardState, KpiItem, KpiSection, SiteCard
+
+
+def status_badge(status) -> rx.Component:
+    """지표 상태 배지"""
+    return rx.match(
+        status,
+        (KpiStatus.OK, rx.badge("정상", color_scheme="jade", variant="soft")),
+        (KpiStatus.WARN, rx.badge("주의", color_scheme="amber", variant="soft")),
+        (KpiStatus.STALE, rx.badge("지연", color_scheme="gray", variant="soft")),
+        (KpiStatus.BAD, rx.badge("이상", color_scheme="ruby", variant="soft")),
+        rx.fragment(),
+    )
+
+
+def kpi_row(item: KpiItem) -> rx.Component:
+    #  실시간 값을 받은 지표는 스냅샷 값 대신 DashboardState.live_values의 [값, 측정 시각, 상태]를 표시합니다.
+    has_live = DashboardState.live_values.contains(item.live_key)
+    live_point = DashboardState.live_values[item.live_key]
+    return rx.table.row(
+        rx.table.cell(item.label),
+        rx.table.cell(
+            rx.text(rx.cond(has_live, live_point[0], item.value), " ", item.unit, white_space="nowrap"),
+            text_align="right",
+        ),
+        rx.table.cell(rx.text(
+            rx.cond(has_live, live_point[1], item.observed_at), color_scheme="gray", size="1", white_space="nowrap",
+        )),
+        rx.table.cell(status_badge(rx.cond(has_live, live_point[2], item.status))),
+    )
+
+
+def kpi_section(section: KpiSection) -> rx.Component:
+    return rx.vstack(
+        rx.text(section.name, weight="bold", size="2", color_scheme="gray"),
+        rx.table.root(
+            rx.table.body(rx.foreach(section.kpis, kpi_row)),
+            size="1",
+            width="100%",
+        ),
+        spacing="1",
+        width="100%",
+    )
+
+
+def site_card(card: SiteCard) -> rx.Component:
+    return rx.card(
+        rx.vstack(
+            rx.heading(card.name, size="4"),
+            rx.cond(
+                card.sections.length() > 0,
+                rx.foreach(card.sections, kpi_section),
+                rx.text("집계된 지표가 없습니다.", color_scheme="gray", size="2"),
+            ),
+            spacing="3",
+            width="100%",
+        ),
+        width="100%",
+    )
+
+
+def dashboard_page() -> rx.Component:
+    """대시보드 페이지의 메인 컨텐츠입니다. 처리시설별 지표 카드를 표시합니다."""
+    return rx.vstack(
+        rx.hstack(
+            rx.heading("대시보드", size="7"),
+            rx.spacer(),
+            rx.icon_button(rx.icon(tag="rotate-cw"), on_click=DashboardState.load_dashboard, variant="ghost", size="3", title="새로고침"),
+            align="center",
+            width="100%",
+        ),
+        rx.cond(
+            DashboardState.site_cards.length() > 0,
+            rx.grid(
+                rx.foreach(DashboardState.site_cards, site_card),
+                columns=rx.breakpoints(initial="1", md="2", xl="3"),
+                spacing="4",
+                width="100%",
+            ),
+            rx.cond(
+                DashboardState.loaded,
+                rx.callout("볼 수 있는 처리시설이 없습니다. 소속 부서의 관할 처리시설을 확인하세요.", icon="info"),
+                rx.spinner(),
+            ),
+        ),
+        spacing="5",
+        width="100%",
+    )
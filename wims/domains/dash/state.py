@@ -0,0 +1,194 @@
+# /wims_project/wims/domains/dash/state.py
+"""
+대시보드 페이지의 상태입니다.
+
+표시 값은 모두 프로세스 캐시(지표 스냅샷, 처리시설 목록, 부서 목록)에서 가져오므로
+캐시가 유효하면 페이지 로드와 주기 갱신 모두 DB 쿼리를 실행하지 않습니다.
+관리자는 모든 처리시설을, 그 외 사용자는 소속 부서의 site_list에 있는 처리시설만 봅니다.
+
+현재값 지표는 화면에 보이는 태그만 실시간 허브(wims.live)에 구독해 갱신합니다.
+세션마다 백그라운드 작업 하나가 실시간 프레임(초당 최대 WIMS_LIVE_MAX_FPS번, 바뀐 태그만)과
+캐시 확인을 함께 처리하므로, 적재 빈도와 관계없이 세션당 상태 갱신 횟수에 상한이 있습니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import reflex as rx
+
+from ... import cache, live
+from ...navigation import DASHBOARD_ROUTE
+from ...state.base import BaseState, Principal
+from ..msr.kpis import LATEST_KEY_PREFIX, QUALITY_STATUS
+from ..msr.refdata import SITES, get_sites
+from ..msr.rollups import LOCAL_TZ
+from ..usr.models import Department, UserRole
+from ..usr.refdata import DEPARTMENTS, get_departments
+from .kpis import SNAPSHOT, get_snapshot
+from .models import KpiSnapshot, KpiStatus
+
+#  화면을 열어 둔 동안 캐시를 다시 확인하는 간격과, 확인/실시간 갱신을 계속하는 최대 시간(초)
+DASHBOARD_POLL_INTERVAL = 30
+DASHBOARD_WATCH_TIMEOUT = 3600
+
+
+class KpiItem(rx.Base):
+    label: str
+    value: str
+    unit: str
+    status: str
+    observed_at: str
+    #  실시간 값으로 갱신하는 지표이면 태그 ID 문자열 (DashboardState.live_values의 키), 아니면 ""
+    live_key: str = ""
+
+
+class KpiSection(rx.Base):
+    name: str
+    kpis: List[KpiItem]
+
+
+class SiteCard(rx.Base):
+    site_id: int
+    name: str
+    sections: List[KpiSection]
+
+
+def visible_site_ids(principal: Principal, departments: Sequence[Department]) -> Optional[Set[int]]:
+    """사용자가 볼 수 있는 처리시설 ID 집합. None이면 전체입니다."""
+    if principal.role == UserRole.ADMIN:
+        return None
+    for department in departments:
+        if department.id == principal.department_id:
+            return set(department.site_list or [])
+    return set()
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value:,.2f}".rstrip("0").rstrip(".")
+
+
+def _format_time(moment: Optional[datetime]) -> str:
+    return moment.astimezone(LOCAL_TZ).strftime("%m-%d %H:%M") if moment else ""
+
+
+def _live_key(row: KpiSnapshot) -> str:
+    return row.key[len(LATEST_KEY_PREFIX):] if row.key.startswith(LATEST_KEY_PREFIX) else ""
+
+
+def format_live(point: live.Point) -> List[str]:
+    """실시간 값 하나를 [값, 측정 시각, 상태] 표시 문자열로 바꿉니다."""
+    ts, value, quality = point
+    moment = datetime.fromtimestamp(ts / 1_000_000, timezone.utc)
+    return [_format_value(value), _format_time(moment), QUALITY_STATUS.get(quality, KpiStatus.WARN)]
+
+
+def build_cards(
+    snapshot: Dict[int, Tuple[KpiSnapshot, ...]], site_names: Dict[int, str], allowed: Optional[Set[int]],
+) -> List[SiteCard]:
+    """처리시설 순서대로 지표를 묶음별 카드로 만듭니다. (스냅샷은 묶음별로 정렬되어 있음)"""
+    cards = []
+    for site_id, name in site_names.items():
+        if allowed is not None and site_id not in allowed:
+            continue
+        sections: List[KpiSection] = []
+        for row in snapshot.get(site_id, ()):
+            if not sections or sections[-1].name != row.section:
+                sections.append(KpiSection(name=row.section, kpis=[]))
+            sections[-1].kpis.append(KpiItem(
+                label=row.label, value=_format_value(row.value), unit=row.unit,
+                status=row.status, observed_at=_format_time(row.observed_at), live_key=_live_key(row),
+            ))
+        cards.append(SiteCard(site_id=site_id, name=name, sections=sections))
+    return cards
+
+
+async def _cached_inputs():
+    """(지표 스냅샷, 처리시설 목록, 부서 목록). 캐시가 유효하면 쿼리 없음"""
+    return await asyncio.gather(get_snapshot(), get_sites(), get_departments())
+
+
+class DashboardState(BaseState):
+    """대시보드 페이지의 상태와 이벤트 핸들러"""
+
+    site_cards: List[SiteCard] = []
+    loaded: bool = False
+    #  태그 ID 문자열 -> [값, 측정 시각, 상태]. 화면에 보이는 현재값 지표 중 실시간 값을 받은 것만 담습니다.
+    live_values: Dict[str, List[str]] = {}
+
+    # --- 백엔드 전용 변수 ---
+    # 마지막으로 화면을 만든 캐시 항목의 로드 시각. 다시 로드되지 않았으면 카드를 다시 만들지 않습니다.
+    _built_from: tuple = ()
+    # 화면에 보이는 현재값 지표의 태그 ID (실시간 구독 대상)
+    _live_tags: Set[int] = set()
+    # 주기 갱신 작업 식별 번호. 페이지를 다시 열면 이전 작업은 끝납니다.
+    _watch_token: int = 0
+
+    def _apply(self, snapshot, sites, departments) -> bool:
+        """캐시 값으로 카드를 만듭니다. 마지막으로 만든 뒤 바뀐 것이 없으면 False."""
+        built_from = tuple(cache.loaded_at(name) for name in (SNAPSHOT, SITES, DEPARTMENTS)) + (self.logged_in_user,)
+        if built_from == self._built_from:
+            return False
+        allowed = visible_site_ids(self.logged_in_user, departments)
+        self.site_cards = build_cards(snapshot, {site.id: site.name for site in sites}, allowed)
+        self._live_tags = {
+            int(item.live_key) for card in self.site_cards for section in card.sections
+            for item in section.kpis if item.live_key
+        }
+        if any(int(key) not in self._live_tags for key in self.live_values):
+            self.live_values = {key: value for key, value in self.live_values.items() if int(key) in self._live_tags}
+        self._built_from = built_from
+        self.loaded = True
+        return True
+
+    def _apply_live(self, frame: Dict[int, live.Point]):
+        """실시간 프레임(바뀐 태그만)을 반영합니다. 상태 변경은 프레임당 한 번입니다."""
+        self.live_values = {**self.live_values, **{str(tag_id): format_live(point) for tag_id, point in frame.items()}}
+
+    async def load_dashboard(self):
+        """페이지 로드: 캐시에서 카드를 만들고 화면을 열어 둔 동안 실시간 값과 지표를 갱신합니다."""
+        if (denied := self._deny_access(DASHBOARD_ROUTE)) is not None:
+            return denied
+        self._built_from = ()
+        self.live_values = {}
+        self._apply(*await _cached_inputs())
+        self._watch_token += 1
+        return DashboardState.watch_dashboard
+
+    @rx.event(background=True)
+    async def watch_dashboard(self):
+        """
+        대시보드를 보는 동안 실시간 프레임을 반영하고 DASHBOARD_POLL_INTERVAL마다 캐시를 확인합니다.
+        (상태 잠금은 반영할 때만 잡음)
+        """
+        async with self:
+            token = self._watch_token
+            tags = set(self._live_tags)
+        subscription = live.subscribe(tags)
+        deadline = time.monotonic() + DASHBOARD_WATCH_TIMEOUT
+        next_poll = time.monotonic() + DASHBOARD_POLL_INTERVAL
+        try:
+            while time.monotonic() < deadline:
+                frame = await subscription.next_frame(timeout=max(next_poll - time.monotonic(), 0.0))
+                inputs = None
+                if time.monotonic() >= next_poll:
+                    inputs = await _cached_inputs()
+                    next_poll = time.monotonic() + DASHBOARD_POLL_INTERVAL
+                if not frame and inputs is None:
+                    continue
+                async with self:
+                    if (
+                        self._watch_token != token
+                        or self.logged_in_user is None
+                        or self.router.url.path.rstrip("/") != DASHBOARD_ROUTE
+                    ):
+                        return
+                    if inputs is not None and self._apply(*inputs) and self._live_tags != subscription.tags:
+                        subscription.update(self._live_tags)
+                    if frame:
+                        self._apply_live({tag_id: point for tag_id, point in frame.items() if tag_id in self._live_tags})
+        finally:
+            subscription.close()
@@ -0,0 +1,9 @@
+# /wims_project/wims/domains/inv/__init__.py
+"""'inv'(자재 관리) 도메인 선언입니다. (wims.domains 레지스트리 참고)"""
+
+from .. import Domain
+
+DOMAIN = Domain(
+    name="inv",
+    menus=("wims.domains.inv.menu",),
+)
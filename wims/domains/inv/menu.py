@@ -0,0 +1,14 @@
+# /wims_project/wims/domains/inv/menu.py
+"""'inv'(자재 관리) 도메인의 사이드바 메뉴를 등록합니다."""
+
+from ...navigation import register_menu
+from ..usr.models import UserRole
+
+register_menu(
+    icon="package-2", name="자재 관리 (INV)",
+    roles=[UserRole.ADMIN, UserRole.INVENTORY_MANAGER],
+    sub_items=[
+        {"text": "자재 목록", "url": "/inv/materials", "roles": [UserRole.ADMIN, UserRole.INVENTORY_MANAGER]},
+    ],
+    order=30,
+)
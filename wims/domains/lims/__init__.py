@@ -0,0 +1,9 @@
+# /wims_project/wims/domains/lims/__init__.py
+"""'lims'(실험 관리) 도메인 선언입니다. (wims.domains 레지스트리 참고)"""
+
+from .. import Domain
+
+DOMAIN = Domain(
+    name="lims",
+    menus=("wims.domains.lims.menu",),
+)
@@ -0,0 +1,15 @@
+# /wims_project/wims/domains/lims/menu.py
+"""'lims'(실험 관리) 도메인의 사이드바 메뉴를 등록합니다."""
+
+from ...navigation import register_menu
+from ..usr.models import UserRole
+
+register_menu(
+    icon="flask-conical", name="실험 관리 (LIMS)",
+    roles=[UserRole.ADMIN, UserRole.LAB_MANAGER, UserRole.LAB_ANALYST],
+    sub_items=[
+        {"text": "실험 의뢰", "url": "/lims/requests", "roles": [UserRole.ADMIN, UserRole.LAB_MANAGER]},
+        {"text": "분석 결과", "url": "/lims/results", "roles": [UserRole.ADMIN, UserRole.LAB_ANALYST]},
+    ],
+    order=20,
+)
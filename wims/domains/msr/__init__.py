@@ -0,0 +1,12 @@
+# /wims_project/wims/domains/msr/__init__.py
+"""'msr'(측정값) 도메인 선언입니다. (wims.domains 레지스트리 참고)"""
+
+from .. import Domain
+
+DOMAIN = Domain(
+    name="msr",
+    models=("wims.domains.msr.models",),
+    routers=("wims.domains.msr.ingest:router",),
+    jobs=("wims.domains.msr.jobs",),
+    kpis=("wims.domains.msr.kpis",),
+)
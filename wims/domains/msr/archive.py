@@ -0,0 +1,475 @@
+# /wims_project/wims/domains/msr/archive.py
+"""
+지난 달 측정값 파티션을 Postgres에서 Parquet 보관소(로컬 디스크)로 옮기고, 보관된 값을 함께 조회합니다.
+
+보관 (archive_month, 주기 작업 msr.archive_partitions)
+    1. 파티션을 SHARE 잠금으로 막아 보관 중 적재를 막고(조회는 가능),
+       `COPY (SELECT ...) TO STDOUT (FORMAT binary)`로 내보낸 고정 길이 행을 numpy로 바로 해석합니다.
+    2. 처리시설별로 zstd 압축 Parquet 파일에 씁니다.
+       경로: {ARCHIVE_DIR}/site_id=<ID>/month=<YYYY-MM>/part-<보관 순번>-<파티션 OID>.parquet  (Hive 형식 분할)
+       파일 안의 행은 (tag_id, ts) 순이므로 row group 통계로 태그/구간 밖의 블록을 건너뜁니다.
+       보관 순번은 (처리시설, 월) 디렉터리 안에서 보관할 때마다 1씩 늘어납니다. 같은 파티션을 중단 후 다시
+       보관하면 이전 파일의 순번을 그대로 써서 같은 파일을 덮어씁니다.
+    3. 파일을 fsync + rename으로 확정하고 msr.archived_months에 기록한 뒤 커밋합니다. 이때부터 조회는
+       보관 파일과 (아직 남은) 파티션을 합쳐 읽습니다. DB 작업이 실패하면 쓴 파일을 지웁니다.
+    4. `DETACH PARTITION ... CONCURRENTLY`(트랜잭션 밖)로 파티션을 떼어 냅니다. 부모 테이블에는
+       SHARE UPDATE EXCLUSIVE 잠금만 잡으므로 다른 월의 적재와 조회를 막지 않습니다.
+    5. 떼어 낸 테이블을 삭제합니다. 3~4 사이에 들어온 값이 있으면 떼어 낸 테이블을 다시 내보내 파일을
+       바꾼 뒤 삭제합니다. 4~5가 중단되어 남은 테이블(분리 대기 또는 분리된 테이블)은 다음 실행 때 마저 처리합니다.
+    분/시/일 집계(rollups)는 Postgres에 그대로 남으므로 긴 구간의 추세 차트는 보관 여부와 관계없이 집계를 읽습니다.
+
+조회 (tags_series_merged)
+    Postgres(hot) 값과, archived_months에 기록된 (처리시설, 월)의 Parquet(cold) 값을 합쳐 돌려줍니다.
+    Parquet 파일은 메모리 맵으로 열고 필요한 열과 row group만 읽습니다.
+    보관 후 늦게 도착한 값은 파티션이 다시 만들어져 Postgres에 쌓이고, 다음 보관 때 새 순번의 파일로 추가됩니다.
+    같은 (tag_id, ts)가 여러 곳에 있으면 Postgres 값을, 보관 파일끼리는 순번이 큰(나중에 보관한) 파일의 값을
+    사용합니다. 따라서 dedupe로 덮어쓴 값은 보관 전에도 후에도 이전 보관 값보다 우선합니다.
+    archived_months.rows는 이전 파일에 없던 (tag_id, ts)만 셉니다.
+    보관소에 이미 있는 값을 dedupe 없이 다시 보내면 적재가 거부됩니다. (archived_duplicates, 집계 이중 합산 방지)
+    보관된 월의 집계 재계산(rollups.rebuild)은 보관 값과 합친 원시 값으로 합니다.
+
+ARCHIVE_DIR은 보관 작업(워커)과 조회(웹 서버)를 실행하는 모든 노드에서 같은 경로로 보여야 합니다.
+
+환경 변수:
+    WIMS_MSR_ARCHIVE_DIR: 보관소 경로 (기본값: ./archive/msr)
+    WIMS_MSR_HOT_MONTHS: Postgres에 남기는 개월 수, 이번 달 포함 (기본값: 3)
+"""
+
+import glob
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, func, select
+
+from ... import db
+from .models import ArchivedMonth, Tag
+from .partitions import (
+    PARENT_TABLE, SCHEMA, Month, existing_partitions, forget_partition, month_of, month_start,
+    months_between, partition_name,
+)
+from .queries import Series, split_by_tag, tags_series
+
+ARCHIVE_DIR = os.path.abspath(os.getenv("WIMS_MSR_ARCHIVE_DIR", os.path.join("archive", "msr")))
+HOT_MONTHS = int(os.getenv("WIMS_MSR_HOT_MONTHS", 3))
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("tag_id", pa.int32()),
+    ("ts", pa.timestamp("us", tz="UTC")),
+    ("value", pa.float64()),
+    ("quality", pa.int16()),
+])
+#  Parquet row group 최대 행 수와 압축
+ROW_GROUP_ROWS = 1_000_000
+COMPRESSION = "zstd"
+#  COPY 출력을 이만큼 모아 한 번에 해석합니다.
+DECODE_CHUNK_ROWS = 500_000
+#  떼어 낸 테이블을 삭제할 때 기다리는 최대 시간. 넘으면 취소하고 다음 실행 때 마저 삭제합니다.
+DROP_LOCK_TIMEOUT = "10s"
+
+#  PostgreSQL 바이너리 COPY 헤더(확장 영역 없음)와 종료 표시
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + (0).to_bytes(4, "big") + (0).to_bytes(4, "big")
+_COPY_TRAILER = (-1).to_bytes(2, "big", signed=True)
+#  내보내는 행 하나: 필드 수, (길이, 값) x 5. 모든 열이 NOT NULL이므로 행 길이가 고정입니다.
+_EXPORT_ROW = np.dtype([
+    ("fields", ">i2"),
+    ("site_len", ">i4"), ("site_id", ">i4"),
+    ("tag_len", ">i4"), ("tag_id", ">i4"),
+    ("ts_len", ">i4"), ("ts", ">i8"),
+    ("value_len", ">i4"), ("value", ">f8"),
+    ("quality_len", ">i4"), ("quality", ">i2"),
+])
+#  timestamptz 바이너리 값은 2000-01-01 UTC 기준 마이크로초입니다.
+_PG_EPOCH_US = 946_684_800 * 1_000_000
+
+#  태그가 삭제된 측정값은 처리시설 0으로 보관합니다.
+_EXPORT_SQL = (
+    "COPY (SELECT coalesce(t.site_id, 0), m.tag_id, m.ts, m.value, m.quality "
+    "FROM {schema}.{partition} m LEFT JOIN {schema}.tags t ON t.id = m.tag_id "
+    "ORDER BY m.tag_id, m.ts) TO STDOUT WITH (FORMAT binary)"
+)
+
+#  보관 파일은 메모리 맵으로 읽습니다.
+_FS = pafs.LocalFileSystem(use_mmap=True)
+#  part-<보관 순번>-<파티션 OID>.parquet. 순번이 없는 이전 형식(part-<OID>.parquet)은 순번 0으로 봅니다.
+_PART_FILE = re.compile(r"part-(?:(\d+)-)?(\d+)\.parquet")
+
+
+def month_dir(site_id: int, month: Month) -> str:
+    return os.path.join(ARCHIVE_DIR, f"site_id={site_id}", f"month={month[0]:04d}-{month[1]:02d}")
+
+
+def _part_files(directory: str) -> List[Tuple[int, str, str]]:
+    """디렉터리의 보관 파일 (보관 순번, 파티션 OID, 경로) 목록. 순번 순입니다."""
+    found = []
+    for path in glob.glob(os.path.join(directory, "part-*.parquet")):
+        match = _PART_FILE.fullmatch(os.path.basename(path))
+        if match:
+            found.append((int(match.group(1) or 0), match.group(2), path))
+    return sorted(found)
+
+
+def _overlap(path: str, others: Sequence[str]) -> int:
+    """보관 파일 path의 (tag_id, ts) 중 다른 파일들에도 있는 것의 수"""
+    if not others:
+        return 0
+    keys = pq.read_table(path, columns=["tag_id", "ts"], filesystem=_FS)
+    if not keys.num_rows:
+        return 0
+    tag_id = keys.column("tag_id").to_numpy()
+    ts = keys.column("ts")
+    previous = ds.dataset(list(others), schema=ARCHIVE_SCHEMA, format="parquet", filesystem=_FS).to_table(
+        columns=["tag_id", "ts"],
+        filter=(
+            ds.field("tag_id").isin(np.unique(tag_id).tolist())
+            & (ds.field("ts") >= pc.min(ts)) & (ds.field("ts") <= pc.max(ts))
+        ),
+    )
+    if not previous.num_rows:
+        return 0
+    ts = pc.cast(ts, pa.int64()).to_numpy()
+    previous_tag = previous.column("tag_id").to_numpy()
+    previous_ts = pc.cast(previous.column("ts"), pa.int64()).to_numpy()
+    overlap = 0
+    for tag in np.unique(previous_tag).tolist():
+        overlap += int(np.isin(ts[tag_id == tag], previous_ts[previous_tag == tag]).sum())
+    return overlap
+
+
+def _fsync(path: str):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _ArchiveSink:
+    """COPY TO STDOUT 바이너리 출력을 받아 처리시설별 Parquet 파일로 씁니다. (copy_expert의 파일 객체)"""
+
+    def __init__(self, month: Month, file_key: str):
+        self.month = month
+        #  처리시설별 보관 행 수
+        self.rows: Dict[int, int] = {}
+        #  처리시설별로 보관소에 새로 더해진 (tag_id, ts) 수. 이전 보관 파일에 있던 값과 덮어쓴 파일의 값은 뺍니다.
+        self.added: Dict[int, int] = {}
+        self._buffer = bytearray()
+        self._header_read = False
+        self._key = file_key
+        self._writers: Dict[int, pq.ParquetWriter] = {}
+        #  처리시설별 (임시 경로, 최종 경로)
+        self._paths: Dict[int, Tuple[str, str]] = {}
+        #  처리시설별 순번이 앞선 보관 파일 (이번 파일보다 먼저 보관된 값)
+        self._older: Dict[int, List[str]] = {}
+
+    def write(self, data) -> int:
+        self._buffer += data
+        if len(self._buffer) >= DECODE_CHUNK_ROWS * _EXPORT_ROW.itemsize:
+            self._decode()
+        return len(data)
+
+    def _decode(self):
+        if not self._header_read:
+            if len(self._buffer) < len(_COPY_HEADER):
+                return
+            if bytes(self._buffer[:len(_COPY_HEADER)]) != _COPY_HEADER:
+                raise ValueError("COPY 바이너리 헤더가 올바르지 않습니다.")
+            del self._buffer[:len(_COPY_HEADER)]
+            self._header_read = True
+        count = len(self._buffer) // _EXPORT_ROW.itemsize
+        if not count:
+            return
+        size = count * _EXPORT_ROW.itemsize
+        rows = np.frombuffer(self._buffer[:size], dtype=_EXPORT_ROW)
+        del self._buffer[:size]
+        if (rows["fields"] != 5).any():
+            raise ValueError("COPY 행의 필드 수가 올바르지 않습니다.")
+        sites = rows["site_id"]
+        for site_id in np.unique(sites).tolist():
+            part = rows[sites == site_id]
+            table = pa.table({
+                "tag_id": part["tag_id"].astype(np.int32),
+                "ts": pa.array(part["ts"].astype(np.int64) + _PG_EPOCH_US, type=ARCHIVE_SCHEMA.field("ts").type),
+                "value": part["value"].astype(np.float64),
+                "quality": part["quality"].astype(np.int16),
+            }, schema=ARCHIVE_SCHEMA)
+            self._writer(site_id).write_table(table, row_group_size=ROW_GROUP_ROWS)
+            self.rows[site_id] = self.rows.get(site_id, 0) + len(part)
+
+    def _writer(self, site_id: int) -> pq.ParquetWriter:
+        writer = self._writers.get(site_id)
+        if writer is None:
+            directory = month_dir(site_id, self.month)
+            os.makedirs(directory, exist_ok=True)
+            files = _part_files(directory)
+            same = [(seq, path) for seq, key, path in files if key == self._key]
+            if same:
+                #  같은 파티션을 다시 보관합니다. 이전 파일의 순번을 이어받아 덮어씁니다.
+                seq, final = same[0]
+            else:
+                seq = files[-1][0] + 1 if files else 1
+                final = os.path.join(directory, f"part-{seq:06d}-{self._key}.parquet")
+            temp = os.path.join(directory, f".part-{seq:06d}-{self._key}.parquet.tmp")
+            self._older[site_id] = [path for older, _, path in files if older < seq]
+            writer = pq.ParquetWriter(temp, ARCHIVE_SCHEMA, compression=COMPRESSION)
+            self._writers[site_id] = writer
+            self._paths[site_id] = (temp, final)
+        return writer
+
+    def finish(self) -> List[str]:
+        """남은 행을 쓰고 파일을 확정(fsync + rename)한 뒤 최종 경로 목록을 반환합니다."""
+        self._decode()
+        if self._header_read and bytes(self._buffer) != _COPY_TRAILER:
+            raise ValueError("COPY 바이너리 출력이 행 경계에서 끝나지 않았습니다.")
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        finals = []
+        for site_id, (temp, final) in self._paths.items():
+            older = self._older[site_id]
+            added = self.rows.get(site_id, 0) - _overlap(temp, older)
+            if os.path.exists(final):
+                added -= pq.ParquetFile(final).metadata.num_rows - _overlap(final, older)
+            self.added[site_id] = added
+            _fsync(temp)
+            os.replace(temp, final)
+            _fsync(os.path.dirname(final))
+            finals.append(final)
+        return finals
+
+    def abort(self):
+        """쓰던 파일과 확정한 파일을 모두 지웁니다."""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        for paths in self._paths.values():
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def _export(session: Session, month: Month, table: str, file_key: str) -> _ArchiveSink:
+    """
+    테이블의 값을 보관 파일로 내보내고 msr.archived_months에 기록합니다. 커밋하지 않습니다.
+    DB 작업이 실패하면 쓴 파일을 지웁니다.
+    """
+    sink = _ArchiveSink(month, file_key)
+    try:
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(_EXPORT_SQL.format(schema=SCHEMA, partition=table), sink, size=1 << 20)
+        finally:
+            cursor.close()
+        sink.finish()
+        if sink.added:
+            #  이전 보관 파일에 없던 (tag_id, ts)만 더합니다.
+            insert = pg_insert(ArchivedMonth).values([
+                {"month": month_start(month).date(), "site_id": site_id, "rows": sink.added[site_id]}
+                for site_id in sorted(sink.added)
+            ])
+            session.execute(insert.on_conflict_do_update(
+                index_elements=["month", "site_id"],
+                set_={"rows": ArchivedMonth.rows + insert.excluded.rows, "archived_at": func.now()},
+            ))
+    except BaseException:
+        session.rollback()
+        sink.abort()
+        raise
+    return sink
+
+
+def _detach(name: str):
+    """파티션을 부모 테이블에서 떼어 냅니다. CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 연결을 씁니다."""
+    with db.engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        pending = connection.execute(
+            text("SELECT inhdetachpending FROM pg_inherits WHERE inhrelid = CAST(:table AS regclass)"),
+            {"table": f"{SCHEMA}.{name}"},
+        ).scalar_one_or_none()
+        if pending is None:
+            #  이미 분리된 테이블입니다. (이전 실행이 삭제 전에 중단됨)
+            return
+        #  이전 실행의 분리가 중단되어 대기 상태로 남았으면 마무리만 합니다.
+        mode = "FINALIZE" if pending else "CONCURRENTLY"
+        connection.execute(text(f"ALTER TABLE {SCHEMA}.{PARENT_TABLE} DETACH PARTITION {SCHEMA}.{name} {mode}"))
+
+
+def archive_month(month: Month) -> Dict[int, int]:
+    """
+    한 달 파티션을 Parquet 보관소로 옮기고 삭제합니다. psycopg2 연결의 동기 엔진을 사용합니다.
+
+    Returns:
+        Dict[int, int]: 처리시설 ID별 보관한 행 수. 파티션이 없으면 빈 dict.
+    """
+    name = partition_name(month)
+    with db.sync_session() as session:
+        oid = session.execute(text("SELECT CAST(to_regclass(:table) AS oid)"), {"table": f"{SCHEMA}.{name}"}).scalar()
+        if oid is None:
+            session.rollback()
+            return {}
+        rows = None
+        if month in existing_partitions(session):
+            #  보관이 끝날 때까지 이 월로 들어오는 적재를 막습니다. 조회는 계속 가능합니다.
+            session.execute(text(f"LOCK TABLE {SCHEMA}.{name} IN SHARE MODE"))
+            rows = _export(session, month, name, str(oid)).rows
+            session.commit()
+
+    _detach(name)
+    #  분리 후 이 월의 값이 들어오면 적재 함수가 파티션을 다시 만듭니다. (ingest.copy_points)
+    forget_partition(month)
+
+    with db.sync_session() as session:
+        session.execute(text(f"SET LOCAL lock_timeout = '{DROP_LOCK_TIMEOUT}'"))
+        session.execute(text(f"LOCK TABLE {SCHEMA}.{name} IN ACCESS EXCLUSIVE MODE"))
+        count = session.execute(text(f"SELECT count(*) FROM {SCHEMA}.{name}")).scalar_one()
+        if rows is None or count != sum(rows.values()):
+            #  내보낸 뒤 분리 전에 들어온 값이 있거나, 이전 실행이 분리 후 중단되었습니다. 다시 내보냅니다.
+            rows = _export(session, month, name, str(oid)).rows
+        session.execute(text(f"DROP TABLE {SCHEMA}.{name}"))
+        session.commit()
+    return rows
+
+
+def _detached_months(session: Session) -> List[Month]:
+    """분리했지만 삭제하지 못한(보관 중단) 파티션 테이블의 월 목록"""
+    prefix = f"{PARENT_TABLE}_p"
+    names = session.execute(
+        text(
+            "SELECT c.relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relkind = 'r' AND c.relname LIKE :pattern "
+            "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)"
+        ),
+        {"schema": SCHEMA, "pattern": f"{prefix}%"},
+    ).scalars()
+    return [
+        (int(name[len(prefix):len(prefix) + 4]), int(name[len(prefix) + 4:]))
+        for name in names if name[len(prefix):].isdigit()
+    ]
+
+
+def closed_months(session: Session, now: datetime) -> List[Month]:
+    """HOT_MONTHS보다 오래되어 보관할 파티션의 월 목록 (이전 실행이 중단되어 남은 분리된 테이블 포함)"""
+    year, mon = month_of(now)
+    index = year * 12 + (mon - 1) - HOT_MONTHS
+    cutoff = (index // 12, index % 12 + 1)
+    months = set(existing_partitions(session)) | set(_detached_months(session))
+    return sorted(month for month in months if month <= cutoff)
+
+
+def archived_parts(session: Session, tag_ids: Iterable[int], start: datetime, end: datetime) -> List[Tuple[int, Month]]:
+    """[start, end) 구간의 태그 값이 보관되어 있는 (처리시설 ID, 월) 목록"""
+    tag_ids = set(tag_ids)
+    found = session.execute(select(Tag.id, Tag.site_id).where(Tag.id.in_(tag_ids))).all()
+    sites: Set[int] = {site_id for _, site_id in found}
+    #  태그가 삭제된 값은 처리시설 0으로 보관되어 있습니다.
+    if len(found) < len(tag_ids):
+        sites.add(0)
+    months = [month_start(month).date() for month in months_between(start, end)]
+    if not sites or not months:
+        return []
+    rows = session.execute(
+        select(ArchivedMonth.site_id, ArchivedMonth.month)
+        .where(ArchivedMonth.site_id.in_(sites), ArchivedMonth.month.in_(months))
+    ).all()
+    return [(site_id, (month.year, month.month)) for site_id, month in rows]
+
+
+def read_archive(
+    parts: Iterable[Tuple[int, Month]], tag_ids: Iterable[int], start: datetime, end: datetime,
+) -> Dict[int, Series]:
+    """
+    보관소의 (처리시설, 월) 파일에서 태그들의 [start, end) 값을 읽어 태그별 Series로 돌려줍니다.
+    같은 (tag_id, ts)가 여러 파일에 있으면 보관 순번이 큰 파일의 값을 남깁니다. (경로 순서와 무관)
+    """
+    tag_ids = list(tag_ids)
+    files = [
+        (seq, path) for site_id, month in parts
+        for seq, _, path in _part_files(month_dir(site_id, month))
+    ]
+    if not files or not tag_ids:
+        return {}
+    ts_type = ARCHIVE_SCHEMA.field("ts").type
+    condition = (
+        ds.field("tag_id").isin(tag_ids)
+        & (ds.field("ts") >= pa.scalar(start, type=ts_type))
+        & (ds.field("ts") < pa.scalar(end, type=ts_type))
+    )
+    tables = []
+    for seq, path in files:
+        table = ds.dataset(path, schema=ARCHIVE_SCHEMA, format="parquet", filesystem=_FS).to_table(filter=condition)
+        if table.num_rows:
+            tables.append(table.append_column("seq", pa.array(np.full(table.num_rows, seq, np.int64))))
+    if not tables:
+        return {}
+    table = pa.concat_tables(tables).sort_by([("tag_id", "ascending"), ("ts", "ascending"), ("seq", "ascending")])
+    tag_id = table.column("tag_id").to_numpy()
+    ts = pc.cast(table.column("ts"), pa.int64()).to_numpy()
+    #  (tag_id, ts)마다 마지막(순번이 가장 큰) 행만 남깁니다.
+    keep = np.append((tag_id[1:] != tag_id[:-1]) | (ts[1:] != ts[:-1]), True)
+    return split_by_tag(
+        tag_id[keep], ts[keep],
+        table.column("value").to_numpy()[keep],
+        table.column("quality").to_numpy()[keep],
+    )
+
+
+def archived_duplicates(session: Session, tag_id: np.ndarray, ts: np.ndarray) -> int:
+    """
+    적재할 값(tag_id, ts: UTC epoch 마이크로초) 중 보관소에 이미 있는 (tag_id, ts)의 수.
+    보관된 월에 걸치지 않으면 보관 기록만 조회하고 파일은 읽지 않습니다.
+    """
+    if not len(ts):
+        return 0
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    start = epoch + timedelta(microseconds=int(ts.min()))
+    end = epoch + timedelta(microseconds=int(ts.max()) + 1)
+    tag_ids = np.unique(tag_id).tolist()
+    parts = archived_parts(session, tag_ids, start, end)
+    if not parts:
+        return 0
+    duplicates = 0
+    for tag, series in read_archive(parts, tag_ids, start, end).items():
+        duplicates += int(np.isin(ts[tag_id == tag], series.ts).sum())
+    return duplicates
+
+
+def _merge(cold: Series, hot: Series) -> Series:
+    """두 Series를 시각 순으로 합칩니다. 같은 시각이면 hot(뒤쪽) 값을 남깁니다."""
+    ts = np.concatenate((cold.ts, hot.ts))
+    order = np.argsort(ts, kind="stable")
+    ts = ts[order]
+    keep = np.append(ts[1:] != ts[:-1], True)
+    return Series(
+        hot.tag_id, ts[keep],
+        np.concatenate((cold.value, hot.value))[order][keep],
+        np.concatenate((cold.quality, hot.quality))[order][keep],
+    )
+
+
+def tags_series_merged(session: Session, tag_ids: Iterable[int], start: datetime, end: datetime) -> Dict[int, Series]:
+    """tags_series()와 같지만 보관소로 옮긴 월의 값도 합쳐 돌려줍니다."""
+    tag_ids = list(tag_ids)
+    hot = tags_series(session, tag_ids, start, end)
+    parts = archived_parts(session, tag_ids, start, end)
+    if not parts:
+        return hot
+    cold = read_archive(parts, tag_ids, start, end)
+    merged = dict(hot)
+    for tag_id, series in cold.items():
+        merged[tag_id] = _merge(series, hot[tag_id]) if tag_id in hot else series
+    return merged
+
+
+def tag_series_merged(session: Session, tag_id: int, start: datetime, end: datetime) -> Series:
+    """tag_series()와 같지만 보관소로 옮긴 월의 값도 합쳐 돌려줍니다."""
+    return tags_series_merged(session, [tag_id], start, end).get(tag_id) or Series(
+        tag_id, np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.int16)
+    )
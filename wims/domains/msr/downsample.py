@@ -0,0 +1,119 @@
+# /wims_project/wims/domains/msr/downsample.py
+"""
+시계열 집계와 다운샘플링을 위한 numpy 함수 모음입니다. DB와 State에 의존하지 않습니다.
+
+- aggregate(): (태그, 구간)별 min/max/sum/count/last를 정렬 + reduceat으로 한 번에 계산합니다.
+  원시 측정값을 분 단위로 묶을 때와, 분 집계를 시/일 또는 화면 픽셀 구간으로 다시 묶을 때 모두 사용합니다.
+- lttb(): Largest-Triangle-Three-Buckets. 선 모양을 유지하며 n개 점을 고릅니다.
+- minmax_decimate(): 구간마다 최솟값/최댓값 점만 남겨 튀는 값을 잃지 않고 점 수를 줄입니다.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Aggregates:
+    """(tag_id, bucket)별 집계. 모든 배열은 같은 길이이며 (tag_id, bucket) 순으로 정렬되어 있습니다."""
+    tag_id: np.ndarray
+    bucket: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    sum: np.ndarray
+    count: np.ndarray
+    last_ts: np.ndarray
+    last_value: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tag_id)
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.sum / np.maximum(self.count, 1)
+
+    @classmethod
+    def from_points(cls, tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray) -> "Aggregates":
+        """원시 측정값 하나하나를 집계 한 행으로 봅니다. (bucket = ts)"""
+        return cls(
+            tag_id=tag_id, bucket=ts, min=value, max=value, sum=value,
+            count=np.ones(len(value), dtype=np.int64), last_ts=ts, last_value=value,
+        )
+
+
+def bucket_start(ts: np.ndarray, width: int, offset: int = 0) -> np.ndarray:
+    """ts(정수)를 width 간격 구간의 시작값으로 내림합니다. offset은 구간 경계를 옮기는 양입니다. (현지 자정 등)"""
+    return (ts + offset) // width * width - offset
+
+
+def aggregate(source: Aggregates, bucket: np.ndarray) -> Aggregates:
+    """
+    source의 각 행을 새 bucket 값으로 묶어 다시 집계합니다.
+
+    Args:
+        source (Aggregates): 원시 측정값(Aggregates.from_points) 또는 더 작은 구간의 집계.
+        bucket (np.ndarray): source 행마다의 새 구간 값.
+    """
+    if not len(source):
+        return source
+    #  (tag_id, bucket, last_ts) 순으로 정렬하면 각 묶음의 마지막 행이 가장 늦은 값을 가집니다.
+    order = np.lexsort((source.last_ts, bucket, source.tag_id))
+    tag_id = source.tag_id[order]
+    bucket = bucket[order]
+    change = np.flatnonzero((tag_id[1:] != tag_id[:-1]) | (bucket[1:] != bucket[:-1])) + 1
+    starts = np.concatenate(([0], change))
+    lasts = np.concatenate((change, [len(order)])) - 1
+    return Aggregates(
+        tag_id=tag_id[starts],
+        bucket=bucket[starts],
+        min=np.minimum.reduceat(source.min[order], starts),
+        max=np.maximum.reduceat(source.max[order], starts),
+        sum=np.add.reduceat(source.sum[order], starts),
+        count=np.add.reduceat(source.count[order], starts),
+        last_ts=source.last_ts[order][lasts],
+        last_value=source.last_value[order][lasts],
+    )
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    LTTB로 고른 점의 인덱스(오름차순)를 반환합니다. x는 오름차순이어야 합니다.
+    구간 평균은 reduceat으로 한 번에 구하고, 이전 선택점에 의존하는 삼각형 면적 비교만 구간마다 계산합니다.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = (x - x[0]).astype(np.float64)
+    y = y.astype(np.float64)
+    #  첫 점과 마지막 점을 제외한 1..n-2를 n_out-2개 구간으로 나눕니다.
+    edges = (np.arange(n_out - 1) * (n - 2) // (n_out - 2) + 1).astype(np.int64)
+    sizes = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1]) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / sizes, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - mean_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y[i + 1] - y[a])
+        )
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """x 범위를 n_buckets개 구간으로 나누고 구간마다 최솟값/최댓값 점의 인덱스(오름차순)를 반환합니다."""
+    n = len(x)
+    if n <= 2 * n_buckets:
+        return np.arange(n)
+    span = int(x[-1] - x[0]) + 1
+    group = (x - x[0]).astype(np.int64) * n_buckets // span
+    order = np.lexsort((y, group))
+    change = np.flatnonzero(group[order][1:] != group[order][:-1]) + 1
+    first = order[np.concatenate(([0], change))]
+    last = order[np.concatenate((change, [n])) - 1]
+    return np.unique(np.concatenate((first, last)))
@@ -0,0 +1,370 @@
+# /wims_project/wims/domains/msr/ingest.py
+"""
+측정값 대량 적재 파이프라인입니다.
+
+1. 측정값은 열 단위 numpy 배열 묶음(PointBatch)으로 다룹니다. SCADA CSV는 parse_csv()가 열 단위로
+   한 번에 변환하며, 태그 이름은 캐시된 태그 조회표로 ID로 바꿉니다.
+2. 배치가 걸치는 월의 파티션을 먼저 만듭니다. (partitions.ensure_partitions)
+3. 배치를 PostgreSQL COPY 바이너리 형식으로 한 번에 인코딩(numpy 구조체 배열)해
+   `COPY msr.measurements FROM STDIN (FORMAT binary)`로 보냅니다. 행마다 파이썬 객체를 만들지 않습니다.
+4. 같은 트랜잭션에서 분/시/일 집계 테이블을 갱신합니다. (rollups.apply_points)
+   커밋 후 태그별 마지막 값을 실시간 표시 허브(wims.live)로 보냅니다.
+5. dedupe=True이면 임시 테이블로 COPY한 뒤 INSERT ... ON CONFLICT로 합쳐 다시 보낸 구간의 값을
+   덮어쓰고, 해당 구간의 집계를 원시 값에서 다시 계산합니다. (재전송 파일용, 직접 COPY보다 느림)
+   보관소로 옮긴 월의 값을 다시 보내면 dedupe=False일 때는 중복으로 거부하고(ArchivedDuplicateError),
+   dedupe=True일 때는 Postgres에 쌓인 새 값이 보관 값보다 우선하고, 그 월을 다시 보관하면 이전 보관 값을 대신합니다.
+
+COPY는 psycopg2 연결의 copy_expert()를 사용하므로 WIMS_DB_MODE와 관계없이 동기 엔진(db_url)으로
+스레드에서 실행합니다.
+
+HTTP 적재: POST /api/msr/ingest[?dedupe=true]  (본문: CSV, 헤더 Authorization: Bearer <키>)
+
+환경 변수:
+    WIMS_MSR_INGEST_KEY: HTTP 적재 인증 키. 설정하지 않으면 HTTP 적재를 받지 않습니다.
+    WIMS_MSR_SCADA_TZ: 시간대 없는 CSV 시각을 해석할 시간대 (기본값: Asia/Seoul)
+    WIMS_MSR_MAX_INGEST_BYTES: HTTP 적재 본문 최대 크기 (기본값: 64MB)
+"""
+
+import asyncio
+import csv
+import hmac
+import io
+import os
+import warnings
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import IO, List, Mapping, Set, Tuple
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request
+from sqlmodel import Session
+
+from ... import db, live
+from .partitions import Month, ensure_partitions, forget_partition
+from .refdata import get_tag_ids
+from .rollups import LOCAL_TZ, apply_points, rebuild
+
+#  COPY 한 번에 보내는 최대 행 수 (인코딩 버퍼 크기 제한)
+COPY_CHUNK_ROWS = 200_000
+#  CSV 오류 리포트에 담는 최대 행 수
+MAX_REPORTED_ERRORS = 100
+
+CSV_COLUMNS = ["tag", "ts", "value", "quality"]
+
+INGEST_KEY = os.getenv("WIMS_MSR_INGEST_KEY", "")
+#  시간대 없는 CSV 시각을 해석할 시간대 (일 집계 경계와 같은 WIMS_MSR_SCADA_TZ)
+SCADA_TZ = LOCAL_TZ
+MAX_INGEST_BYTES = int(os.getenv("WIMS_MSR_MAX_INGEST_BYTES", 64 * 1024 * 1024))
+
+#  PostgreSQL unique_violation
+_UNIQUE_VIOLATION = "23505"
+#  PostgreSQL check_violation: 행이 들어갈 파티션이 없음 (다른 프로세스가 보관 후 삭제한 월)
+_NO_PARTITION = "23514"
+
+router = APIRouter(prefix="/api/msr")
+
+#  PostgreSQL 바이너리 COPY: 헤더(시그니처, 플래그, 확장 길이)와 종료 표시
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + (0).to_bytes(4, "big") + (0).to_bytes(4, "big")
+_COPY_TRAILER = (-1).to_bytes(2, "big", signed=True)
+#  행 하나: 필드 수, (길이, 값) x 4. 네트워크 바이트 순서, 정렬 없음.
+_COPY_ROW = np.dtype([
+    ("fields", ">i2"),
+    ("tag_len", ">i4"), ("tag_id", ">i4"),
+    ("ts_len", ">i4"), ("ts", ">i8"),
+    ("value_len", ">i4"), ("value", ">f8"),
+    ("quality_len", ">i4"), ("quality", ">i2"),
+])
+#  timestamptz 바이너리 값은 2000-01-01 UTC 기준 마이크로초입니다.
+_PG_EPOCH_US = 946_684_800 * 1_000_000
+
+_COPY_SQL = "COPY {table} (tag_id, ts, value, quality) FROM STDIN WITH (FORMAT binary)"
+_STAGE_TABLE = "msr_ingest_stage"
+_MERGE_SQL = (
+    f"INSERT INTO msr.measurements (tag_id, ts, value, quality) "
+    f"SELECT DISTINCT ON (tag_id, ts) tag_id, ts, value, quality FROM {_STAGE_TABLE} "
+    f"ON CONFLICT (tag_id, ts) DO UPDATE SET value = EXCLUDED.value, quality = EXCLUDED.quality"
+)
+
+
+class ArchivedDuplicateError(Exception):
+    """보관소(Parquet)에 이미 있는 (tag_id, ts)를 dedupe 없이 다시 적재하려 할 때. UniqueViolation과 같이 처리합니다."""
+    pgcode = _UNIQUE_VIOLATION
+
+
+@dataclass
+class PointBatch:
+    """열 단위 측정값 묶음. ts는 UTC 기준 Unix epoch 마이크로초입니다."""
+    tag_id: np.ndarray
+    ts: np.ndarray
+    value: np.ndarray
+    quality: np.ndarray
+
+    @classmethod
+    def from_arrays(cls, tag_id, ts, value, quality=None) -> "PointBatch":
+        """
+        배열(또는 시퀀스)로 배치를 만듭니다.
+
+        Args:
+            tag_id: 태그 ID.
+            ts: datetime64 배열(UTC) 또는 Unix epoch 마이크로초 정수 배열.
+            value: 측정값.
+            quality: 품질 코드. 생략하면 모두 정상(0).
+        """
+        ts = np.asarray(ts)
+        if ts.dtype.kind == "M":
+            ts = ts.astype("datetime64[us]").astype(np.int64)
+        tag_id = np.asarray(tag_id, dtype=np.int32)
+        value = np.asarray(value, dtype=np.float64)
+        quality = np.zeros(len(tag_id), dtype=np.int16) if quality is None else np.asarray(quality, dtype=np.int16)
+        if not len(tag_id) == len(ts) == len(value) == len(quality):
+            raise ValueError("tag_id, ts, value, quality의 길이가 같아야 합니다.")
+        return cls(tag_id=tag_id, ts=ts.astype(np.int64, copy=False), value=value, quality=quality)
+
+    def __len__(self) -> int:
+        return len(self.tag_id)
+
+    def slice(self, start: int, stop: int) -> "PointBatch":
+        return PointBatch(self.tag_id[start:stop], self.ts[start:stop], self.value[start:stop], self.quality[start:stop])
+
+    def months(self) -> Set[Month]:
+        """배치가 걸치는 (연, 월) 집합 (UTC)"""
+        months = np.unique(self.ts.astype("datetime64[us]").astype("datetime64[M]").astype(np.int64))
+        return {(1970 + int(m) // 12, int(m) % 12 + 1) for m in months}
+
+
+def _from_epoch_us(value: int) -> datetime:
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=int(value))
+
+
+def encode_copy_binary(batch: PointBatch) -> bytes:
+    """배치를 PostgreSQL COPY 바이너리 형식으로 인코딩합니다."""
+    rows = np.empty(len(batch), dtype=_COPY_ROW)
+    rows["fields"] = 4
+    rows["tag_len"] = 4
+    rows["tag_id"] = batch.tag_id
+    rows["ts_len"] = 8
+    rows["ts"] = batch.ts - _PG_EPOCH_US
+    rows["value_len"] = 8
+    rows["value"] = batch.value
+    rows["quality_len"] = 2
+    rows["quality"] = batch.quality
+    return _COPY_HEADER + rows.tobytes() + _COPY_TRAILER
+
+
+def copy_points(session: Session, batch: PointBatch, dedupe: bool = False) -> int:
+    """
+    배치를 COPY로 적재하고 집계 테이블을 갱신한 뒤 커밋합니다. psycopg2 연결의 동기 Session이 필요합니다.
+
+    Args:
+        dedupe (bool): True이면 이미 있는 (tag_id, ts)의 값을 덮어씁니다.
+            False이면 중복 시 UniqueViolation으로 전체가 롤백됩니다.
+
+    Returns:
+        int: 적재(또는 갱신)된 행 수.
+    """
+    if not len(batch):
+        return 0
+    try:
+        count = _copy_points(session, batch, dedupe)
+    except Exception as e:
+        if getattr(e, "pgcode", None) != _NO_PARTITION:
+            raise
+        #  이 프로세스가 확인해 둔 파티션이 보관(archive)으로 삭제된 경우입니다. 다시 만들고 한 번 더 보냅니다.
+        session.rollback()
+        for month in batch.months():
+            forget_partition(month)
+        count = _copy_points(session, batch, dedupe)
+    #  커밋된 값만 실시간 표시 허브로 보냅니다.
+    live.publish(batch.tag_id, batch.ts, batch.value, batch.quality)
+    return count
+
+
+def _copy_points(session: Session, batch: PointBatch, dedupe: bool) -> int:
+    if not dedupe:
+        #  보관된 월의 값은 Postgres 유일 제약으로 걸러지지 않으므로 보관소에서 확인합니다.
+        #  (보관 파일 조회는 pyarrow가 필요하므로 여기서 불러옵니다)
+        from .archive import archived_duplicates
+
+        duplicates = archived_duplicates(session, batch.tag_id, batch.ts)
+        if duplicates:
+            raise ArchivedDuplicateError(f"보관된 측정값과 같은 시각이 {duplicates}개 있습니다.")
+    ensure_partitions(session, batch.months())
+    cursor = session.connection().connection.cursor()
+    try:
+        if dedupe:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGE_TABLE} "
+                f"(tag_id integer, ts timestamptz, value double precision, quality smallint) ON COMMIT DELETE ROWS"
+            )
+        table = _STAGE_TABLE if dedupe else "msr.measurements"
+        for start in range(0, len(batch), COPY_CHUNK_ROWS):
+            payload = encode_copy_binary(batch.slice(start, start + COPY_CHUNK_ROWS))
+            cursor.copy_expert(_COPY_SQL.format(table=table), io.BytesIO(payload), size=1 << 20)
+        if dedupe:
+            cursor.execute(_MERGE_SQL)
+            count = cursor.rowcount
+        else:
+            count = len(batch)
+    finally:
+        cursor.close()
+    if dedupe:
+        rebuild(session, np.unique(batch.tag_id).tolist(), _from_epoch_us(batch.ts.min()), _from_epoch_us(batch.ts.max() + 1))
+    else:
+        apply_points(session, batch.tag_id, batch.ts, batch.value, batch.quality)
+    session.commit()
+    return count
+
+
+def _copy_points_sync(batch: PointBatch, dedupe: bool) -> int:
+    with db.sync_session() as session:
+        return copy_points(session, batch, dedupe)
+
+
+async def ingest(batch: PointBatch, dedupe: bool = False) -> int:
+    """이벤트 루프를 막지 않고 배치를 적재합니다. (copy_points 참고)"""
+    return await asyncio.to_thread(_copy_points_sync, batch, dedupe)
+
+
+@dataclass
+class ParseReport:
+    total: int = 0
+    #  (행 번호, 사유). 처음 MAX_REPORTED_ERRORS개만 담습니다.
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    error_count: int = 0
+    unknown_tags: Set[str] = field(default_factory=set)
+
+    def add_error(self, line: int, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "error_count": self.error_count,
+            "errors": [{"line": line, "message": message} for line, message in self.errors],
+            "unknown_tags": sorted(self.unknown_tags)[:MAX_REPORTED_ERRORS],
+        }
+
+
+def _local_to_utc_us(local: np.ndarray, tz: tzinfo) -> np.ndarray:
+    """시간대 없는 현지 시각(datetime64[us])을 UTC epoch 마이크로초로 바꿉니다. 오프셋은 시 단위로 계산합니다."""
+    hours = local.astype("datetime64[h]")
+    unique_hours, inverse = np.unique(hours, return_inverse=True)
+    offsets = np.array([
+        int(tz.utcoffset(hour.astype(datetime)).total_seconds() * 1_000_000) for hour in unique_hours
+    ], dtype=np.int64)
+    return local.astype(np.int64) - offsets[inverse]
+
+
+def _has_utc_offset(stamp: str) -> bool:
+    """ISO 8601 시각에 시간대(Z, +hh:mm, -hh:mm)가 붙어 있는지 확인합니다. (날짜 부분의 '-'는 제외)"""
+    return stamp[-1:] in ("Z", "z") or "+" in stamp[10:] or "-" in stamp[10:]
+
+
+def parse_csv(fileobj: IO[bytes], tag_ids: Mapping[str, int], tz: tzinfo) -> Tuple[PointBatch, ParseReport]:
+    """
+    SCADA 내보내기 CSV(tag,ts,value[,quality])를 배치로 변환합니다.
+
+    - ts는 ISO 8601 형식입니다. 시간대(Z 또는 +09:00)가 없는 시각은 tz의 현지 시각으로 봅니다.
+      (행마다 판단하므로 두 형식이 섞인 파일도 올바르게 변환됩니다)
+    - 등록되지 않은 태그와 형식 오류 행은 건너뛰고 리포트에 담습니다.
+    """
+    report = ParseReport()
+    reader = csv.reader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    header = [column.strip().lower() for column in next(reader, [])]
+    if header[:3] != CSV_COLUMNS[:3]:
+        raise ValueError(f"CSV 헤더는 {','.join(CSV_COLUMNS)} 이어야 합니다.")
+    has_quality = len(header) > 3 and header[3] == "quality"
+
+    lines: List[int] = []
+    tags: List[int] = []
+    stamps: List[str] = []
+    aware: List[bool] = []
+    values: List[str] = []
+    qualities: List[str] = []
+    for line, record in enumerate(reader, start=2):
+        if not record:
+            continue
+        report.total += 1
+        if len(record) < 3:
+            report.add_error(line, "열 수가 부족합니다.")
+            continue
+        tag = tag_ids.get(record[0].strip())
+        if tag is None:
+            report.unknown_tags.add(record[0].strip())
+            report.add_error(line, f"등록되지 않은 태그입니다: {record[0].strip()}")
+            continue
+        lines.append(line)
+        tags.append(tag)
+        stamps.append(record[1].strip())
+        aware.append(_has_utc_offset(stamps[-1]))
+        values.append(record[2].strip())
+        qualities.append(record[3].strip() if has_quality and len(record) > 3 and record[3].strip() else "0")
+
+    keep = np.ones(len(lines), dtype=bool)
+    ts = np.zeros(len(lines), dtype="datetime64[us]")
+    value = np.zeros(len(lines), dtype=np.float64)
+    quality = np.zeros(len(lines), dtype=np.int16)
+    #  열 전체를 한 번에 변환하고, 실패한 경우에만 행 단위로 다시 변환해 오류 행을 찾습니다.
+    with warnings.catch_warnings():
+        #  시간대가 있는 문자열은 numpy가 UTC로 변환하며 경고를 냅니다.
+        warnings.simplefilter("ignore", UserWarning)
+        for target, source, convert in (
+            (ts, stamps, lambda items: np.array(items, dtype="datetime64[us]")),
+            (value, values, lambda items: np.array(items, dtype=np.float64)),
+            (quality, qualities, lambda items: np.array(items, dtype=np.int16)),
+        ):
+            try:
+                target[:] = convert(source)
+            except ValueError:
+                for index, item in enumerate(source):
+                    try:
+                        target[index] = convert([item])[0]
+                    except ValueError:
+                        if keep[index]:
+                            keep[index] = False
+                            report.add_error(lines[index], f"값을 해석할 수 없습니다: {item!r}")
+
+    #  시간대가 있는 시각은 numpy가 이미 UTC로 바꿨으므로 현지 시각인 행만 변환합니다.
+    ts_us = ts.astype(np.int64)
+    local = ~np.array(aware, dtype=bool)
+    if local.any():
+        ts_us[local] = _local_to_utc_us(ts[local], tz)
+    batch = PointBatch.from_arrays(np.array(tags, dtype=np.int32)[keep], ts_us[keep], value[keep], quality[keep])
+    return batch, report
+
+
+def _authorize(request: Request):
+    scheme, _, key = request.headers.get("authorization", "").partition(" ")
+    if not INGEST_KEY or scheme.lower() != "bearer" or not hmac.compare_digest(key.encode(), INGEST_KEY.encode()):
+        raise HTTPException(status_code=403, detail="적재 인증 키가 올바르지 않습니다.")
+
+
+@router.post("/ingest")
+async def ingest_csv(request: Request, dedupe: bool = False):
+    """
+    SCADA CSV를 적재하고 적재 행 수와 파싱 리포트를 반환합니다.
+    형식 오류 행과 등록되지 않은 태그의 행은 건너뛰며, 중복 시각이 있으면 dedupe=true로 다시 보내야 합니다.
+    """
+    _authorize(request)
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_INGEST_BYTES:
+            raise HTTPException(status_code=413, detail=f"본문이 {MAX_INGEST_BYTES}바이트를 넘습니다.")
+
+    tag_ids = await get_tag_ids()
+    try:
+        batch, report = await asyncio.to_thread(parse_csv, io.BytesIO(body), tag_ids, SCADA_TZ)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+    try:
+        inserted = await ingest(batch, dedupe)
+    except Exception as e:
+        if getattr(e, "pgcode", None) == _UNIQUE_VIOLATION:
+            raise HTTPException(
+                status_code=409, detail="이미 적재된 시각이 포함되어 있습니다. dedupe=true로 다시 보내세요."
+            ) from None
+        raise
+    return {"inserted": inserted, **report.to_dict()}
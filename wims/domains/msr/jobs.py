@@ -0,0 +1,58 @@
+# /wims_project/wims/domains/msr/jobs.py
+"""
+'msr' 도메인의 백그라운드/주기 작업입니다. 작업 큐 워커(python -m wims.tasks.worker)에서 실행됩니다.
+"""
+
+from datetime import datetime, timezone
+
+from ... import db
+from ...tasks.registry import task
+from ...tasks.scheduler import periodic
+from .archive import archive_month, closed_months
+from .partitions import ensure_partitions, month_of, next_month, partition_name
+from .rollups import rebuild
+
+#  미리 만들어 두는 파티션 개월 수 (이번 달 포함)
+PARTITIONS_AHEAD = 3
+
+
+@periodic("5 0 * * *", name="msr.create_partitions", max_attempts=3)
+def create_partitions(payload: dict) -> dict:
+    """이번 달부터 PARTITIONS_AHEAD개월의 측정값 파티션을 미리 만듭니다."""
+    months = [month_of(datetime.now(timezone.utc))]
+    while len(months) < PARTITIONS_AHEAD:
+        months.append(next_month(months[-1]))
+    with db.sync_session() as session:
+        created = ensure_partitions(session, months)
+    return {"created": created}
+
+
+@periodic("30 2 * * *", name="msr.archive_partitions", timeout=3 * 3600, max_attempts=3)
+def archive_partitions(payload: dict) -> dict:
+    """HOT_MONTHS보다 오래된 측정값 파티션을 Parquet 보관소로 옮깁니다. (archive.py)"""
+    with db.sync_session() as session:
+        months = closed_months(session, datetime.now(timezone.utc))
+    archived = {}
+    for month in months:
+        rows = archive_month(month)
+        archived[partition_name(month)] = sum(rows.values())
+    return {"archived": archived}
+
+
+@task("msr.rebuild_rollups", timeout=1800, max_attempts=3)
+def rebuild_rollups(payload: dict) -> dict:
+    """
+    태그들의 구간 집계를 원시 값에서 다시 계산합니다. (과거 데이터 보정, 집계 도입 전 데이터 채우기)
+    보관소로 옮긴 월은 보관 값과 합쳐 계산하므로 보관된 기간의 집계도 그대로 유지됩니다. (rollups.rebuild)
+
+    payload:
+        tag_ids (List[int]): 태그 ID 목록.
+        start, end (str): ISO 8601 시각. 현지 자정 기준 일 구간으로 넓혀 계산합니다.
+    """
+    with db.sync_session() as session:
+        written = rebuild(
+            session, payload["tag_ids"],
+            datetime.fromisoformat(payload["start"]), datetime.fromisoformat(payload["end"]),
+        )
+        session.commit()
+    return {"written": written}
@@ -0,0 +1,70 @@
+# /wims_project/wims/domains/msr/kpis.py
+"""
+'msr' 도메인의 대시보드 지표 출처입니다. (wims.domains.dash.kpis 참고)
+
+- msr.latest.<태그 ID>: 태그별 현재값. STALE_AFTER보다 오래되면 '지연', 품질 코드에 따라 '주의'/'이상'.
+- msr.daily_avg.<태그 ID>: 오늘(현지 자정부터) 평균. 일 집계 테이블에서 읽습니다.
+- msr.summary.stale: 처리시설별 수집 지연 태그 수.
+
+환경 변수:
+    WIMS_MSR_STALE_MINUTES: 현재값을 '지연'으로 표시하는 기준(분, 기본값: 15)
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlmodel import Session
+
+from ..dash.kpis import KpiValue, kpi_source
+from ..dash.models import KpiStatus
+from .models import Quality
+from .queries import latest_values_all
+from .rollups import day_means
+
+STALE_AFTER = timedelta(minutes=int(os.getenv("WIMS_MSR_STALE_MINUTES", 15)))
+#  현재값을 찾는 기간. 이보다 오래된 태그는 값 없이 '지연'으로 표시합니다.
+LATEST_LOOKBACK = timedelta(days=1)
+
+SECTION_SUMMARY = "요약"
+SECTION_LATEST = "현재값"
+SECTION_DAILY_AVG = "오늘 평균"
+
+#  현재값 지표 키 앞부분. 뒤에 태그 ID가 붙으며, 대시보드는 이 지표를 실시간 값(wims.live)으로 갱신합니다.
+LATEST_KEY_PREFIX = "msr.latest."
+
+QUALITY_STATUS = {Quality.GOOD: KpiStatus.OK, Quality.SUSPECT: KpiStatus.WARN, Quality.BAD: KpiStatus.BAD}
+
+
+@kpi_source("msr")
+def measurement_kpis(session: Session, now: datetime) -> List[KpiValue]:
+    """현재값, 오늘 평균, 수집 지연 태그 수. 쿼리는 태그별 LATERAL 조회 한 번과 일 집계 조회 한 번입니다."""
+    latest = latest_values_all(session, since=now - LATEST_LOOKBACK)
+    means = day_means(session, now)
+    values: List[KpiValue] = []
+    stale_by_site: Dict[int, int] = {}
+    #  표시 순서: 요약, 현재값(1..n), 오늘 평균(n+1..2n)
+    for order, item in enumerate(latest, start=1):
+        if item.ts is None or now - item.ts > STALE_AFTER:
+            status = KpiStatus.STALE
+            stale_by_site[item.site_id] = stale_by_site.get(item.site_id, 0) + 1
+        else:
+            status = QUALITY_STATUS.get(item.quality, KpiStatus.WARN)
+        stale_by_site.setdefault(item.site_id, 0)
+        values.append(KpiValue(
+            site_id=item.site_id, key=f"{LATEST_KEY_PREFIX}{item.tag_id}", section=SECTION_LATEST,
+            label=item.name, value=item.value, unit=item.unit, status=status,
+            sort_order=order, observed_at=item.ts,
+        ))
+        if item.tag_id in means:
+            mean, last_ts = means[item.tag_id]
+            values.append(KpiValue(
+                site_id=item.site_id, key=f"msr.daily_avg.{item.tag_id}", section=SECTION_DAILY_AVG,
+                label=item.name, value=mean, unit=item.unit, sort_order=len(latest) + order, observed_at=last_ts,
+            ))
+    for site_id, stale in stale_by_site.items():
+        values.append(KpiValue(
+            site_id=site_id, key="msr.summary.stale", section=SECTION_SUMMARY, label="수집 지연 태그",
+            value=float(stale), unit="개", status=KpiStatus.WARN if stale else KpiStatus.OK,
+        ))
+    return values
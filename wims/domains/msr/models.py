@@ -0,0 +1,167 @@
+# /wims_project/wims/domains/msr/models.py
+"""
+'msr'(계측) 도메인의 데이터베이스 ORM 모델을 정의하는 모듈입니다.
+처리시설(Site), 계측 태그(Tag), 시계열 측정값(Measurement)을 다룹니다.
+Department.site_list의 정수 값은 Site.id를 가리킵니다.
+"""
+
+from typing import Optional
+from datetime import date, datetime, timezone
+
+from sqlalchemy import BigInteger, Index, SmallInteger
+from sqlmodel import Column, Field, Float, ForeignKey, Integer, SQLModel, TIMESTAMP, func
+
+import reflex as rx
+
+
+class TagKind:
+    """계측 항목 종류 (DB에는 문자열로 저장)"""
+    FLOW = "flow"              # 유량
+    PH = "ph"                  # pH
+    DO = "do"                  # 용존산소
+    TURBIDITY = "turbidity"    # 탁도
+    LEVEL = "level"            # 수위
+    PRESSURE = "pressure"      # 압력
+    CHLORINE = "chlorine"      # 잔류염소
+    TEMPERATURE = "temperature"  # 수온
+    OTHER = "other"            # 기타
+
+
+class Quality:
+    """측정값 품질 코드"""
+    GOOD = 0        # 정상
+    SUSPECT = 1     # 의심 (범위 초과 등)
+    BAD = 2         # 불량 (센서/통신 이상)
+
+
+class Site(rx.Model, table=True):
+    """
+    PostgreSQL의 msr.sites 테이블에 매핑되는 모델. (처리시설)
+    """
+    __tablename__ = "sites"  # type: ignore
+    __table_args__ = {'schema': 'msr'}
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    code: str = Field(max_length=16, unique=True, description="처리시설 코드")
+    name: str = Field(max_length=100, description="처리시설명")
+    sort_order: Optional[int] = Field(default=None, description="정렬 순서")
+    is_active: bool = Field(default=True, description="사용 여부")
+
+    created_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now()),
+        description="레코드 생성 일시"
+    )
+    updated_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()),
+        description="레코드 마지막 업데이트 일시"
+    )
+
+
+class Tag(rx.Model, table=True):
+    """
+    PostgreSQL의 msr.tags 테이블에 매핑되는 모델. (SCADA 계측 태그)
+    code는 SCADA 내보내기 파일에 쓰이는 태그 이름이며 전체에서 유일합니다.
+    """
+    __tablename__ = "tags"  # type: ignore
+    __table_args__ = (
+        Index("ix_msr_tags_site_id", "site_id", "kind"),
+        {'schema': 'msr'},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    site_id: int = Field(sa_column=Column(Integer, ForeignKey("msr.sites.id"), nullable=False), description="처리시설 ID")
+    code: str = Field(max_length=64, unique=True, description="SCADA 태그 이름 (예: S01-FIT-101)")
+    name: str = Field(max_length=100, description="태그 설명")
+    kind: str = Field(default=TagKind.OTHER, max_length=16, description="계측 항목 종류 (TagKind)")
+    unit: str = Field(default="", max_length=16, description="단위 (예: m³/h, mg/L, NTU)")
+    is_active: bool = Field(default=True, description="사용 여부")
+
+    created_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now()),
+        description="레코드 생성 일시"
+    )
+    updated_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()),
+        description="레코드 마지막 업데이트 일시"
+    )
+
+
+class Measurement(rx.Model, table=True):
+    """
+    PostgreSQL의 msr.measurements 테이블에 매핑되는 모델. (측정값)
+
+    - ts 기준 월 단위 범위 파티션 테이블입니다. 파티션은 wims.domains.msr.partitions가 만듭니다.
+    - 기본 키 (tag_id, ts)는 태그별 구간 조회와 중복 적재 처리에, ts의 BRIN 인덱스는 시간 순서로
+      쌓이는 데이터의 시설 단위 구간 조회에 사용합니다.
+    - 초당 수만 건 적재 시 행마다 검사 비용이 들지 않도록 tags에 대한 외래 키는 두지 않으며,
+      적재 함수가 태그 ID를 확인합니다.
+    """
+    __tablename__ = "measurements"  # type: ignore
+    __table_args__ = (
+        Index("ix_msr_measurements_ts_brin", "ts", postgresql_using="brin"),
+        {'schema': 'msr', 'postgresql_partition_by': 'RANGE (ts)'},
+    )
+
+    tag_id: int = Field(primary_key=True, description="태그 ID")
+    ts: datetime = Field(primary_key=True, sa_type=TIMESTAMP(timezone=True), description="측정 시각")
+    value: float = Field(sa_column=Column(Float(53), nullable=False), description="측정값")
+    quality: int = Field(
+        default=Quality.GOOD, sa_column=Column(SmallInteger, nullable=False, server_default="0"),
+        description="품질 코드 (Quality)",
+    )
+
+
+class RollupFields(SQLModel):
+    """
+    측정값 집계 테이블(msr.rollup_1m/1h/1d)의 공통 열.
+    평균은 sum_value / count로 계산하며, 합계로 저장해야 적재 때마다 구간 값을 더해 갱신할 수 있습니다.
+    품질이 불량(Quality.BAD)인 값은 집계에서 제외합니다.
+    """
+    tag_id: int = Field(primary_key=True, description="태그 ID")
+    bucket: datetime = Field(primary_key=True, sa_type=TIMESTAMP(timezone=True), description="구간 시작 시각")
+    min_value: float = Field(description="최솟값")
+    max_value: float = Field(description="최댓값")
+    sum_value: float = Field(description="합계")
+    count: int = Field(description="측정값 수")
+    last_ts: datetime = Field(sa_type=TIMESTAMP(timezone=True), description="구간 마지막 측정 시각")
+    last_value: float = Field(description="구간 마지막 측정값")
+
+
+class Rollup1m(rx.Model, RollupFields, table=True):
+    """PostgreSQL의 msr.rollup_1m 테이블에 매핑되는 모델. (분 단위 집계)"""
+    __tablename__ = "rollup_1m"  # type: ignore
+    __table_args__ = {'schema': 'msr'}
+
+
+class Rollup1h(rx.Model, RollupFields, table=True):
+    """PostgreSQL의 msr.rollup_1h 테이블에 매핑되는 모델. (시 단위 집계)"""
+    __tablename__ = "rollup_1h"  # type: ignore
+    __table_args__ = {'schema': 'msr'}
+
+
+class Rollup1d(rx.Model, RollupFields, table=True):
+    """PostgreSQL의 msr.rollup_1d 테이블에 매핑되는 모델. (일 단위 집계, 현지 자정 기준)"""
+    __tablename__ = "rollup_1d"  # type: ignore
+    __table_args__ = {'schema': 'msr'}
+
+
+class ArchivedMonth(rx.Model, table=True):
+    """
+    PostgreSQL의 msr.archived_months 테이블에 매핑되는 모델.
+    Postgres에서 Parquet 보관소로 옮긴 (월, 처리시설) 목록입니다. 조회 계층은 이 목록으로 읽을 파일을 정합니다.
+    """
+    __tablename__ = "archived_months"  # type: ignore
+    __table_args__ = {'schema': 'msr'}
+
+    month: date = Field(primary_key=True, description="보관한 월 (1일)")
+    site_id: int = Field(primary_key=True, description="처리시설 ID (태그가 삭제된 측정값은 0)")
+    rows: int = Field(sa_type=BigInteger, description="보관한 측정값 수")
+    archived_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now()),
+        description="마지막 보관 일시"
+    )
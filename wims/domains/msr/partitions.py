@@ -0,0 +1,107 @@
+# /wims_project/wims/domains/msr/partitions.py
+"""
+msr.measurements의 월 단위 파티션을 관리합니다.
+
+- 파티션 이름은 measurements_pYYYYMM이며 경계는 UTC 기준 월 1일 0시입니다.
+- 적재 함수는 배치에 포함된 월의 파티션을 ensure_partitions()로 먼저 만들고,
+  주기 작업(jobs.py)이 다음 달 파티션을 미리 만들어 둡니다.
+- HOT_MONTHS보다 오래된 파티션은 Parquet 보관소로 옮긴 뒤 삭제합니다. (archive.py)
+- 여러 프로세스가 동시에 같은 파티션을 만들지 않도록 트랜잭션 advisory lock을 사용합니다.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+SCHEMA = "msr"
+PARENT_TABLE = "measurements"
+
+#  파티션 생성을 직렬화하는 advisory lock 키
+_PARTITION_LOCK_KEY = "msr.measurements.partitions"
+
+Month = Tuple[int, int]
+
+#  이 프로세스가 존재를 확인한 파티션 (월)
+_known: Set[Month] = set()
+_known_lock = threading.Lock()
+
+
+def month_start(month: Month) -> datetime:
+    year, mon = month
+    return datetime(year, mon, 1, tzinfo=timezone.utc)
+
+
+def next_month(month: Month) -> Month:
+    year, mon = month
+    return (year + mon // 12, mon % 12 + 1)
+
+
+def month_of(moment: datetime) -> Month:
+    moment = moment.astimezone(timezone.utc)
+    return (moment.year, moment.month)
+
+
+def months_between(start: datetime, end: datetime) -> List[Month]:
+    """[start, end) 구간이 걸치는 월 목록"""
+    months = []
+    month = month_of(start)
+    while month_start(month) < end:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def partition_name(month: Month) -> str:
+    return f"{PARENT_TABLE}_p{month[0]:04d}{month[1]:02d}"
+
+
+def existing_partitions(session: Session) -> List[Month]:
+    """DB에 있는 파티션의 월 목록 (오름차순)"""
+    names = session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": f"{SCHEMA}.{PARENT_TABLE}"},
+    ).scalars()
+    prefix = f"{PARENT_TABLE}_p"
+    return sorted(
+        (int(name[len(prefix):len(prefix) + 4]), int(name[len(prefix) + 4:]))
+        for name in names if name.startswith(prefix)
+    )
+
+
+def ensure_partitions(session: Session, months: Iterable[Month]) -> List[str]:
+    """
+    주어진 월의 파티션이 없으면 만들고, 새로 만든 파티션 이름 목록을 반환합니다.
+    이미 확인한 월은 DB에 묻지 않습니다. 적재가 실패해도 파티션은 남도록 바로 커밋합니다.
+    """
+    with _known_lock:
+        missing = sorted(set(months) - _known)
+    if not missing:
+        return []
+
+    session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": _PARTITION_LOCK_KEY})
+    existing = set(existing_partitions(session))
+    created = []
+    for month in missing:
+        name = partition_name(month)
+        if month not in existing:
+            session.execute(text(
+                f"CREATE TABLE {SCHEMA}.{name} PARTITION OF {SCHEMA}.{PARENT_TABLE} "
+                f"FOR VALUES FROM ('{month_start(month).isoformat()}') TO ('{month_start(next_month(month)).isoformat()}')"
+            ))
+            created.append(name)
+    session.commit()
+    with _known_lock:
+        _known.update(missing)
+    return created
+
+
+def forget_partition(month: Month):
+    """파티션을 분리/삭제한 뒤 호출하여 다음 적재 때 다시 확인하도록 합니다."""
+    with _known_lock:
+        _known.discard(month)
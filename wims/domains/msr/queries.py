@@ -0,0 +1,151 @@
+# /wims_project/wims/domains/msr/queries.py
+"""
+'msr' 도메인의 조회 쿼리를 모아둔 모듈입니다.
+
+측정값 구간은 행 객체 대신 열 단위 numpy 배열(Series)로 돌려주어 차트/집계에서 바로 사용합니다.
+모든 구간 조건은 [start, end)이며 ts 조건이 있으므로 해당 월의 파티션만 읽습니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import true
+from sqlmodel import Session, select
+
+from .models import Measurement, Tag
+
+
+@dataclass(frozen=True)
+class Series:
+    """태그 하나의 시계열. ts는 UTC 기준 Unix epoch 마이크로초입니다."""
+    tag_id: int
+    ts: np.ndarray
+    value: np.ndarray
+    quality: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+@dataclass(frozen=True)
+class LatestValue:
+    tag_id: int
+    site_id: int
+    code: str
+    name: str
+    kind: str
+    unit: str
+    ts: Optional[datetime]
+    value: Optional[float]
+    quality: Optional[int]
+
+
+def _to_epoch_us(values: List[datetime]) -> np.ndarray:
+    return np.array([int(value.timestamp() * 1_000_000) for value in values], dtype=np.int64)
+
+
+def site_tags(session: Session, site_id: int, kinds: Optional[Iterable[str]] = None) -> List[Tag]:
+    """처리시설의 사용 중인 태그 목록 (종류, 태그 이름순)"""
+    statement = select(Tag).where(Tag.site_id == site_id, Tag.is_active)
+    if kinds:
+        statement = statement.where(Tag.kind.in_(list(kinds)))
+    return list(session.exec(statement.order_by(Tag.kind, Tag.code)).all())
+
+
+def tag_series(session: Session, tag_id: int, start: datetime, end: datetime) -> Series:
+    """태그 하나의 [start, end) 측정값. 기본 키 (tag_id, ts) 인덱스 구간 조회입니다."""
+    return tags_series(session, [tag_id], start, end).get(tag_id) or Series(
+        tag_id, np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.int16)
+    )
+
+
+def tags_series(session: Session, tag_ids: Iterable[int], start: datetime, end: datetime) -> Dict[int, Series]:
+    """
+    여러 태그의 [start, end) 측정값을 한 번의 쿼리로 조회해 태그별 Series로 나눕니다.
+    데이터가 없는 태그는 결과에 포함되지 않습니다.
+    """
+    tag_ids = list(tag_ids)
+    if not tag_ids:
+        return {}
+    statement = (
+        select(Measurement.tag_id, Measurement.ts, Measurement.value, Measurement.quality)
+        .where(Measurement.tag_id.in_(tag_ids), Measurement.ts >= start, Measurement.ts < end)
+        .order_by(Measurement.tag_id, Measurement.ts)
+    )
+    rows = session.execute(statement).all()
+    if not rows:
+        return {}
+    tag_column, ts_column, value_column, quality_column = zip(*rows)
+    return split_by_tag(
+        np.array(tag_column, dtype=np.int32),
+        _to_epoch_us(ts_column),
+        np.array(value_column, dtype=np.float64),
+        np.array(quality_column, dtype=np.int16),
+    )
+
+
+def split_by_tag(tags: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray) -> Dict[int, Series]:
+    """(tag_id, ts) 순으로 정렬된 열 배열을 태그별 Series로 나눕니다."""
+    if not len(tags):
+        return {}
+    #  tag_id 순으로 정렬되어 있으므로 값이 바뀌는 위치에서 나눕니다.
+    bounds = np.flatnonzero(np.diff(tags)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [len(tags)]))
+    return {
+        int(tags[first]): Series(int(tags[first]), ts[first:last], value[first:last], quality[first:last])
+        for first, last in zip(starts, stops)
+    }
+
+
+def site_series(
+    session: Session, site_id: int, start: datetime, end: datetime, kinds: Optional[Iterable[str]] = None,
+) -> Dict[int, Series]:
+    """처리시설 태그 전체(또는 지정한 종류)의 [start, end) 측정값을 태그별로 조회합니다."""
+    tags = site_tags(session, site_id, kinds)
+    return tags_series(session, [tag.id for tag in tags], start, end)
+
+
+def latest_values(session: Session, site_id: int) -> List[LatestValue]:
+    """
+    처리시설 태그별 마지막 측정값. 태그마다 기본 키 인덱스를 역순으로 한 행만 읽습니다. (LATERAL)
+    측정값이 없는 태그는 ts/value/quality가 None입니다.
+    """
+    return _latest_values(session, Tag.site_id == site_id)
+
+
+def latest_values_all(session: Session, since: Optional[datetime] = None) -> List[LatestValue]:
+    """
+    사용 중인 모든 태그의 마지막 측정값 (처리시설, 종류, 태그 이름순).
+    since를 주면 그 이후의 값만 찾으므로 지난 달 파티션은 읽지 않습니다.
+    """
+    return _latest_values(session, true(), since)
+
+
+def _latest_values(session: Session, condition, since: Optional[datetime] = None) -> List[LatestValue]:
+    latest = (
+        select(Measurement.ts, Measurement.value, Measurement.quality)
+        .where(Measurement.tag_id == Tag.id)
+    )
+    if since is not None:
+        latest = latest.where(Measurement.ts >= since)
+    latest = latest.order_by(Measurement.ts.desc()).limit(1).lateral("latest")
+    statement = (
+        select(
+            Tag.id, Tag.site_id, Tag.code, Tag.name, Tag.kind, Tag.unit,
+            latest.c.ts, latest.c.value, latest.c.quality,
+        )
+        .select_from(Tag)
+        .outerjoin(latest, true())
+        .where(condition, Tag.is_active)
+        .order_by(Tag.site_id, Tag.kind, Tag.code)
+    )
+    return [
+        LatestValue(
+            tag_id=row.id, site_id=row.site_id, code=row.code, name=row.name, kind=row.kind, unit=row.unit,
+            ts=row.ts, value=row.value, quality=row.quality,
+        )
+        for row in session.execute(statement)
+    ]
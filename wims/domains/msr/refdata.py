@@ -0,0 +1,40 @@
+# /wims_project/wims/domains/msr/refdata.py
+"""
+'msr' 도메인의 참조 데이터를 프로세스 전역 캐시(wims.cache)에 등록합니다.
+msr.sites/msr.tags가 바뀌면 트리거 알림으로 모든 워커의 항목이 무효화됩니다.
+"""
+
+from typing import Dict, Tuple
+
+from sqlmodel import Session, select
+
+from ... import cache
+from .models import Site, Tag
+
+TAG_IDS = "msr.tag_ids"
+SITES = "msr.sites"
+
+
+def fetch_tag_ids(session: Session) -> Dict[str, int]:
+    """SCADA 태그 이름 -> 태그 ID (사용 중인 태그만)"""
+    return dict(session.execute(select(Tag.code, Tag.id).where(Tag.is_active)).all())
+
+
+def fetch_sites(session: Session) -> Tuple[Site, ...]:
+    """사용 중인 처리시설 목록 (정렬 순서, 이름순)"""
+    statement = select(Site).where(Site.is_active).order_by(Site.sort_order, Site.name)
+    return tuple(session.exec(statement).all())
+
+
+cache.register(TAG_IDS, fetch_tag_ids, tables=["msr.tags"])
+cache.register(SITES, fetch_sites, tables=["msr.sites"])
+
+
+async def get_tag_ids() -> Dict[str, int]:
+    """캐시된 태그 조회표를 반환합니다. (수정하지 말 것)"""
+    return await cache.get(TAG_IDS)
+
+
+async def get_sites() -> Tuple[Site, ...]:
+    """캐시된 처리시설 목록을 반환합니다."""
+    return await cache.get(SITES)
@@ -0,0 +1,380 @@
+# /wims_project/wims/domains/msr/rollups.py
+"""
+측정값 집계(rollup) 테이블 관리와 차트용 구간 조회입니다.
+
+집계 갱신
+    - 적재 시 배치를 numpy로 분/시/일 단위로 집계(downsample.aggregate)한 뒤 집계 테이블에
+      INSERT ... ON CONFLICT DO UPDATE로 더합니다. (min/max는 LEAST/GREATEST, sum/count는 합산,
+      last는 더 늦은 시각의 값) 적재 트랜잭션 안에서 실행되므로 원시 값과 집계가 항상 같이 커밋됩니다.
+    - 값을 덮어쓰는 적재(dedupe)나 과거 구간 재계산은 rebuild()가 원시 값에서 SQL로 다시 계산합니다.
+      보관소(Parquet)로 옮긴 월이 걸친 구간은 Postgres에 원시 값이 없으므로, 보관 값과 합친 원시 값을
+      numpy로 다시 집계합니다. (월 단위로 나눠 판단)
+
+차트 조회 (chart_series)
+    요청 구간과 화면 폭(픽셀)으로 해상도를 고릅니다.
+    1. 구간 길이를 기준으로 가져올 행이 ROLLUP_FETCH_LIMIT 이하인 가장 세밀한 집계 단위를 고릅니다.
+    2. 분 단위 집계로도 픽셀보다 구간이 굵으면 분 집계의 count 합으로 원시 값 수를 확인하고,
+       RAW_FETCH_LIMIT 이하이면 원시 값(보관소로 옮긴 월 포함)을 읽어 LTTB로 줄입니다.
+    3. 집계 행이 픽셀 수보다 많으면 픽셀 구간으로 다시 묶어(min/max/평균) 돌려줍니다.
+    어떤 구간을 요청해도 DB에서 읽는 행 수에 상한이 있으므로 응답 시간이 구간 길이에 비례하지 않습니다.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from zoneinfo import ZoneInfo
+
+import numpy as np
+from sqlalchemy import Integer, any_, bindparam, case, delete, func, insert, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array_agg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session
+
+from .downsample import Aggregates, aggregate, bucket_start, lttb
+from .models import Measurement, Quality, Rollup1d, Rollup1h, Rollup1m, RollupFields
+
+#  일 집계 경계(현지 자정)와 시간대 없는 SCADA 시각 해석에 사용하는 시간대
+LOCAL_TZ = ZoneInfo(os.getenv("WIMS_MSR_SCADA_TZ", "Asia/Seoul"))
+#  구간 경계를 UTC에서 옮기는 양(초). 일광 절약 시간이 없는 시간대를 가정합니다.
+_LOCAL_OFFSET = int(LOCAL_TZ.utcoffset(datetime(2000, 1, 1)).total_seconds())
+
+#  차트 한 번에 읽는 집계/원시 행 수 상한
+ROLLUP_FETCH_LIMIT = 20_000
+RAW_FETCH_LIMIT = 50_000
+#  픽셀당 점 수 (LTTB 결과 점 수 = 화면 폭 x POINTS_PER_PIXEL)
+POINTS_PER_PIXEL = 2
+
+#  집계 테이블에 한 문으로 보내는 행 수
+UPSERT_BATCH_SIZE = 1000
+
+_US = 1_000_000
+
+
+@dataclass(frozen=True)
+class Resolution:
+    name: str
+    #  구간 길이(초). 원시 값은 0.
+    seconds: int
+    model: Optional[Type[RollupFields]]
+
+
+RAW = Resolution("raw", 0, None)
+MINUTE = Resolution("1m", 60, Rollup1m)
+HOUR = Resolution("1h", 3600, Rollup1h)
+DAY = Resolution("1d", 86400, Rollup1d)
+ROLLUPS = (MINUTE, HOUR, DAY)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_datetimes(values: np.ndarray) -> List[datetime]:
+    return [moment.replace(tzinfo=timezone.utc) for moment in values.astype("datetime64[us]").tolist()]
+
+
+def _to_epoch_us(moment: datetime) -> int:
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def _floor(moment: datetime, resolution: Resolution) -> datetime:
+    """moment가 속한 집계 구간의 시작 시각"""
+    width = resolution.seconds * _US
+    return _EPOCH + timedelta(microseconds=(_to_epoch_us(moment) + _LOCAL_OFFSET * _US) // width * width - _LOCAL_OFFSET * _US)
+
+
+def rollup_points(tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray) -> Dict[Resolution, Aggregates]:
+    """원시 측정값을 분 -> 시 -> 일 순으로 집계합니다. 각 단계는 앞 단계의 집계를 다시 묶습니다."""
+    good = quality != Quality.BAD
+    source = Aggregates.from_points(tag_id[good], ts[good], value[good])
+    result = {}
+    for resolution in ROLLUPS:
+        source = aggregate(source, bucket_start(source.bucket, resolution.seconds * _US, _LOCAL_OFFSET * _US))
+        result[resolution] = source
+    return result
+
+
+def _upsert_statement(model: Type[RollupFields]):
+    table = model.__table__
+    statement = pg_insert(table)
+    excluded = statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.tag_id, table.c.bucket],
+        set_={
+            "min_value": func.least(table.c.min_value, excluded.min_value),
+            "max_value": func.greatest(table.c.max_value, excluded.max_value),
+            "sum_value": table.c.sum_value + excluded.sum_value,
+            "count": table.c.count + excluded.count,
+            "last_value": case((excluded.last_ts >= table.c.last_ts, excluded.last_value), else_=table.c.last_value),
+            "last_ts": func.greatest(table.c.last_ts, excluded.last_ts),
+        },
+    )
+
+
+def apply_points(session: Session, tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray) -> int:
+    """
+    새로 적재한 측정값을 집계 테이블에 더합니다. 커밋하지 않습니다.
+    같은 (tag_id, ts)를 다시 적재하면 두 번 더해지므로, 값을 덮어쓰는 적재에는 rebuild()를 사용합니다.
+
+    Returns:
+        int: 갱신한 집계 행 수 (모든 단위 합계).
+    """
+    updated = 0
+    for resolution, agg in rollup_points(tag_id, ts, value, quality).items():
+        if not len(agg):
+            continue
+        rows = [
+            {
+                "tag_id": tag, "bucket": bucket, "min_value": low, "max_value": high, "sum_value": total,
+                "count": count, "last_ts": last_ts, "last_value": last_value,
+            }
+            for tag, bucket, low, high, total, count, last_ts, last_value in zip(
+                agg.tag_id.tolist(), _to_datetimes(agg.bucket), agg.min.tolist(), agg.max.tolist(),
+                agg.sum.tolist(), agg.count.tolist(), _to_datetimes(agg.last_ts), agg.last_value.tolist(),
+            )
+        ]
+        statement = _upsert_statement(resolution.model)
+        #  행 잠금 순서가 (tag_id, bucket)으로 일정하므로 동시 적재끼리 교착되지 않습니다.
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            session.execute(statement, rows[start:start + UPSERT_BATCH_SIZE])
+        updated += len(rows)
+    return updated
+
+
+def _bucket_expr(column, seconds: int):
+    """SQL에서 bucket_start()와 같은 구간 시작 시각을 계산하는 식"""
+    return func.to_timestamp(
+        func.floor((func.extract("epoch", column) + _LOCAL_OFFSET) / seconds) * seconds - _LOCAL_OFFSET
+    )
+
+
+def local_day_range(start: datetime, end: datetime):
+    """[start, end)를 포함하는 현지 자정 기준 일 구간"""
+    first = _floor(start, DAY)
+    last = _floor(end, DAY)
+    return first, last if last == end else last + timedelta(days=1)
+
+
+def rebuild(session: Session, tag_ids: Sequence[int], start: datetime, end: datetime) -> int:
+    """
+    태그들의 [start, end)를 포함하는 일 구간 집계를 원시 값에서 다시 계산합니다. 커밋하지 않습니다.
+
+    구간을 월(현지 자정 경계) 단위로 나눠, 보관소로 옮긴 값이 없는 구간은 SQL로(_rebuild_sql),
+    보관된 (처리시설, 월)이 걸친 구간은 보관 값과 합친 원시 값으로(_rebuild_merged) 다시 계산합니다.
+    Postgres 원시 값만으로 계산하면 보관된 기간의 집계가 지워지기 때문입니다.
+
+    Returns:
+        int: 새로 쓴 집계 행 수 (모든 단위 합계).
+    """
+    #  보관소 조회(pyarrow)는 필요할 때만 불러옵니다. (chart_series 참고)
+    from .archive import archived_parts
+    from .partitions import month_start, months_between, next_month
+
+    tag_ids = sorted(set(int(tag) for tag in tag_ids))
+    if not tag_ids:
+        return 0
+    start, end = local_day_range(start, end)
+    written = 0
+    for month in months_between(start, end):
+        chunk_start = max(start, _floor(month_start(month), DAY))
+        chunk_end = min(end, _floor(month_start(next_month(month)), DAY))
+        if chunk_start >= chunk_end:
+            continue
+        if archived_parts(session, tag_ids, chunk_start, chunk_end):
+            written += _rebuild_merged(session, tag_ids, chunk_start, chunk_end)
+        else:
+            written += _rebuild_sql(session, tag_ids, chunk_start, chunk_end)
+    return written
+
+
+def _rebuild_sql(session: Session, tag_ids: List[int], start: datetime, end: datetime) -> int:
+    """[start, end)(현지 자정 경계)의 집계를 Postgres 원시 값에서 SQL로 다시 계산합니다."""
+    tags = bindparam("tag_ids", tag_ids, type_=ARRAY(Integer))
+    written = 0
+    source = Measurement
+    for resolution in ROLLUPS:
+        target = resolution.model
+        if source is Measurement:
+            ts_column = Measurement.ts
+            columns = (
+                func.min(Measurement.value), func.max(Measurement.value), func.sum(Measurement.value),
+                func.count(), func.max(Measurement.ts),
+                array_agg(aggregate_order_by(Measurement.value, Measurement.ts.desc()))[1],
+            )
+            condition = Measurement.quality != Quality.BAD
+        else:
+            ts_column = source.bucket
+            columns = (
+                func.min(source.min_value), func.max(source.max_value), func.sum(source.sum_value),
+                func.sum(source.count), func.max(source.last_ts),
+                array_agg(aggregate_order_by(source.last_value, source.last_ts.desc()))[1],
+            )
+            condition = true()
+        bucket = _bucket_expr(ts_column, resolution.seconds)
+        aggregated = (
+            select(source.tag_id, bucket, *columns)
+            .where(source.tag_id == any_(tags), ts_column >= start, ts_column < end, condition)
+            .group_by(source.tag_id, bucket)
+        )
+        session.execute(
+            delete(target).where(target.tag_id == any_(tags), target.bucket >= start, target.bucket < end)
+        )
+        result = session.execute(
+            insert(target).from_select(
+                ["tag_id", "bucket", "min_value", "max_value", "sum_value", "count", "last_ts", "last_value"],
+                aggregated,
+            )
+        )
+        written += result.rowcount
+        source = target
+    return written
+
+
+def _delete_rollups(session: Session, tag_ids: List[int], start: datetime, end: datetime):
+    tags = bindparam("tag_ids", tag_ids, type_=ARRAY(Integer))
+    for resolution in ROLLUPS:
+        target = resolution.model
+        session.execute(
+            delete(target).where(target.tag_id == any_(tags), target.bucket >= start, target.bucket < end)
+        )
+
+
+def _rebuild_merged(session: Session, tag_ids: List[int], start: datetime, end: datetime) -> int:
+    """
+    [start, end)(현지 자정 경계)의 집계를 Postgres와 보관소 값을 합친 원시 값에서 다시 계산합니다.
+    같은 (tag_id, ts)는 Postgres 값을 씁니다. 메모리를 제한하기 위해 태그마다 한 달 구간씩 읽습니다.
+    """
+    from .archive import tag_series_merged
+
+    _delete_rollups(session, tag_ids, start, end)
+    written = 0
+    for tag_id in tag_ids:
+        series = tag_series_merged(session, tag_id, start, end)
+        if len(series.ts):
+            tags = np.full(len(series.ts), tag_id, dtype=np.int32)
+            #  지운 구간에 더하므로 upsert가 그대로 새 값이 됩니다.
+            written += apply_points(session, tags, series.ts, series.value, series.quality)
+    return written
+
+
+def day_means(session: Session, moment: datetime) -> Dict[int, Tuple[float, datetime]]:
+    """moment가 속한 현지 일의 태그별 (평균, 마지막 측정 시각). 일 집계 테이블만 읽습니다."""
+    statement = select(
+        Rollup1d.tag_id, Rollup1d.sum_value / Rollup1d.count, Rollup1d.last_ts,
+    ).where(Rollup1d.bucket == _floor(moment, DAY), Rollup1d.count > 0)
+    return {tag_id: (mean, last_ts) for tag_id, mean, last_ts in session.execute(statement)}
+
+
+@dataclass(frozen=True)
+class ChartSeries:
+    """차트용 시계열. ts는 UTC epoch 마이크로초이며, 원시 값이면 min/max/value가 같습니다."""
+    resolution: str
+    ts: np.ndarray
+    value: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def to_records(self) -> List[dict]:
+        """차트 컴포넌트 데이터 형식 ([{"ts": epoch 밀리초, "value", "min", "max"}, ...])"""
+        return [
+            {"ts": ts, "value": value, "min": low, "max": high}
+            for ts, value, low, high in zip(
+                (self.ts // 1000).tolist(), self.value.tolist(), self.min.tolist(), self.max.tolist()
+            )
+        ]
+
+
+def choose_resolution(span_seconds: float, max_points: int) -> Resolution:
+    """
+    구간 길이에 맞는 집계 단위를 고릅니다.
+    가져올 집계 행이 ROLLUP_FETCH_LIMIT 이하인 가장 세밀한 단위이며, 분 단위 구간 수가 max_points 이하이면
+    원시 값 후보(RAW)를 반환합니다. (원시 값 수는 호출자가 분 집계로 확인)
+    """
+    if span_seconds / MINUTE.seconds <= max_points:
+        return RAW
+    for resolution in ROLLUPS:
+        if span_seconds / resolution.seconds <= ROLLUP_FETCH_LIMIT:
+            return resolution
+    return DAY
+
+
+def _fetch_rollup(session: Session, resolution: Resolution, tag_id: int, start: datetime, end: datetime) -> Aggregates:
+    model = resolution.model
+    statement = (
+        select(
+            model.bucket, model.min_value, model.max_value, model.sum_value,
+            model.count, model.last_ts, model.last_value,
+        )
+        .where(
+            model.tag_id == tag_id,
+            model.bucket >= _floor(start, resolution),
+            model.bucket < end,
+        )
+        .order_by(model.bucket)
+        .limit(ROLLUP_FETCH_LIMIT)
+    )
+    rows = session.execute(statement).all()
+    if not rows:
+        empty = np.empty(0)
+        return Aggregates(np.empty(0, np.int32), np.empty(0, np.int64), empty, empty, empty,
+                          np.empty(0, np.int64), np.empty(0, np.int64), empty)
+    bucket, low, high, total, count, last_ts, last_value = zip(*rows)
+    return Aggregates(
+        tag_id=np.full(len(rows), tag_id, dtype=np.int32),
+        bucket=np.array([_to_epoch_us(moment) for moment in bucket], dtype=np.int64),
+        min=np.array(low, dtype=np.float64),
+        max=np.array(high, dtype=np.float64),
+        sum=np.array(total, dtype=np.float64),
+        count=np.array(count, dtype=np.int64),
+        last_ts=np.array([_to_epoch_us(moment) for moment in last_ts], dtype=np.int64),
+        last_value=np.array(last_value, dtype=np.float64),
+    )
+
+
+def _raw_count(session: Session, tag_id: int, start: datetime, end: datetime) -> int:
+    statement = select(func.coalesce(func.sum(Rollup1m.count), 0)).where(
+        Rollup1m.tag_id == tag_id, Rollup1m.bucket >= _floor(start, MINUTE), Rollup1m.bucket < end,
+    )
+    return int(session.execute(statement).scalar_one())
+
+
+def chart_series(session: Session, tag_id: int, start: datetime, end: datetime, width_px: int) -> ChartSeries:
+    """
+    태그 하나의 [start, end) 구간을 화면 폭(픽셀)에 맞는 해상도로 조회합니다.
+    돌려주는 점 수는 원시 값이면 width_px * POINTS_PER_PIXEL, 집계이면 width_px 이하입니다.
+    """
+    width_px = max(int(width_px), 10)
+    max_points = width_px * POINTS_PER_PIXEL
+    span = (end - start).total_seconds()
+    resolution = choose_resolution(span, max_points)
+
+    if resolution is RAW:
+        if _raw_count(session, tag_id, start, end) <= RAW_FETCH_LIMIT:
+            #  보관 파일 조회(pyarrow)는 원시 조회 때만 불러옵니다. (대시보드/적재 프로세스 시작 시간 단축)
+            from .archive import tag_series_merged
+
+            series = tag_series_merged(session, tag_id, start, end)
+            ts, value = series.ts, series.value
+            if len(ts) > max_points:
+                keep = lttb(ts, value, max_points)
+                ts, value = ts[keep], value[keep]
+            return ChartSeries(RAW.name, ts, value, value, value)
+        resolution = MINUTE
+
+    agg = _fetch_rollup(session, resolution, tag_id, start, end)
+    if len(agg) > width_px:
+        #  픽셀 구간으로 다시 묶습니다.
+        start_us = _to_epoch_us(start)
+        pixel = max(int(span * _US) // width_px, 1)
+        agg = aggregate(agg, (agg.bucket - start_us) // pixel * pixel + start_us)
+    return ChartSeries(resolution.name, agg.bucket, agg.mean, agg.min, agg.max)
+
+
+def chart_series_many(
+    session: Session, tag_ids: Iterable[int], start: datetime, end: datetime, width_px: int,
+) -> Dict[int, ChartSeries]:
+    """여러 태그의 chart_series()"""
+    return {tag_id: chart_series(session, tag_id, start, end, width_px) for tag_id in tag_ids}
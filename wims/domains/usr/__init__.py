@@ -0,0 +1,20 @@
+# /wims_project/wims/domains/usr/__init__.py
+"""'usr'(사용자/부서 관리) 도메인 선언입니다. (wims.domains 레지스트리 참고)"""
+
+from .. import Domain, Page
+
+USERS_ROUTE = "/admin/users"
+DEPARTMENTS_ROUTE = "/admin/departments"
+
+DOMAIN = Domain(
+    name="usr",
+    models=("wims.domains.usr.models",),
+    menus=("wims.domains.usr.menu",),
+    states=("wims.domains.usr.state",),
+    pages=(
+        Page(USERS_ROUTE, "wims.domains.usr.pages:user_admin_page"),
+        Page(DEPARTMENTS_ROUTE, "wims.domains.usr.pages:department_admin_page"),
+    ),
+    routers=("wims.domains.usr.export:router",),
+    jobs=("wims.domains.usr.jobs",),
+)
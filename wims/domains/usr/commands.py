@@ -0,0 +1,282 @@
+# /wims_project/wims/domains/usr/commands.py
+"""
+'usr' 도메인의 데이터 변경(생성/수정/삭제) 로직을 모아둔 모듈입니다.
+모든 함수는 동기 Session을 첫 인자로 받으며 `wims.db.run()`으로 실행됩니다.
+생성/수정은 (오류 메시지, 저장된 행)을, 삭제는 실패 시 메시지를 반환하며,
+일괄 작업(bulk_*)은 행별 처리 결과를 담은 BulkResult를 반환합니다.
+State는 반환된 행으로 화면 목록의 해당 항목만 고칩니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Integer, Row, any_, bindparam, delete, exists, insert, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from .models import Department, User, UserRole
+
+#  일괄 작업의 행별 처리 결과
+BULK_OK = "ok"
+BULK_NOT_FOUND = "not_found"
+BULK_PROTECTED = "protected"
+
+BULK_STATUS_LABELS = {
+    BULK_OK: "처리됨",
+    BULK_NOT_FOUND: "사용자를 찾을 수 없음",
+    BULK_PROTECTED: "관리자 계정은 변경/삭제할 수 없음",
+}
+
+
+#  유일/외래 키 제약 이름(PostgreSQL 기본 이름) -> 사용자에게 보여줄 메시지
+CONSTRAINT_MESSAGES = {
+    "users_login_id_key": "이미 사용 중인 로그인 ID입니다.",
+    "users_email_key": "이미 등록된 이메일입니다.",
+    "users_code_key": "이미 사용 중인 사용자 코드입니다.",
+    "users_department_id_fkey": "부서를 찾을 수 없습니다.",
+    "departments_code_key": "이미 사용 중인 부서 코드입니다.",
+    "departments_name_key": "이미 사용 중인 부서 이름입니다.",
+}
+
+#  사용자 수정 폼에서 변경할 수 있는 컬럼 (login_id, 비밀번호, 생성/수정 일시는 제외)
+_USER_EDITABLE_FIELDS = ("email", "name", "role", "department_id", "code", "is_active")
+
+#  생성/수정 후 화면 목록을 고치는 데 필요한 사용자 컬럼
+_USER_ROW_COLUMNS = (User.id, User.login_id, User.name, User.email, User.role, User.is_active, User.department_id)
+
+
+def _constraint_message(error: IntegrityError) -> str:
+    """
+    제약 위반 오류를 사용자 메시지로 변환합니다.
+    psycopg2는 diag.constraint_name으로, asyncpg는 원인 예외의 constraint_name으로 제약 이름을 제공합니다.
+    """
+    orig = error.orig
+    name = getattr(getattr(orig, "diag", None), "constraint_name", None) or getattr(
+        getattr(orig, "__cause__", None), "constraint_name", None
+    )
+    if name in CONSTRAINT_MESSAGES:
+        return CONSTRAINT_MESSAGES[name]
+    #  드라이버가 제약 이름을 제공하지 않으면 오류 메시지에서 찾습니다.
+    text = str(orig)
+    return next(
+        (message for constraint, message in CONSTRAINT_MESSAGES.items() if constraint in text),
+        "입력한 값이 다른 데이터와 충돌합니다.",
+    )
+
+
+def _execute_one(session: Session, statement) -> Tuple[Optional[str], Optional[Row]]:
+    """
+    쓰기 문 하나를 실행하고 커밋합니다.
+    유일성 검사를 미리 조회하지 않고 제약 위반을 메시지로 변환하므로, 조회와 저장 사이의 경쟁도 생기지 않습니다.
+
+    Returns:
+        Tuple[Optional[str], Optional[Row]]: (오류 메시지, RETURNING 결과 행)
+    """
+    try:
+        row = session.execute(statement).first()
+        session.commit()
+    except IntegrityError as e:
+        session.rollback()
+        return _constraint_message(e), None
+    return None, row
+
+
+def _user_values(form_data: dict, fields: Sequence[str]) -> dict:
+    """폼 문자열 값을 컬럼 타입에 맞게 변환합니다. (빈 문자열은 None)"""
+    values = {}
+    for key in fields:
+        if key not in form_data:
+            continue
+        value = form_data[key]
+        if key == "role":
+            if value:
+                values[key] = int(UserRole(int(value)))
+        elif key == "department_id":
+            values[key] = int(value) if value else None
+        elif key == "is_active":
+            values[key] = str(value).lower() in ["true", "1"]
+        else:
+            values[key] = value or None
+    return values
+
+
+def _user_row_statement(dml):
+    """
+    INSERT/UPDATE 문을 부서명까지 돌려주는 단일 문으로 감쌉니다.
+
+        WITH changed AS (<INSERT|UPDATE> ... RETURNING id, login_id, ...)
+        SELECT changed.*, departments.name AS department_name
+        FROM changed LEFT JOIN usr.departments ON departments.id = changed.department_id
+    """
+    changed = dml.returning(*_USER_ROW_COLUMNS).cte("changed")
+    return select(changed, Department.name.label("department_name")).select_from(
+        changed.outerjoin(Department, Department.id == changed.c.department_id)
+    )
+
+
+def create_user(session: Session, form_data: dict, password_hash: str) -> Tuple[Optional[str], Optional[Row]]:
+    """사용자를 생성하고 생성된 행을 반환합니다. (INSERT ... RETURNING 한 번)"""
+    values = {"is_active": True, **_user_values(form_data, _USER_EDITABLE_FIELDS)}
+    #  폼에서 역할을 고르지 않았으면 일반 사용자로 만듭니다. (모델 기본값은 ORM 경로에만 적용됨)
+    values.setdefault("role", int(UserRole.GENERAL_USER))
+    statement = insert(User).values(login_id=form_data.get("login_id"), password_hash=password_hash, **values)
+    return _execute_one(session, _user_row_statement(statement))
+
+
+def update_user(session: Session, form_data: dict) -> Tuple[Optional[str], Optional[Row]]:
+    """
+    폼 데이터로 사용자 정보를 수정하고 수정된 행을 반환합니다.
+    (login_id, 비밀번호는 변경하지 않음, UPDATE ... RETURNING 한 번)
+    """
+    user_id = int(form_data.get("id", 0))
+    statement = update(User).where(User.id == user_id).values(**_user_values(form_data, _USER_EDITABLE_FIELDS))
+    error, row = _execute_one(session, _user_row_statement(statement))
+    if error is None and row is None:
+        error = "사용자를 찾을 수 없습니다."
+    return error, row
+
+
+def delete_user(session: Session, user_id: int) -> Optional[str]:
+    """사용자를 삭제합니다. 관리자 계정은 삭제할 수 없습니다. (일괄 삭제와 같은 단일 문)"""
+    outcome = bulk_delete_users(session, [user_id]).outcomes[int(user_id)]
+    if outcome == BULK_NOT_FOUND:
+        return "사용자를 찾을 수 없습니다."
+    if outcome == BULK_PROTECTED:
+        return "관리자 계정은 삭제할 수 없습니다."
+    return None
+
+
+def _department_result(session: Session, statement) -> Tuple[Optional[str], Optional[Department]]:
+    """부서 INSERT/UPDATE 문을 RETURNING 전체 컬럼으로 실행하고 결과를 Department로 만듭니다."""
+    error, row = _execute_one(session, statement.returning(*Department.__table__.columns))
+    return error, Department(**row._mapping) if row else None
+
+
+def create_department(session: Session, form_data: dict) -> Tuple[Optional[str], Optional[Department]]:
+    """부서를 생성하고 생성된 부서를 반환합니다. (INSERT ... RETURNING 한 번)"""
+    statement = insert(Department).values(
+        code=form_data.get("code"),
+        name=form_data.get("name"),
+        notes=form_data.get("notes"),
+    )
+    return _department_result(session, statement)
+
+
+def update_department(session: Session, form_data: dict) -> Tuple[Optional[str], Optional[Department]]:
+    """부서 이름과 비고를 수정하고 수정된 부서를 반환합니다. (UPDATE ... RETURNING 한 번)"""
+    statement = (
+        update(Department)
+        .where(Department.id == int(form_data.get("id", 0)))
+        .values(name=form_data.get("name"), notes=form_data.get("notes"))
+    )
+    error, department = _department_result(session, statement)
+    if error is None and department is None:
+        error = "부서를 찾을 수 없습니다."
+    return error, department
+
+
+def delete_department(session: Session, dept_id: int) -> Optional[str]:
+    """
+    부서를 삭제합니다. 소속된 사용자가 있으면 삭제할 수 없습니다.
+
+        WITH deleted AS (DELETE FROM usr.departments WHERE id = :id
+                         AND NOT EXISTS (SELECT 1 FROM usr.users WHERE department_id = :id) RETURNING id)
+        SELECT EXISTS (SELECT 1 FROM usr.users WHERE department_id = :id)
+
+    삭제와 소속 사용자 확인이 같은 스냅샷에서 한 문으로 실행됩니다.
+    """
+    has_users = exists().where(User.department_id == dept_id)
+    deleted = (
+        delete(Department)
+        .where(Department.id == dept_id, ~has_users)
+        .returning(Department.id)
+        .cte("deleted")
+    )
+    error, row = _execute_one(session, select(has_users).add_cte(deleted))
+    if error:
+        #  삭제 직전에 다른 관리자가 사용자를 이 부서에 배정한 경우 (외래 키 위반)
+        return "소속된 사용자가 있어 부서를 삭제할 수 없습니다."
+    if row[0]:
+        return "소속된 사용자가 있어 부서를 삭제할 수 없습니다."
+    return None
+
+
+@dataclass
+class BulkResult:
+    """
+    일괄 작업 결과. outcomes는 user_id -> 처리 결과(BULK_*)입니다.
+    제약 위반으로 문 전체가 취소되면 error에 메시지가 담기며 아무 행도 바뀌지 않습니다.
+    """
+    outcomes: Dict[int, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def ids_with(self, status: str) -> List[int]:
+        return sorted(user_id for user_id, outcome in self.outcomes.items() if outcome == status)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in BULK_STATUS_LABELS}
+        for outcome in self.outcomes.values():
+            counts[outcome] += 1
+        return counts
+
+
+def _run_bulk(session: Session, user_ids: Sequence[int], dml, protect_admin: bool) -> BulkResult:
+    """
+    UPDATE/DELETE 문 하나를 대상 조회와 함께 단일 SQL 문으로 실행하고 행별 결과를 만듭니다.
+
+        WITH targets AS (SELECT id, role FROM usr.users WHERE id = ANY(:ids)),
+             changed AS (<UPDATE|DELETE> ... WHERE id = ANY(:ids) [AND role <> ADMIN] RETURNING id)
+        SELECT targets.id, targets.role, changed.id IS NOT NULL
+        FROM targets LEFT JOIN changed ON changed.id = targets.id
+
+    두 CTE는 같은 스냅샷을 보므로 targets에는 변경 전 역할이 담깁니다.
+    """
+    ids = sorted(set(int(user_id) for user_id in user_ids))
+    result = BulkResult(outcomes={user_id: BULK_NOT_FOUND for user_id in ids})
+    if not ids:
+        return result
+
+    ids_param = bindparam("ids", ids, type_=ARRAY(Integer))
+    targets = select(User.id, User.role).where(User.id == any_(ids_param)).cte("targets")
+    dml = dml.where(User.id == any_(ids_param))
+    if protect_admin:
+        dml = dml.where(User.role != int(UserRole.ADMIN))
+    changed = dml.returning(User.id).cte("changed")
+
+    statement = select(targets.c.id, targets.c.role, changed.c.id.is_not(None)).select_from(
+        targets.outerjoin(changed, changed.c.id == targets.c.id)
+    )
+    try:
+        rows = session.execute(statement).all()
+        session.commit()
+    except IntegrityError as e:
+        #  예: 그사이 삭제된 부서로 변경 (users_department_id_fkey)
+        session.rollback()
+        return BulkResult(error=_constraint_message(e))
+    for user_id, role, was_changed in rows:
+        if was_changed:
+            result.outcomes[user_id] = BULK_OK
+        elif protect_admin and role == UserRole.ADMIN:
+            result.outcomes[user_id] = BULK_PROTECTED
+    return result
+
+
+def bulk_set_active(session: Session, user_ids: Sequence[int], is_active: bool) -> BulkResult:
+    """선택된 사용자를 일괄 활성화/비활성화합니다. 관리자 계정은 비활성화할 수 없습니다."""
+    return _run_bulk(session, user_ids, update(User).values(is_active=is_active), protect_admin=not is_active)
+
+
+def bulk_change_department(session: Session, user_ids: Sequence[int], department_id: Optional[int]) -> BulkResult:
+    """선택된 사용자의 부서를 일괄 변경합니다. department_id가 None이면 부서를 비웁니다."""
+    return _run_bulk(session, user_ids, update(User).values(department_id=department_id), protect_admin=False)
+
+
+def bulk_change_role(session: Session, user_ids: Sequence[int], role: UserRole) -> BulkResult:
+    """선택된 사용자의 역할을 일괄 변경합니다. 관리자 계정의 역할은 바꿀 수 없습니다."""
+    return _run_bulk(session, user_ids, update(User).values(role=int(role)), protect_admin=True)
+
+
+def bulk_delete_users(session: Session, user_ids: Sequence[int]) -> BulkResult:
+    """선택된 사용자를 일괄 삭제합니다. 관리자 계정은 삭제할 수 없습니다."""
+    return _run_bulk(session, user_ids, delete(User), protect_admin=True)
@@ -0,0 +1,226 @@
+# /wims_project/wims/domains/usr/export.py
+"""
+사용자/부서 목록을 CSV, Parquet, Arrow IPC로 내려받는 스트리밍 내보내기 엔드포인트입니다.
+
+- 서버 측 커서(stream_results)로 EXPORT_CHUNK_ROWS행씩 읽고, 읽은 묶음을 바로 인코딩해 전송합니다.
+  테이블 크기와 관계없이 메모리에는 한 묶음만 올라갑니다.
+- 부서 이름은 SQL의 LEFT JOIN으로 함께 조회합니다.
+- 요청은 UserAdminState가 권한 확인 후 발급한 짧은 수명의 토큰(wims.tokens)으로 인증합니다.
+
+경로: GET /api/usr/export/{users|departments}.{csv|parquet|arrow}?token=...
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterator, List, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlmodel import select
+
+from ... import db, tokens
+from .models import Department, User, UserRole
+
+#  서버 측 커서에서 한 번에 가져오는 행 수 (= Parquet row group / Arrow record batch 크기)
+EXPORT_CHUNK_ROWS = 10_000
+#  다운로드 토큰 용도와 유효 시간
+EXPORT_TOKEN_PURPOSE = "usr-export"
+EXPORT_TOKEN_TTL = 60
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+router = APIRouter(prefix="/api/usr/export")
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """내보내기 대상: 조회 문, 열 스키마, 조회 결과를 열 값으로 바꾸는 변환 함수"""
+    statement: Callable[[], Select]
+    schema: pa.Schema
+    convert: Callable[[List[list]], List[list]]
+
+
+def _users_statement() -> Select:
+    return (
+        select(
+            User.id, User.login_id, User.name, User.email, User.role,
+            Department.code, Department.name, User.code, User.is_active,
+            User.created_at, User.updated_at,
+        )
+        .select_from(User)
+        .outerjoin(Department, Department.id == User.department_id)
+        .order_by(User.id)
+    )
+
+
+def _convert_users(columns: List[list]) -> List[list]:
+    columns[4] = [UserRole(role).name for role in columns[4]]
+    return columns
+
+
+def _departments_statement() -> Select:
+    return select(
+        Department.id, Department.code, Department.name, Department.notes,
+        Department.sort_order, Department.site_list, Department.created_at, Department.updated_at,
+    ).order_by(Department.id)
+
+
+_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+EXPORTS = {
+    "users": ExportSpec(
+        statement=_users_statement,
+        schema=pa.schema([
+            ("id", pa.int64()), ("login_id", pa.string()), ("name", pa.string()), ("email", pa.string()),
+            ("role", pa.string()), ("department_code", pa.string()), ("department_name", pa.string()),
+            ("code", pa.string()), ("is_active", pa.bool_()),
+            ("created_at", _TIMESTAMP), ("updated_at", _TIMESTAMP),
+        ]),
+        convert=_convert_users,
+    ),
+    "departments": ExportSpec(
+        statement=_departments_statement,
+        schema=pa.schema([
+            ("id", pa.int64()), ("code", pa.string()), ("name", pa.string()), ("notes", pa.string()),
+            ("sort_order", pa.int64()), ("site_list", pa.list_(pa.int64())),
+            ("created_at", _TIMESTAMP), ("updated_at", _TIMESTAMP),
+        ]),
+        convert=lambda columns: columns,
+    ),
+}
+
+
+def iter_chunks(spec: ExportSpec) -> Iterator[List[list]]:
+    """서버 측 커서로 EXPORT_CHUNK_ROWS행씩 읽어 열 단위 목록으로 돌려줍니다."""
+    with db.sync_session() as session:
+        result = session.execute(
+            spec.statement().execution_options(stream_results=True, yield_per=EXPORT_CHUNK_ROWS)
+        )
+        for rows in result.partitions():
+            yield spec.convert([list(column) for column in zip(*rows)])
+
+
+class _DrainSink(io.RawIOBase):
+    """pyarrow 작성기가 쓴 바이트를 모아 두었다가 drain()으로 꺼내 비우는 출력 대상"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _to_batch(spec: ExportSpec, columns: List[list]) -> pa.RecordBatch:
+    return pa.record_batch(
+        [pa.array(values, type=column.type) for values, column in zip(columns, spec.schema)],
+        schema=spec.schema,
+    )
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).isoformat()
+    if isinstance(value, list):
+        return json.dumps(value)
+    return "" if value is None else value
+
+
+def encode_csv(spec: ExportSpec, chunks: Iterator[List[list]]) -> Iterator[bytes]:
+    #  엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다.
+    yield "\ufeff".encode() + (",".join(spec.schema.names) + "\r\n").encode()
+    for columns in chunks:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in zip(*columns):
+            writer.writerow([_csv_value(value) for value in row])
+        yield buffer.getvalue().encode()
+
+
+def encode_parquet(spec: ExportSpec, chunks: Iterator[List[list]]) -> Iterator[bytes]:
+    sink = _DrainSink()
+    writer = pq.ParquetWriter(sink, spec.schema, compression="zstd")
+    try:
+        for columns in chunks:
+            writer.write_batch(_to_batch(spec, columns))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def encode_arrow(spec: ExportSpec, chunks: Iterator[List[list]]) -> Iterator[bytes]:
+    sink = _DrainSink()
+    writer = pa.ipc.new_stream(sink, spec.schema)
+    try:
+        yield sink.drain()
+        for columns in chunks:
+            writer.write_batch(_to_batch(spec, columns))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+ENCODERS = {"csv": encode_csv, "parquet": encode_parquet, "arrow": encode_arrow}
+
+
+def _token_purpose(target: str, file_format: str) -> str:
+    """토큰을 내보내기 대상과 형식에 묶습니다. 다른 대상/형식의 다운로드에는 쓸 수 없습니다."""
+    return f"{EXPORT_TOKEN_PURPOSE}:{target}.{file_format}"
+
+
+def export_url(api_url: str, target: str, file_format: str, user_id: int) -> str:
+    """다운로드 토큰을 발급하고 내보내기 URL을 만듭니다. (권한 확인은 호출자가 합니다)"""
+    token = tokens.sign(_token_purpose(target, file_format), str(user_id), EXPORT_TOKEN_TTL)
+    return f"{api_url.rstrip('/')}{router.prefix}/{target}.{file_format}?token={token}"
+
+
+def _parse_target(filename: str) -> Tuple[str, str]:
+    target, _, file_format = filename.partition(".")
+    if target not in EXPORTS or file_format not in ENCODERS:
+        raise HTTPException(status_code=404)
+    return target, file_format
+
+
+@router.get("/{filename}")
+def export(filename: str, token: str = ""):
+    """
+    내보내기 파일을 스트리밍합니다.
+    동기 제너레이터이므로 StreamingResponse가 스레드 풀에서 순회하며, 이벤트 루프를 막지 않습니다.
+    """
+    target, file_format = _parse_target(filename)
+    if tokens.verify(token, _token_purpose(target, file_format)) is None:
+        raise HTTPException(status_code=403, detail="다운로드 링크가 만료되었거나 올바르지 않습니다.")
+
+    spec = EXPORTS[target]
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return StreamingResponse(
+        ENCODERS[file_format](spec, iter_chunks(spec)),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{target}_{stamp}.{file_format}"'},
+    )
@@ -0,0 +1,355 @@
+# /wims_project/wims/domains/usr/importer.py
+"""
+사용자 일괄 등록(CSV/XLSX) 파이프라인입니다.
+
+1. 업로드 파일을 한 행씩 읽으며(스트리밍) 형식과 파일 내 중복을 검사합니다.
+2. 남은 행의 login_id/email/code와 부서 코드를 한 번의 조회로 DB와 대조합니다.
+3. 비밀번호를 해싱 프로세스 풀에서 병렬로 해싱합니다.
+4. 여러 행을 담은 INSERT 문으로 묶음 단위 저장합니다.
+5. 실패한 행은 행 번호와 사유를 담은 오류 리포트로 돌려줍니다.
+
+파일의 첫 행은 헤더여야 하며 IMPORT_COLUMNS의 열 이름을 사용합니다.
+"""
+
+import asyncio
+import csv
+import io
+from dataclasses import asdict, dataclass, field
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import String, any_, bindparam, or_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlmodel import Session, select
+
+from ... import db
+from ...hashing import hasher
+from .models import Department, User, UserRole
+
+#  지원하는 열. login_id 외에는 비워둘 수 있으며, password 또는 password_hash 중 하나는 필요합니다.
+IMPORT_COLUMNS = ["login_id", "password", "email", "name", "role", "department_code", "code", "password_hash"]
+
+#  INSERT 한 문에 담는 행 수
+INSERT_BATCH_SIZE = 1000
+
+#  모델의 컬럼 길이 제한
+_MAX_LENGTHS = {"login_id": 50, "email": 100, "name": 100, "code": 16}
+
+#  다른 시스템에서 옮겨오는 계정의 bcrypt 해시는 다시 해싱하지 않고 그대로 저장합니다.
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+class ImportFormatError(ValueError):
+    """업로드 파일을 읽을 수 없을 때 발생합니다. (파일 전체 오류)"""
+
+
+@dataclass
+class RowError:
+    """일괄 등록에 실패한 행. line은 헤더를 1행으로 센 파일의 행 번호입니다."""
+    line: int
+    login_id: str
+    message: str
+
+
+@dataclass
+class ImportRow:
+    line: int
+    login_id: str
+    password: str
+    password_hash: str
+    email: Optional[str]
+    name: Optional[str]
+    role: UserRole
+    department_code: Optional[str]
+    code: Optional[str]
+    department_id: Optional[int] = None
+
+
+@dataclass
+class ImportReport:
+    """일괄 등록 결과 요약"""
+    total: int = 0
+    inserted: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def summary(self) -> str:
+        text = f"총 {self.total}행 중 {self.inserted}명 등록"
+        if self.errors:
+            text += f", {len(self.errors)}행 실패"
+        return text
+
+    def to_dict(self) -> dict:
+        """작업 결과(usr.jobs.result)로 저장할 수 있는 딕셔너리로 변환합니다."""
+        return {"total": self.total, "inserted": self.inserted, "errors": [asdict(error) for error in self.errors]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ImportReport":
+        return cls(
+            total=data.get("total", 0),
+            inserted=data.get("inserted", 0),
+            errors=[RowError(**error) for error in data.get("errors", [])],
+        )
+
+    def error_csv(self) -> str:
+        """오류 리포트를 CSV 문자열로 반환합니다. (엑셀에서 열리도록 BOM 포함)"""
+        buffer = io.StringIO()
+        buffer.write("\ufeff")
+        writer = csv.writer(buffer)
+        writer.writerow(["line", "login_id", "message"])
+        for error in self.errors:
+            writer.writerow([error.line, error.login_id, error.message])
+        return buffer.getvalue()
+
+
+# =============================================================================
+# 1. 파일 읽기 (스트리밍)
+# =============================================================================
+
+def _iter_csv(fileobj: IO[bytes]) -> Iterator[Dict[str, str]]:
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = [h.strip().lower() for h in header]
+        for values in reader:
+            yield dict(zip(keys, values))
+    except UnicodeDecodeError as e:
+        raise ImportFormatError("CSV 파일은 UTF-8로 저장해야 합니다.") from e
+    finally:
+        text.detach()
+
+
+def _iter_xlsx(fileobj: IO[bytes]) -> Iterator[Dict[str, str]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ImportFormatError("XLSX 파일을 읽으려면 openpyxl 패키지가 필요합니다. CSV로 저장해 업로드해주세요.") from e
+
+    #  read_only 모드는 시트를 한 행씩 읽으므로 큰 파일도 메모리에 모두 올리지 않습니다.
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        keys = [str(h or "").strip().lower() for h in header]
+        for values in rows:
+            yield {key: "" if value is None else str(value) for key, value in zip(keys, values)}
+    finally:
+        workbook.close()
+
+
+def iter_records(fileobj: IO[bytes], filename: str) -> Iterator[Dict[str, str]]:
+    """파일 확장자에 따라 CSV/XLSX를 헤더 기준 딕셔너리로 한 행씩 읽습니다."""
+    lowered = filename.lower()
+    if lowered.endswith(".csv"):
+        return _iter_csv(fileobj)
+    if lowered.endswith(".xlsx"):
+        return _iter_xlsx(fileobj)
+    raise ImportFormatError("CSV 또는 XLSX 파일만 업로드할 수 있습니다.")
+
+
+# =============================================================================
+# 2. 검증
+# =============================================================================
+
+def _parse_role(value: str) -> UserRole:
+    if not value:
+        return UserRole.GENERAL_USER
+    if value.isdigit():
+        return UserRole(int(value))
+    return UserRole[value.upper()]
+
+
+def _parse_record(line: int, record: Dict[str, str]) -> Tuple[Optional[ImportRow], Optional[str]]:
+    """한 행을 ImportRow로 변환합니다. 형식 오류가 있으면 (None, 사유)를 반환합니다."""
+    values = {column: (record.get(column) or "").strip() for column in IMPORT_COLUMNS}
+
+    if not values["login_id"]:
+        return None, "로그인 ID가 비어 있습니다."
+    for column, max_length in _MAX_LENGTHS.items():
+        if len(values[column]) > max_length:
+            return None, f"{column}은(는) {max_length}자를 넘을 수 없습니다."
+    if values["email"] and "@" not in values["email"]:
+        return None, "이메일 형식이 올바르지 않습니다."
+    if values["password_hash"]:
+        if not values["password_hash"].startswith(_BCRYPT_PREFIXES):
+            return None, "password_hash는 bcrypt 해시여야 합니다."
+    elif not values["password"]:
+        return None, "비밀번호가 비어 있습니다."
+    try:
+        role = _parse_role(values["role"])
+    except (KeyError, ValueError):
+        return None, f"알 수 없는 역할입니다: {values['role']}"
+
+    return ImportRow(
+        line=line,
+        login_id=values["login_id"],
+        password=values["password"],
+        password_hash=values["password_hash"],
+        email=values["email"] or None,
+        name=values["name"] or None,
+        role=role,
+        department_code=values["department_code"] or None,
+        code=values["code"] or None,
+    ), None
+
+
+def parse_records(records: Iterable[Dict[str, str]], report: ImportReport) -> List[ImportRow]:
+    """
+    행 형식과 파일 내 중복(login_id/email/code)을 검사합니다.
+    실패한 행은 report.errors에 추가하고, 통과한 행만 반환합니다.
+    """
+    rows: List[ImportRow] = []
+    seen: Dict[str, Set[str]] = {"login_id": set(), "email": set(), "code": set()}
+    labels = {"login_id": "로그인 ID", "email": "이메일", "code": "사용자 코드"}
+
+    #  헤더가 1행이므로 데이터는 2행부터 시작합니다.
+    for line, record in enumerate(records, start=2):
+        if not any(record.values()):
+            continue
+        report.total += 1
+        row, message = _parse_record(line, record)
+        if row is None:
+            report.errors.append(RowError(line, (record.get("login_id") or "").strip(), message))
+            continue
+
+        duplicate = next(
+            (column for column in seen if getattr(row, column) and getattr(row, column) in seen[column]),
+            None,
+        )
+        if duplicate:
+            report.errors.append(RowError(line, row.login_id, f"파일 안에 같은 {labels[duplicate]}가 이미 있습니다."))
+            continue
+        for column in seen:
+            if getattr(row, column):
+                seen[column].add(getattr(row, column))
+        rows.append(row)
+    return rows
+
+
+def find_conflicts(session: Session, rows: List[ImportRow]) -> Tuple[Dict[str, int], Dict[str, Set[str]]]:
+    """
+    부서 코드 -> ID 목록과, 이미 DB에 있는 login_id/email/code 값을 조회합니다.
+    행 수와 관계없이 부서 한 번, 사용자 한 번의 쿼리만 실행합니다.
+    """
+    department_ids = {code: dept_id for code, dept_id in session.exec(select(Department.code, Department.id)).all()}
+
+    login_ids = [row.login_id for row in rows]
+    emails = [row.email for row in rows if row.email]
+    codes = [row.code for row in rows if row.code]
+    existing: Dict[str, Set[str]] = {"login_id": set(), "email": set(), "code": set()}
+    if not rows:
+        return department_ids, existing
+
+    statement = select(User.login_id, User.email, User.code).where(
+        or_(
+            User.login_id == any_(bindparam("login_ids", login_ids, type_=ARRAY(String))),
+            User.email == any_(bindparam("emails", emails, type_=ARRAY(String))),
+            User.code == any_(bindparam("codes", codes, type_=ARRAY(String))),
+        )
+    )
+    for login_id, email, code in session.execute(statement).all():
+        existing["login_id"].add(login_id)
+        if email:
+            existing["email"].add(email)
+        if code:
+            existing["code"].add(code)
+    return department_ids, existing
+
+
+def resolve_rows(
+    rows: List[ImportRow],
+    department_ids: Dict[str, int],
+    existing: Dict[str, Set[str]],
+    report: ImportReport,
+) -> List[ImportRow]:
+    """DB 조회 결과로 부서 코드를 ID로 바꾸고 기존 계정과 겹치는 행을 걸러냅니다."""
+    messages = {
+        "login_id": "이미 사용 중인 로그인 ID입니다.",
+        "email": "이미 등록된 이메일입니다.",
+        "code": "이미 사용 중인 사용자 코드입니다.",
+    }
+    valid: List[ImportRow] = []
+    for row in rows:
+        conflict = next((column for column in messages if getattr(row, column) in existing[column]), None)
+        if conflict:
+            report.errors.append(RowError(row.line, row.login_id, messages[conflict]))
+            continue
+        if row.department_code:
+            if row.department_code not in department_ids:
+                report.errors.append(RowError(row.line, row.login_id, f"존재하지 않는 부서 코드입니다: {row.department_code}"))
+                continue
+            row.department_id = department_ids[row.department_code]
+        valid.append(row)
+    return valid
+
+
+# =============================================================================
+# 3. 저장
+# =============================================================================
+
+def insert_users(session: Session, rows: List[ImportRow], password_hashes: List[str]) -> Set[str]:
+    """
+    검증된 행을 INSERT_BATCH_SIZE개씩 여러 행 INSERT 문으로 저장하고, 저장된 login_id를 반환합니다.
+
+    검증 이후 다른 관리자가 같은 값을 등록한 경우에 대비해 ON CONFLICT DO NOTHING을 사용하며,
+    반환 목록에 없는 행은 호출자가 실패로 처리합니다. 전체가 하나의 트랜잭션으로 커밋됩니다.
+    """
+    inserted: Set[str] = set()
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        values = [
+            {
+                "login_id": row.login_id,
+                "password_hash": password_hash,
+                "email": row.email,
+                "name": row.name,
+                "role": int(row.role),
+                "department_id": row.department_id,
+                "code": row.code,
+                "is_active": True,
+            }
+            for row, password_hash in zip(rows[start:start + INSERT_BATCH_SIZE], password_hashes[start:start + INSERT_BATCH_SIZE])
+        ]
+        statement = insert(User).values(values).on_conflict_do_nothing().returning(User.login_id)
+        inserted.update(session.execute(statement).scalars().all())
+    session.commit()
+    return inserted
+
+
+# =============================================================================
+# 4. 파이프라인
+# =============================================================================
+
+def _read_and_parse(fileobj: IO[bytes], filename: str, report: ImportReport) -> List[ImportRow]:
+    return parse_records(iter_records(fileobj, filename), report)
+
+
+async def import_users(fileobj: IO[bytes], filename: str) -> ImportReport:
+    """
+    업로드 파일의 사용자를 일괄 등록합니다.
+
+    Raises:
+        ImportFormatError: 파일 형식을 읽을 수 없는 경우.
+        HashQueueFullError: 해싱 대기열이 가득 찬 경우.
+    """
+    report = ImportReport()
+    #  XLSX 해석은 CPU를 사용하므로 이벤트 루프 밖에서 실행합니다.
+    rows = await asyncio.to_thread(_read_and_parse, fileobj, filename, report)
+
+    department_ids, existing = await db.run(find_conflicts, rows)
+    rows = resolve_rows(rows, department_ids, existing, report)
+
+    to_hash = [row.password for row in rows if not row.password_hash]
+    hashed = iter(await hasher.hash_many(to_hash))
+    password_hashes = [row.password_hash or next(hashed) for row in rows]
+
+    inserted = await db.run(insert_users, rows, password_hashes) if rows else set()
+    report.inserted = len(inserted)
+    for row in rows:
+        if row.login_id not in inserted:
+            report.errors.append(RowError(row.line, row.login_id, "다른 사용자가 먼저 같은 정보로 등록했습니다."))
+    report.errors.sort(key=lambda error: error.line)
+    return report
@@ -0,0 +1,35 @@
+# /wims_project/wims/domains/usr/jobs.py
+"""
+'usr' 도메인의 백그라운드 작업입니다. 작업 큐 워커(python -m wims.tasks.worker)에서 실행됩니다.
+"""
+
+import os
+
+from ...tasks.registry import task
+from . import importer
+
+IMPORT_USERS_TASK = "usr.import_users"
+
+
+@task(IMPORT_USERS_TASK, queue="import", max_attempts=1, timeout=600)
+async def import_users(payload: dict) -> dict:
+    """
+    업로드된 CSV/XLSX 파일로 사용자를 일괄 등록하고 ImportReport를 결과로 반환합니다.
+
+    payload:
+        path (str): 업로드 폴더에 저장된 파일 경로. 워커는 Reflex 백엔드와 업로드 폴더를 공유해야 합니다.
+        filename (str): 원본 파일 이름 (형식 판별용).
+
+    같은 파일을 다시 등록하면 이미 등록된 행이 모두 충돌로 보고되므로 재시도하지 않습니다.
+    파일 형식 오류는 작업 실패가 아니라 결과의 format_error로 돌려줍니다.
+    """
+    path = payload["path"]
+    try:
+        with open(path, "rb") as fileobj:
+            report = await importer.import_users(fileobj, payload["filename"])
+    except importer.ImportFormatError as e:
+        return {"format_error": str(e)}
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    return report.to_dict()
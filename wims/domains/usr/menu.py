@@ -0,0 +1,15 @@
+# /wims_project/wims/domains/usr/menu.py
+"""'usr' 도메인의 사이드바 메뉴(접근 권한 포함)를 등록합니다. (페이지 경로는 패키지 __init__.py에 선언)"""
+
+from ...navigation import register_menu
+from . import DEPARTMENTS_ROUTE, USERS_ROUTE
+from .models import UserRole
+
+register_menu(
+    icon="users", name="사용자 관리", roles=[UserRole.ADMIN],
+    sub_items=[
+        {"text": "사용자 목록", "url": USERS_ROUTE, "roles": [UserRole.ADMIN]},
+        {"text": "부서 목록", "url": DEPARTMENTS_ROUTE, "roles": [UserRole.ADMIN]},
+    ],
+    order=10,
+)
@@ -8,6 +8,7 @@ from typing import Optional, List
 from datetime import datetime, timezone
 from enum import IntEnum
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Integer, Field, Relationship, Column, TIMESTAMP, func
 
@@ -76,7 +77,15 @@ class User(rx.Model, table=True):
     PostgreSQL의 usr.users 테이블에 매핑되는 모델.
     """
     __tablename__ = "users"  # type: ignore
-    __table_args__ = {'schema': 'usr'}
+    __table_args__ = (
+        #  사용자 검색(ILIKE '%검색어%')용 pg_trgm GIN 인덱스
+        Index("ix_usr_users_login_id_trgm", "login_id", postgresql_using="gin", postgresql_ops={"login_id": "gin_trgm_ops"}),
+        Index("ix_usr_users_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_usr_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        #  부서 필터 + id 순 키셋 페이지네이션용 인덱스
+        Index("ix_usr_users_department_id_id", "department_id", "id"),
+        {'schema': 'usr'},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     login_id: str = Field(max_length=50, unique=True, description="로그인 사용자명")
@@ -90,7 +99,8 @@ class User(rx.Model, table=True):
     #  UserRole Enum을 사용하여 역할 관리
     role: UserRole = Field(
         default=UserRole.GENERAL_USER,
-        sa_column=Column(Integer),  # <-- 이렇게 수정하세요.
+        #  Core INSERT(commands.create_user)에서도 기본값이 적용되도록 DB 기본값을 둡니다.
+        sa_column=Column(Integer, nullable=False, server_default=str(int(UserRole.GENERAL_USER))),
         description="사용자 역할 (권한)"
     )
     code: Optional[str] = Field(default=None, max_length=16, unique=True, description="사번 등 사용자 고유 코드")
@@ -3,6 +3,20 @@ import reflex as rx
 from .state import UserAdminState, DeptAdminState
 
 
+def export_menu(on_select) -> rx.Component:
+    """CSV/Parquet/Arrow 형식 중 하나를 골라 내려받는 드롭다운 버튼입니다."""
+    return rx.menu.root(
+        rx.menu.trigger(
+            rx.button(rx.icon(tag="download"), "내보내기", variant="soft", size="3")
+        ),
+        rx.menu.content(
+            rx.menu.item("CSV", on_click=on_select("csv")),
+            rx.menu.item("Parquet", on_click=on_select("parquet")),
+            rx.menu.item("Arrow IPC", on_click=on_select("arrow")),
+        ),
+    )
+
+
 # =============================================================================
 # 1. 사용자 관리 페이지 컴포넌트
 # =============================================================================
@@ -105,12 +119,240 @@ def user_modal() -> rx.Component:
     )
 
 
+def user_import_modal() -> rx.Component:
+    """CSV/XLSX 파일로 사용자를 일괄 등록하는 다이얼로그입니다."""
+    return rx.dialog.root(
+        rx.dialog.content(
+            rx.vstack(
+                rx.dialog.title("사용자 일괄 등록"),
+                rx.text(
+                    "첫 행은 헤더여야 합니다: login_id, password, email, name, role, department_code, code",
+                    size="2",
+                    color_scheme="gray",
+                ),
+                rx.upload(
+                    rx.vstack(
+                        rx.icon(tag="upload"),
+                        rx.text("CSV/XLSX 파일을 끌어다 놓거나 클릭해서 선택하세요.", size="2"),
+                        rx.foreach(rx.selected_files("user_import"), lambda name: rx.text(name, weight="bold", size="2")),
+                        align="center",
+                        spacing="2",
+                    ),
+                    id="user_import",
+                    accept={
+                        "text/csv": [".csv"],
+                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [".xlsx"],
+                    },
+                    max_files=1,
+                    border="1px dashed var(--gray-7)",
+                    padding="2rem",
+                    width="100%",
+                ),
+                rx.cond(
+                    UserAdminState.import_in_progress,
+                    rx.hstack(rx.spinner(), rx.text("등록 중입니다...", size="2"), align="center"),
+                ),
+                rx.cond(
+                    UserAdminState.import_summary != "",
+                    rx.callout.root(
+                        rx.callout.text(UserAdminState.import_summary),
+                        color_scheme=rx.cond(UserAdminState.import_errors.length() > 0, "amber", "grass"),
+                        width="100%",
+                    ),
+                ),
+                rx.cond(
+                    UserAdminState.import_errors.length() > 0,
+                    rx.scroll_area(
+                        rx.table.root(
+                            rx.table.header(
+                                rx.table.row(
+                                    rx.table.column_header_cell("행"),
+                                    rx.table.column_header_cell("로그인 ID"),
+                                    rx.table.column_header_cell("사유"),
+                                )
+                            ),
+                            rx.table.body(
+                                rx.foreach(
+                                    UserAdminState.import_errors,
+                                    lambda error: rx.table.row(
+                                        rx.table.cell(error["line"]),
+                                        rx.table.cell(error["login_id"]),
+                                        rx.table.cell(error["message"]),
+                                    ),
+                                )
+                            ),
+                            size="1",
+                            width="100%",
+                        ),
+                        max_height="240px",
+                    ),
+                ),
+                rx.hstack(
+                    rx.cond(
+                        UserAdminState.import_errors.length() > 0,
+                        rx.button(
+                            rx.icon(tag="download"), "오류 리포트",
+                            on_click=UserAdminState.download_import_errors,
+                            variant="soft",
+                            type="button",
+                        ),
+                    ),
+                    rx.spacer(),
+                    rx.dialog.close(
+                        rx.button("닫기", type="button", color_scheme="gray")
+                    ),
+                    rx.button(
+                        "등록 시작",
+                        on_click=UserAdminState.handle_import_upload(rx.upload_files(upload_id="user_import")),
+                        loading=UserAdminState.import_in_progress,
+                    ),
+                    spacing="3",
+                    width="100%",
+                ),
+                spacing="4",
+                width="100%",
+            ),
+            style={"max_width": "560px"},
+        ),
+        open=UserAdminState.show_import_modal,
+        on_open_change=UserAdminState.set_show_import_modal,
+    )
+
+
+def user_pagination() -> rx.Component:
+    """사용자 목록 하단의 페이지 이동(이전/다음) 및 페이지 크기 선택 컴포넌트입니다."""
+    return rx.hstack(
+        rx.text(UserAdminState.total_estimate_label, color_scheme="gray", size="2"),
+        rx.spacer(),
+        rx.text("페이지당", size="2"),
+        rx.select(
+            UserAdminState.page_size_options,
+            value=UserAdminState.page_size.to_string(),
+            on_change=UserAdminState.set_page_size,
+            size="1",
+        ),
+        rx.button(
+            rx.icon(tag="chevron-left"), "이전",
+            on_click=UserAdminState.prev_page,
+            disabled=~UserAdminState.has_prev_page,
+            variant="soft",
+            size="2",
+        ),
+        rx.button(
+            "다음", rx.icon(tag="chevron-right"),
+            on_click=UserAdminState.next_page,
+            disabled=~UserAdminState.has_next_page,
+            variant="soft",
+            size="2",
+        ),
+        spacing="3",
+        align="center",
+        width="100%",
+    )
+
+
+def user_bulk_bar() -> rx.Component:
+    """선택된 사용자에 대한 일괄 작업 바와 마지막 일괄 작업 결과 요약입니다."""
+    return rx.vstack(
+        rx.cond(
+            UserAdminState.selected_count > 0,
+            rx.hstack(
+                rx.text(f"{UserAdminState.selected_count}명 선택됨", weight="bold", size="2"),
+                rx.button("선택 해제", on_click=UserAdminState.clear_selection, variant="ghost", size="1"),
+                rx.spacer(),
+                rx.button("활성화", on_click=UserAdminState.bulk_activate, variant="soft", size="2"),
+                rx.button("비활성화", on_click=UserAdminState.bulk_deactivate, variant="soft", size="2"),
+                rx.select.root(
+                    rx.select.trigger(placeholder="부서 변경"),
+                    rx.select.content(
+                        rx.foreach(
+                            UserAdminState.bulk_department_options,
+                            lambda dept: rx.select.item(dept["name"], value=dept["id"])
+                        )
+                    ),
+                    value="",
+                    on_change=UserAdminState.bulk_change_department,
+                    size="2",
+                ),
+                rx.select.root(
+                    rx.select.trigger(placeholder="역할 변경"),
+                    rx.select.content(
+                        rx.foreach(
+                            UserAdminState.role_options,
+                            lambda role: rx.select.item(role["name"], value=role["id"])
+                        )
+                    ),
+                    value="",
+                    on_change=UserAdminState.bulk_change_role,
+                    size="2",
+                ),
+                rx.alert_dialog.root(
+                    rx.alert_dialog.trigger(
+                        rx.button("일괄 삭제", color_scheme="ruby", size="2")
+                    ),
+                    rx.alert_dialog.content(
+                        rx.alert_dialog.title("일괄 삭제 확인"),
+                        rx.alert_dialog.description(
+                            f"선택한 {UserAdminState.selected_count}명의 사용자를 정말 삭제하시겠습니까? (관리자 계정은 제외됩니다)"
+                        ),
+                        rx.flex(
+                            rx.alert_dialog.cancel(
+                                rx.button("취소", color_scheme="gray")
+                            ),
+                            rx.alert_dialog.action(
+                                rx.button("삭제", on_click=UserAdminState.bulk_delete)
+                            ),
+                            spacing="3",
+                            justify="end",
+                            padding_top="1rem",
+                        ),
+                    ),
+                ),
+                spacing="3",
+                align="center",
+                width="100%",
+            ),
+        ),
+        # 행마다 알림창을 띄우지 않고 결과를 한 번에 요약해서 보여줍니다.
+        rx.cond(
+            UserAdminState.bulk_summary != "",
+            rx.callout.root(
+                rx.callout.icon(rx.icon(tag="info")),
+                rx.vstack(
+                    rx.hstack(
+                        rx.callout.text(UserAdminState.bulk_summary),
+                        rx.spacer(),
+                        rx.icon_button(
+                            rx.icon(tag="x"), on_click=UserAdminState.clear_bulk_result,
+                            variant="ghost", size="1",
+                        ),
+                        width="100%",
+                    ),
+                    rx.foreach(
+                        UserAdminState.bulk_failures,
+                        lambda failure: rx.text(f"ID {failure['id']}: {failure['reason']}", size="1"),
+                    ),
+                    spacing="1",
+                    width="100%",
+                ),
+                color_scheme=rx.cond(UserAdminState.bulk_failures.length() > 0, "amber", "grass"),
+                width="100%",
+            ),
+        ),
+        spacing="2",
+        width="100%",
+    )
+
+
 def user_admin_page() -> rx.Component:
     """사용자 관리 페이지의 메인 컨텐츠입니다."""
     return rx.vstack(
         rx.hstack(
             rx.heading("사용자 목록", size="7"),
             rx.spacer(),
+            rx.icon_button(rx.icon(tag="rotate-cw"), on_click=UserAdminState.refresh, variant="ghost", size="3", title="새로고침"),
+            export_menu(UserAdminState.export_users),
+            rx.button("일괄 등록", on_click=UserAdminState.open_import_modal, size="3", variant="soft"),
             rx.button("새 사용자 생성", on_click=UserAdminState.open_create_modal, size="3"),
             align="center",
             width="100%",
@@ -120,32 +362,35 @@ def user_admin_page() -> rx.Component:
             rx.select.root(
                 rx.select.trigger(placeholder="부서별로 필터링", width="140px"),
                 rx.select.content(
-                    # '전체' 옵션을 맨 위에 추가합니다.
-                    #rx.select.item("전체 부서", value=""),
+                    # '전체 부서' 옵션은 filter_department_options 맨 앞에 포함되어 있습니다.
                     rx.foreach(
                         UserAdminState.filter_department_options,
-                        lambda dept: rx.select.item(dept.name, value=dept.id)
+                        lambda dept: rx.select.item(dept["name"], value=dept["id"])
                     ),
                 ),
                 # state의 필터 변수와 값을 바인딩합니다.
-                #value=UserAdminState.filter_department_id,
+                value=UserAdminState.filter_department_id,
                 # 값이 변경되면 state를 업데이트하는 핸들러를 호출합니다.
-                #on_change=UserAdminState.set_filter_department,
+                on_change=UserAdminState.set_filter_department,
             ),
-            rx.input(
-                placeholder="ID, 이름, 이메일로 검색...",
-                # 값이 변경되면 state를 업데이트하는 핸들러를 호출합니다.
-                #on_change=UserAdminState.set_filter_search,
-                # state의 필터 변수와 값을 바인딩합니다.
-                #value=UserAdminState.filter_search_term,
-                #flex_grow="0",  #  남은 공간을 모두 차지하도록 설정
+            # 입력이 멈춘 뒤 300ms가 지나야 검색 쿼리가 실행되도록 디바운스합니다.
+            rx.debounce_input(
+                rx.input(
+                    placeholder="ID, 이름, 이메일로 검색...",
+                    # state의 필터 변수와 값을 바인딩합니다.
+                    value=UserAdminState.filter_search_term,
+                    # 값이 변경되면 state를 업데이트하는 핸들러를 호출합니다.
+                    on_change=UserAdminState.set_filter_search,
+                ),
+                debounce_timeout=300,
             ),
             rx.spacer(),
-            rx.button(rx.icon(tag="search"), "검색", on_click=UserAdminState.open_create_modal, size="2"),
+            rx.button(rx.icon(tag="search"), "검색", on_click=UserAdminState.apply_filters, size="2"),
             spacing="4",
             width="100%",
             padding_y="1rem",  # 위아래 여백 추가
         ),
+        user_bulk_bar(),
         rx.table.root(
             rx.table.header(
                 rx.table.row(
@@ -225,7 +470,9 @@ def user_admin_page() -> rx.Component:
             variant="surface",
             width="100%",
         ),
+        user_pagination(),
         user_modal(),
+        user_import_modal(),
         spacing="5",
         width="100%",
         on_mount=UserAdminState.load_users_page,
@@ -288,6 +535,8 @@ def department_admin_page() -> rx.Component:
         rx.hstack(
             rx.heading("부서 목록", size="7"),
             rx.spacer(),
+            rx.icon_button(rx.icon(tag="rotate-cw"), on_click=DeptAdminState.load_depts_page, variant="ghost", size="3", title="새로고침"),
+            export_menu(DeptAdminState.export_departments),
             rx.button("새 부서 생성", on_click=DeptAdminState.open_create_modal, size="3"),
             align="center",
             width="100%",
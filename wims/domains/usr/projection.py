@@ -0,0 +1,103 @@
+# /wims_project/wims/domains/usr/projection.py
+"""
+사용자 ORM 행을 화면 표시용 UserList 모델로 변환(투영)하고,
+목록 체크박스 선택 상태를 관리하는 순수 함수 모음입니다.
+State에 의존하지 않으므로 벤치마크(scripts/bench_user_selection.py)에서도 그대로 사용합니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .models import User, UserList, UserRole
+
+#  투영 캐시: user_id -> (행 서명, 투영 결과)
+ProjectionCache = Dict[int, Tuple[tuple, UserList]]
+
+
+def row_signature(user: User) -> tuple:
+    """
+    투영 결과에 영향을 주는 값들의 서명을 만듭니다.
+    부서명은 사용자 행의 updated_at을 바꾸지 않으므로 따로 포함합니다.
+    """
+    return (
+        user.updated_at,
+        user.login_id,
+        user.name,
+        user.email,
+        user.role,
+        user.is_active,
+        user.department.name if user.department else None,
+    )
+
+
+def to_user_list(user: User) -> UserList:
+    """사용자 ORM 객체 하나를 UserList 표시 모델로 변환합니다."""
+    return UserList(
+        id=user.id,
+        login_id=user.login_id,
+        name=user.name or "",
+        email=user.email or "",
+        role_name=UserRole(user.role).name,
+        department_name=user.department.name if user.department else "N/A",
+        is_active=user.is_active,
+    )
+
+
+def row_to_user_list(row: Any) -> UserList:
+    """
+    쓰기 문이 RETURNING으로 돌려준 행(id, login_id, name, email, role, is_active, department_name)을
+    UserList 표시 모델로 변환합니다.
+    """
+    return UserList(
+        id=row.id,
+        login_id=row.login_id,
+        name=row.name or "",
+        email=row.email or "",
+        role_name=UserRole(row.role).name,
+        department_name=row.department_name or "N/A",
+        is_active=row.is_active,
+    )
+
+
+def project_users(rows: Iterable[User], cache: ProjectionCache) -> Tuple[List[UserList], ProjectionCache]:
+    """
+    조회된 행 목록을 UserList 목록으로 투영합니다.
+    서명이 바뀌지 않은 행은 이전 투영 결과를 재사용하고, 바뀐 행만 새로 변환합니다.
+
+    Returns:
+        Tuple[List[UserList], ProjectionCache]: 투영 결과와 현재 행만 담은 새 캐시.
+    """
+    projected: List[UserList] = []
+    new_cache: ProjectionCache = {}
+    for user in rows:
+        signature = row_signature(user)
+        cached = cache.get(user.id)
+        item = cached[1] if cached and cached[0] == signature else to_user_list(user)
+        new_cache[user.id] = (signature, item)
+        projected.append(item)
+    return projected, new_cache
+
+
+def count_selected(displayed_ids: Set[int], selected_ids: Set[int]) -> int:
+    """현재 페이지에서 선택된 행 수를 셉니다. (페이지가 바뀔 때만 호출)"""
+    return len(displayed_ids & selected_ids)
+
+
+def toggle_selection(user_id: int, displayed_ids: Set[int], selected_ids: Set[int], selected_on_page: int) -> int:
+    """
+    행 하나의 선택을 토글하고 갱신된 '페이지 내 선택 수'를 반환합니다.
+    집합 연산 한 번과 정수 계산만 하므로 목록 크기와 관계없이 비용이 일정합니다.
+    """
+    if user_id in selected_ids:
+        selected_ids.remove(user_id)
+        delta = -1
+    else:
+        selected_ids.add(user_id)
+        delta = 1
+    if user_id in displayed_ids:
+        selected_on_page += delta
+    return selected_on_page
+
+
+def is_all_selected(displayed_ids: Set[int], selected_on_page: int) -> bool:
+    """현재 페이지의 모든 행이 선택되었는지 여부를 반환합니다."""
+    return bool(displayed_ids) and selected_on_page == len(displayed_ids)
@@ -0,0 +1,184 @@
+# /wims_project/wims/domains/usr/queries.py
+"""
+'usr' 도메인의 조회 쿼리를 모아둔 모듈입니다.
+State의 이벤트 핸들러는 이곳의 함수에 세션을 넘겨 실행만 하고,
+SQL 구성(정렬, 페이지 경계 등)은 이 모듈이 책임집니다.
+"""
+
+import enum
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
+
+from .models import Department, User
+
+#  사용자 목록 한 페이지에 표시할 행 수
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZE_OPTIONS = [20, 50, 100, 200]
+
+
+@dataclass
+class UserFilter:
+    """사용자 목록 검색 조건. 빈 값은 조건 없음을 뜻합니다."""
+    search: str = ""
+    department_id: Optional[int] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.search and self.department_id is None
+
+    def matches(self, login_id: str, name: Optional[str], email: Optional[str], department_id: Optional[int]) -> bool:
+        """
+        저장 직후의 행이 현재 검색 조건에 해당하는지 판단합니다.
+        (apply_user_filter와 같은 조건을 DB 조회 없이 확인)
+        """
+        if self.department_id is not None and department_id != self.department_id:
+            return False
+        if self.search:
+            term = self.search.lower()
+            return any(term in (value or "").lower() for value in (login_id, name, email))
+        return True
+
+
+@dataclass
+class UserPage:
+    """키셋(seek) 페이지네이션으로 조회한 사용자 목록 한 페이지."""
+    rows: List[User] = field(default_factory=list)
+    has_next: bool = False
+    has_prev: bool = False
+
+
+def _escape_like(term: str) -> str:
+    """LIKE 패턴의 특수문자(%, _)를 '/' 문자로 이스케이프합니다."""
+    return term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def apply_user_filter(statement, filters: Optional[UserFilter]):
+    """
+    SELECT 문에 검색 조건을 추가합니다.
+    login_id/name/email 부분 일치 검색은 pg_trgm GIN 인덱스를,
+    부서 조건은 department_id 인덱스를 사용합니다.
+    """
+    if filters is None:
+        return statement
+    if filters.search:
+        pattern = f"%{_escape_like(filters.search)}%"
+        statement = statement.where(
+            or_(
+                User.login_id.ilike(pattern, escape="/"),
+                User.name.ilike(pattern, escape="/"),
+                User.email.ilike(pattern, escape="/"),
+            )
+        )
+    if filters.department_id is not None:
+        statement = statement.where(User.department_id == filters.department_id)
+    return statement
+
+
+def fetch_user_page(
+    session: Session,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    filters: Optional[UserFilter] = None,
+) -> UserPage:
+    """
+    User.id 기준 키셋 페이지네이션으로 사용자 한 페이지를 조회합니다.
+    OFFSET을 사용하지 않으므로 몇 번째 페이지이든 PK 인덱스 탐색 비용만 듭니다.
+
+    Args:
+        session (Session): DB 세션.
+        page_size (int): 페이지당 행 수.
+        after_id (Optional[int]): 이 ID보다 큰 행부터 조회합니다. (다음 페이지)
+        before_id (Optional[int]): 이 ID보다 작은 행까지 역순으로 조회합니다. (이전 페이지)
+        filters (Optional[UserFilter]): 검색어 및 부서 조건.
+
+    Returns:
+        UserPage: 조회된 행과 앞/뒤 페이지 존재 여부.
+    """
+    #  한 행을 더 읽어 다음(또는 이전) 페이지가 있는지 판단합니다.
+    statement = select(User).options(selectinload(User.department)).limit(page_size + 1)
+    statement = apply_user_filter(statement, filters)
+
+    if before_id is not None:
+        statement = statement.where(User.id < before_id).order_by(User.id.desc())
+        rows = list(session.exec(statement).all())
+        has_prev = len(rows) > page_size
+        rows = list(reversed(rows[:page_size]))
+        return UserPage(rows=rows, has_next=True, has_prev=has_prev)
+
+    if after_id is not None:
+        statement = statement.where(User.id > after_id)
+    rows = list(session.exec(statement.order_by(User.id)).all())
+    has_next = len(rows) > page_size
+    has_prev = after_id is not None and session.exec(
+        apply_user_filter(select(User.id).where(User.id <= after_id), filters).limit(1)
+    ).first() is not None
+    return UserPage(rows=rows[:page_size], has_next=has_next, has_prev=has_prev)
+
+
+def estimate_user_count(session: Session) -> Optional[int]:
+    """
+    usr.users 테이블의 대략적인 행 수를 통계 정보(pg_class.reltuples)로 반환합니다.
+    COUNT(*)처럼 테이블 전체를 읽지 않으므로 행 수와 관계없이 비용이 일정합니다.
+
+    Returns:
+        Optional[int]: 추정 행 수. ANALYZE 전이라 통계가 없으면 None.
+    """
+    estimate = session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'usr.users'::regclass")
+    ).scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def get_user_by_login_id(session: Session, login_id: str) -> Optional[User]:
+    """로그인 ID로 사용자 한 명을 조회합니다."""
+    return session.exec(select(User).where(User.login_id == login_id)).one_or_none()
+
+
+def get_user_form(session: Session, user_id: int) -> Optional[dict]:
+    """
+    사용자 수정 폼에 채울 값을 문자열 딕셔너리로 반환합니다.
+
+    Returns:
+        Optional[dict]: 폼 데이터. 사용자가 없으면 None.
+    """
+    user = session.get(User, user_id)
+    if not user:
+        return None
+
+    # 1. 모델 객체를 딕셔너리로 변환하는 더 깔끔한 방식입니다.
+    form_data = user.model_dump()
+
+    # 2. department는 객체이므로 제거 (department_id 사용)
+    form_data.pop("department", None)
+
+    # 3. 역할(Enum)을 Select 컴포넌트가 사용할 값(정수)으로 변환합니다.
+    role_value = form_data.get("role")
+    if isinstance(role_value, enum.Enum):
+        form_data["role"] = role_value.value
+
+    # 4. 모든 값을 문자열로 변환하되, 'None'은 그대로 유지합니다.
+    #    이것이 UniqueViolation 오류를 막는 핵심입니다.
+    for key, value in form_data.items():
+        if value is not None:
+            form_data[key] = str(value)
+    return form_data
+
+
+def fetch_departments(session: Session) -> List[Department]:
+    """부서 전체 목록을 이름순으로 조회합니다."""
+    return list(session.exec(select(Department).order_by(Department.name)).all())
+
+
+def department_options(departments: List[Department]) -> List[dict]:
+    """부서 목록을 선택 드롭다운 옵션 목록으로 변환합니다."""
+    return [
+        {"id": str(dept.id), "name": f"{dept.name} ({dept.code})"}
+        for dept in departments
+    ]
@@ -0,0 +1,51 @@
+# /wims_project/wims/domains/usr/refdata.py
+"""
+'usr' 도메인의 참조 데이터를 프로세스 전역 캐시(wims.cache)에 등록합니다.
+usr.departments가 바뀌면 트리거 알림으로 모든 워커의 항목이 무효화됩니다.
+"""
+
+from typing import Dict, List, NamedTuple, Tuple
+
+from sqlmodel import Session
+
+from ... import cache
+from .models import Department
+from .queries import department_options, fetch_departments
+
+DEPARTMENT_LOOKUP = "usr.department_lookup"
+DEPARTMENTS = "usr.departments"
+
+
+class DepartmentLookup(NamedTuple):
+    #  선택 드롭다운 옵션 ({"id", "name"} 목록)
+    options: List[dict]
+    #  부서 ID -> 부서명
+    names: Dict[int, str]
+
+
+def fetch_department_lookup(session: Session) -> DepartmentLookup:
+    """부서 목록을 한 번 조회해 드롭다운 옵션과 ID -> 이름 표를 함께 만듭니다."""
+    departments = fetch_departments(session)
+    return DepartmentLookup(
+        options=department_options(departments),
+        names={dept.id: dept.name for dept in departments},
+    )
+
+
+def fetch_department_rows(session: Session) -> Tuple[Department, ...]:
+    """부서 관리 페이지에 표시할 부서 목록(이름순)을 조회합니다."""
+    return tuple(fetch_departments(session))
+
+
+cache.register(DEPARTMENT_LOOKUP, fetch_department_lookup, tables=["usr.departments"])
+cache.register(DEPARTMENTS, fetch_department_rows, tables=["usr.departments"])
+
+
+async def get_department_lookup() -> DepartmentLookup:
+    """캐시된 부서 조회표를 반환합니다. (수정하지 말고 복사해서 사용)"""
+    return await cache.get(DEPARTMENT_LOOKUP)
+
+
+async def get_departments() -> Tuple[Department, ...]:
+    """캐시된 부서 목록을 반환합니다."""
+    return await cache.get(DEPARTMENTS)
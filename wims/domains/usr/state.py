@@ -1,22 +1,58 @@
-import enum
-from typing import List, Dict, Any, Set
-
-from sqlmodel import select
-from sqlalchemy.orm import selectinload
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import asdict
+from typing import List, Dict, Any, Set, Optional
 
 import reflex as rx
 
+from ... import db
 from ...state.base import BaseState
-from ...utils import get_password_hash
+from ...hashing import HashQueueFullError, hash_password_async
+from ...tasks.models import JobStatus
+from ...tasks.queue import enqueue, get_job
 
+from . import commands, export, importer
+from .jobs import IMPORT_USERS_TASK
+from .menu import USERS_ROUTE, DEPARTMENTS_ROUTE
 from .models import User, Department, UserRole, UserList
+from .projection import (
+    ProjectionCache, project_users, row_to_user_list, count_selected, toggle_selection, is_all_selected
+)
+from .queries import (
+    DEFAULT_PAGE_SIZE, PAGE_SIZE_OPTIONS, UserFilter, fetch_user_page, estimate_user_count,
+    get_user_form,
+)
+from .refdata import get_department_lookup, get_departments
+
+#  부서 필터에서 '전체 부서'를 나타내는 값
+ALL_DEPARTMENTS = "__all__"
+#  일괄 부서 변경에서 '부서 없음'을 나타내는 값 (선택 항목 값으로 빈 문자열을 쓸 수 없음)
+NO_DEPARTMENT = "__none__"
+#  일괄 등록 결과 화면에 표시할 오류 행 수
+IMPORT_ERROR_PREVIEW = 100
+#  일괄 등록 작업 상태 확인 간격과 최대 대기 시간(초)
+IMPORT_POLL_INTERVAL = 1.0
+IMPORT_WATCH_TIMEOUT = 1800
+
+
+def _export_redirect(state: BaseState, route: str, target: str, file_format: str):
+    """페이지 권한을 확인한 뒤 다운로드 토큰이 담긴 내보내기 URL로 이동합니다."""
+    if (denied := state._deny_access(route)) is not None:
+        return denied
+    if file_format not in export.EXPORT_FORMATS:
+        return rx.window_alert("지원하지 않는 파일 형식입니다.")
+    url = export.export_url(rx.config.get_config().api_url, target, file_format, state.logged_in_user.id)
+    return rx.redirect(url, is_external=True)
 
 
 class UserAdminState(BaseState):
     """사용자 관리 페이지의 상태와 이벤트 핸들러"""
 
     # --- 상태 변수 ---
-    users: list[User] = []
+    # 현재 페이지의 표시용 행. 조회 시점에 한 번만 투영하고, 바뀐 행만 다시 변환합니다.
+    display_users: list[UserList] = []
     show_modal: bool = False
     form_data: dict = {}
     is_edit: bool = False
@@ -24,11 +60,47 @@ class UserAdminState(BaseState):
     # 선택된 사용자 ID를 저장하는 집합(set)
     selected_user_ids: set[int] = set()
 
+    # --- 백엔드 전용 변수 (클라이언트로 전송되지 않음) ---
+    _projection_cache: ProjectionCache = {}
+    # 현재 페이지에 표시된 ID 집합과 그중 선택된 행 수 (전체 선택 판단용)
+    _displayed_ids: set[int] = set()
+    _selected_on_page: int = 0
+    # 부서 ID -> 부서명 (일괄 부서 변경 후 표시 행을 고칠 때 사용)
+    _department_names: dict[int, str] = {}
+
+    # --- 페이지네이션 상태 (User.id 기준 키셋 페이지네이션) ---
+    page_size: int = DEFAULT_PAGE_SIZE
+    page_first_id: Optional[int] = None
+    page_last_id: Optional[int] = None
+    has_next_page: bool = False
+    has_prev_page: bool = False
+    # 전체 사용자 수 추정치 (pg_class 통계 기반, 통계가 없으면 None)
+    show_total_estimate: bool = True
+    total_user_estimate: Optional[int] = None
+
+    # --- 일괄 작업 결과 (알림창 대신 요약으로 표시) ---
+    bulk_summary: str = ""
+    bulk_failures: list[dict] = []
+
+    # --- 일괄 등록(CSV/XLSX) 상태 ---
+    show_import_modal: bool = False
+    import_in_progress: bool = False
+    import_summary: str = ""
+    # 화면에는 앞부분만 표시하고, 전체 오류 리포트는 CSV로 내려받습니다.
+    import_errors: list[dict] = []
+    _import_job_id: Optional[int] = None
+    _import_error_csv: str = ""
+
+    # --- 검색 필터 상태 ---
+    filter_department_id: str = ALL_DEPARTMENTS
+    filter_search_term: str = ""
+
     # --- 클래스 변수 ---
     role_options: list[dict] = [
         {"id": str(role.value), "name": role.name}
         for role in UserRole
     ]
+    page_size_options: list[str] = [str(size) for size in PAGE_SIZE_OPTIONS]
     department_options: list[dict] = []
 
     # 🔽 --- 계산된 속성 ---
@@ -43,45 +115,35 @@ class UserAdminState(BaseState):
     def form_department_id(self) -> str:
         return str(self.form_data.get("department_id", ""))
 
+    @rx.var
+    def selected_count(self) -> int:
+        return len(self.selected_user_ids)
+
+    @rx.var
+    def total_estimate_label(self) -> str:
+        """전체 사용자 수 추정치를 표시용 문자열로 반환합니다."""
+        if not self.show_total_estimate or self.total_user_estimate is None:
+            return ""
+        return f"전체 약 {self.total_user_estimate:,}명"
+
     # '전체' 항목이 추가된 필터 전용 목록을 생성하는 계산된 속성
     @rx.var
     def filter_department_options(self) -> list[dict]:
         """필터 드롭다운을 위한 부서 목록을 반환합니다. ('전체 부서' 포함)"""
         # '전체' 항목을 맨 앞에 추가합니다. id는 빈 문자열로 설정하여 '필터 없음'을 나타냅니다.
-        return [{"id": "__all__", "name": "전체 부서"}] + self.department_options
+        return [{"id": ALL_DEPARTMENTS, "name": "전체 부서"}] + self.department_options
 
-    # 반환 타입을 명확한 UserDisplay 모델의 리스트로 변경
     @rx.var
-    def display_users(self) -> List[UserList]:
-        """필터링된 사용자 목록을 UserDisplay 모델의 리스트로 반환합니다."""
-        user_list = []
-        for user in self.users:
-            user_list.append(
-                UserList(
-                    id=user.id,
-                    login_id=user.login_id,
-                    name=user.name or "",
-                    email=user.email or "",
-                    role_name=user.role.name,
-                    department_name=user.department.name if user.department else "N/A",
-                    is_active=user.is_active,
-                )
-            )
-        return user_list
+    def bulk_department_options(self) -> list[dict]:
+        """일괄 부서 변경 드롭다운을 위한 부서 목록을 반환합니다. ('부서 없음' 포함)"""
+        return [{"id": NO_DEPARTMENT, "name": "부서 없음"}] + self.department_options
 
     # '전체 선택' 체크박스의 상태를 결정하는 계산된 속성
-    @rx.var
+    @rx.var(cache=True)
     def select_all_checked_state(self) -> bool:
-        """현재 표시된 모든 사용자가 선택되었는지 여부를 반환합니다. (True, False, "indeterminate")"""
-        # 표시된 사용자가 없으면 체크 해제 상태
-        if not self.display_users:
-            return False
-
-        # 현재 표시된 사용자의 ID 집합
-        displayed_ids = {user.id for user in self.display_users}
-
-        # 현재 표시된 모든 ID가 선택된 ID 집합에 포함되는지 확인
-        return displayed_ids.issubset(self.selected_user_ids)
+        """현재 표시된 모든 사용자가 선택되었는지 여부를 반환합니다."""
+        # 미리 계산된 ID 집합과 선택 수만 비교하므로 행 수와 관계없이 O(1)입니다.
+        return is_all_selected(self._displayed_ids, self._selected_on_page)
 
         # 일부만 선택되었으면 '중간 상태' 이거는 자바 스크립트에서 만 구현가능
         # return "indeterminate"
@@ -104,84 +166,198 @@ class UserAdminState(BaseState):
     def set_department_id(self, selected_id: str):
         self.form_data = {**self.form_data, "department_id": selected_id}
 
-        # 개별 사용자 선택/해제 토글
+    # 개별 사용자 선택/해제 토글
     def toggle_user_selection(self, user_id: int):
         """지정된 사용자 ID를 선택 목록에 추가하거나 제거합니다."""
-        if user_id in self.selected_user_ids:
-            self.selected_user_ids.remove(user_id)
-        else:
-            self.selected_user_ids.add(user_id)
+        self._selected_on_page = toggle_selection(
+            user_id, self._displayed_ids, self.selected_user_ids, self._selected_on_page
+        )
 
     # 전체 선택/해제 토글
     def toggle_select_all(self):
         """현재 표시된 모든 사용자를 선택하거나 전체 선택을 해제합니다."""
-        displayed_ids = {user.id for user in self.display_users}
-
         # 현재 표시된 항목들이 모두 선택된 상태가 아니면, 모두 선택
-        if not displayed_ids.issubset(self.selected_user_ids):
-            self.selected_user_ids.update(displayed_ids)
+        if not is_all_selected(self._displayed_ids, self._selected_on_page):
+            self.selected_user_ids.update(self._displayed_ids)
+            self._selected_on_page = len(self._displayed_ids)
         else:
             # 모두 선택된 상태이면, 현재 표시된 항목들만 선택 해제
-            self.selected_user_ids.difference_update(displayed_ids)
+            self.selected_user_ids.difference_update(self._displayed_ids)
+            self._selected_on_page = 0
 
     # --- 이벤트 핸들러 ---
-    # 페이지 로드 시 원본 부서 목록을 가져오는 함수
-    def load_users_page(self):
-        self.check_login()
-        with rx.session() as session:
-            statement = select(User).options(selectinload(User.department)).order_by(User.id)
-            self.users = session.exec(statement).all()
-
-            departments_from_db = session.exec(select(Department).order_by(Department.name)).all()
-            self.department_options = [
-                {"id": str(dept.id), "name": f"{dept.name} ({dept.code})"}
-                for dept in departments_from_db
-            ]
+    # 페이지 로드 시 첫 페이지와 원본 부서 목록을 가져오는 함수
+    async def load_users_page(self):
+        #  권한이 없으면 DB 조회 없이 바로 리다이렉트합니다.
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        await self._load_page()
+        await self._load_departments()
+
+    async def _load_departments(self):
+        """부서 옵션을 프로세스 전역 캐시에서 가져옵니다. (캐시가 유효하면 쿼리 없음)"""
+        lookup = await get_department_lookup()
+        # 캐시 값은 모든 세션이 공유하므로 상태에는 복사본을 넣습니다.
+        self.department_options = list(lookup.options)
+        self._department_names = dict(lookup.names)
+
+    async def refresh(self):
+        """현재 페이지와 부서 목록을 DB에서 다시 조회합니다. (새로고침 버튼)"""
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        await self.reload_current_page()
+        await self._load_departments()
+
+    def _current_filter(self) -> UserFilter:
+        """화면의 필터 입력값을 조회 조건으로 변환합니다."""
+        department_id = None
+        if self.filter_department_id and self.filter_department_id != ALL_DEPARTMENTS:
+            department_id = int(self.filter_department_id)
+        return UserFilter(search=self.filter_search_term.strip(), department_id=department_id)
+
+    async def _load_page(self, after_id: Optional[int] = None, before_id: Optional[int] = None):
+        """키셋 페이지네이션으로 한 페이지를 조회하여 상태에 반영합니다."""
+        #  페이지 이동/검색 이벤트도 권한이 없으면 조회하지 않습니다.
+        if self._deny_access(USERS_ROUTE) is not None:
+            return
+        filters = self._current_filter()
+        page_size = self.page_size
+        # 추정치는 테이블 전체 기준이므로 필터가 없을 때만 표시합니다.
+        with_estimate = self.show_total_estimate and filters.is_empty
+
+        def query(session):
+            page = fetch_user_page(session, page_size, after_id=after_id, before_id=before_id, filters=filters)
+            estimate = estimate_user_count(session) if with_estimate else None
+            return page, estimate
+
+        page, self.total_user_estimate = await db.run(query)
+
+        self.page_first_id = self.page_last_id = None
+        self._set_page_rows(page.rows)
+        self.has_next_page = page.has_next
+        self.has_prev_page = page.has_prev
+
+    def _set_page_rows(self, rows: list[User]):
+        """조회된 행을 표시용 목록으로 투영하고 선택 상태 보조 값을 갱신합니다."""
+        self.display_users, self._projection_cache = project_users(rows, self._projection_cache)
+        self._sync_page_state()
+
+    def _sync_page_state(self):
+        """표시 목록이 바뀐 뒤 선택 상태 보조 값과 페이지 경계 ID를 맞춥니다."""
+        self._displayed_ids = {user.id for user in self.display_users}
+        self._selected_on_page = count_selected(self._displayed_ids, self.selected_user_ids)
+        if self.display_users:
+            self.page_first_id = self.display_users[0].id
+            self.page_last_id = self.display_users[-1].id
+
+    # --- 저장 결과로 현재 페이지의 행만 고치기 (전체 재조회 없음) ---
+    def _patch_user_row(self, row):
+        """
+        생성/수정된 행 하나를 현재 페이지에 반영합니다.
+        - 표시 중인 행이면 교체하고, 검색 조건에서 벗어났으면 제거합니다.
+        - 새 행(가장 큰 id)은 마지막 페이지를 보고 있고 자리가 남았을 때만 끝에 추가합니다.
+        """
+        item = row_to_user_list(row)
+        # 투영 캐시의 서명은 ORM 행 기준이므로 다음 조회 때 다시 투영하도록 비웁니다.
+        self._projection_cache.pop(item.id, None)
+        matches = self._current_filter().matches(row.login_id, row.name, row.email, row.department_id)
+        index = next((i for i, user in enumerate(self.display_users) if user.id == item.id), None)
+
+        if index is not None:
+            if matches:
+                self.display_users[index] = item
+            else:
+                del self.display_users[index]
+        elif matches and not self.has_next_page and (self.page_last_id is None or item.id > self.page_last_id):
+            if len(self.display_users) < self.page_size:
+                self.display_users.append(item)
+            else:
+                self.has_next_page = True
+        self._sync_page_state()
+
+    async def _remove_user_rows(self, user_ids: Set[int]):
+        """삭제된 행을 현재 페이지에서 제거합니다. 페이지가 비면 그 위치를 다시 조회합니다."""
+        if not user_ids & self._displayed_ids:
+            return
+        for user_id in user_ids:
+            self._projection_cache.pop(user_id, None)
+        self.display_users = [user for user in self.display_users if user.id not in user_ids]
+        self._sync_page_state()
+        if not self.display_users:
+            await self.reload_current_page()
+
+    def _update_user_rows(self, user_ids: Set[int], **changes):
+        """일괄 작업으로 바뀐 필드를 현재 페이지의 해당 행에만 반영합니다."""
+        for index, user in enumerate(self.display_users):
+            if user.id in user_ids:
+                self._projection_cache.pop(user.id, None)
+                self.display_users[index] = user.copy(update=changes)
+
+    async def next_page(self):
+        """다음 페이지로 이동합니다."""
+        if self.has_next_page and self.page_last_id is not None:
+            await self._load_page(after_id=self.page_last_id)
+
+    async def prev_page(self):
+        """이전 페이지로 이동합니다."""
+        if self.has_prev_page and self.page_first_id is not None:
+            await self._load_page(before_id=self.page_first_id)
+
+    async def reload_current_page(self):
+        """현재 페이지의 첫 행부터 다시 조회합니다. (데이터 변경 후 사용)"""
+        after_id = self.page_first_id - 1 if self.page_first_id is not None else None
+        await self._load_page(after_id=after_id)
+        # 현재 페이지의 행이 모두 삭제되었으면 이전 페이지를 보여줍니다.
+        if not self.display_users and after_id is not None:
+            await self._load_page(before_id=after_id + 1)
+
+    async def set_filter_search(self, term: str):
+        """검색어를 변경하고 첫 페이지부터 다시 조회합니다. (입력은 UI에서 디바운스됩니다)"""
+        self.filter_search_term = term
+        await self._load_page()
+
+    async def set_filter_department(self, department_id: str):
+        """부서 필터를 변경하고 첫 페이지부터 다시 조회합니다."""
+        self.filter_department_id = department_id
+        await self._load_page()
+
+    async def apply_filters(self):
+        """현재 필터 조건으로 첫 페이지부터 다시 조회합니다."""
+        await self._load_page()
+
+    async def set_page_size(self, size: str):
+        """페이지당 행 수를 변경하고 첫 페이지부터 다시 조회합니다."""
+        self.page_size = int(size)
+        await self._load_page()
 
     def open_create_modal(self):
         self.is_edit = False
         self.form_data = {}
         self.show_modal = True
 
-    def open_edit_modal(self, user_id: int):
+    async def open_edit_modal(self, user_id: int):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
         self.is_edit = True
-        with rx.session() as session:
-            user = session.get(User, user_id)
-            if user:
-                # 1. 모델 객체를 딕셔너리로 변환하는 더 깔끔한 방식입니다.
-                form_data = user.model_dump()
-
-                # 2. department는 객체이므로 제거 (department_id 사용)
-                form_data.pop("department", None)
-
-                # 3. 역할(Enum)을 Select 컴포넌트가 사용할 값(정수)으로 변환합니다.
-                role_value = form_data.get("role")
-                if isinstance(role_value, enum.Enum):
-                    form_data["role"] = role_value.value
-
-                # 4. 모든 값을 문자열로 변환하되, 'None'은 그대로 유지합니다.
-                #    이것이 UniqueViolation 오류를 막는 핵심입니다.
-                for key, value in form_data.items():
-                    if value is not None:
-                        form_data[key] = str(value)
-
-                self.form_data = form_data
-                self.show_modal = True
-            else:
-                return rx.window_alert("사용자를 찾을 수 없습니다.")
+        form_data = await db.run(get_user_form, user_id)
+        if form_data is None:
+            return rx.window_alert("사용자를 찾을 수 없습니다.")
+        self.form_data = form_data
+        self.show_modal = True
 
     def set_show_modal(self, open: bool):
         self.show_modal = open
 
-    def handle_submit(self, form_data: dict):
+    async def handle_submit(self, form_data: dict):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
         #  기존 form_data에 새로 받은 form_data를 병합합니다.
         self.form_data = {**self.form_data, **form_data}
         if self.is_edit:
-            self.update_user()
-        else:
-            self.create_user()
+            return await self.update_user()
+        return await self.create_user()
 
-    def create_user(self):
+    async def create_user(self):
         login_id = self.form_data.get("login_id")
         email = self.form_data.get("email")
         password = self.form_data.get("password")
@@ -189,73 +365,201 @@ class UserAdminState(BaseState):
         if not login_id or not password or not email:
             return rx.window_alert("로그인 ID, 이메일, 비밀번호는 필수입니다.")
 
-        with rx.session() as session:
-            if session.exec(select(User).where(User.login_id == login_id)).one_or_none():
-                return rx.window_alert("이미 사용 중인 로그인 ID입니다.")
-            if session.exec(select(User).where(User.email == email)).one_or_none():
-                return rx.window_alert("이미 등록된 이메일입니다.")
-
-            hashed_password = get_password_hash(password)
-            user_data = {k: v for k, v in self.form_data.items() if k not in ["password", "id"] and v}
-
-            if 'role' in user_data:
-                user_data['role'] = UserRole(int(user_data['role']))
-            if 'department_id' in user_data:
-                user_data['department_id'] = int(user_data['department_id'])
-
-            new_user = User(**user_data, password_hash=hashed_password)
-            session.add(new_user)
-            session.commit()
-
-        self.close_and_reload()
-
-    def update_user(self):
-        user_id = int(self.form_data.get("id", 0))
-        with rx.session() as session:
-            user_to_update = session.get(User, user_id)
-            if not user_to_update:
-                return rx.window_alert("사용자를 찾을 수 없습니다.")
-
-            update_data = self.form_data.copy()
-            for key, value in update_data.items():
-                if key in ["id", "login_id", "password", "created_at", "updated_at"]:
-                    continue
-
-                field_value = value
-                if key == 'role' and value:
-                    field_value = UserRole(int(value))
-                elif key == 'department_id':
-                    # 값이 있으면 정수형으로, 없으면 None으로
-                    field_value = int(value) if value else None
-                elif key == 'is_active':
-                    field_value = str(value).lower() in ['true', '1']
-                # code 필드가 빈 문자열이면 None으로 처리
-                elif key == 'code' and not value:
-                    field_value = None
-
-                setattr(user_to_update, key, field_value)
-
-            session.add(user_to_update)
-            session.commit()
-
-        self.close_and_reload()
-
-    def delete_user(self, user_id: int):
-        with rx.session() as session:
-            user_to_delete = session.get(User, user_id)
-            if not user_to_delete:
-                return rx.window_alert("사용자를 찾을 수 없습니다.")
-            if user_to_delete.role == UserRole.ADMIN:
-                return rx.window_alert("관리자 계정은 삭제할 수 없습니다.")
-
-            session.delete(user_to_delete)
-            session.commit()
-        self.load_users_page()
-
-    def close_and_reload(self):
+        try:
+            hashed_password = await hash_password_async(password)
+        except HashQueueFullError as e:
+            return rx.window_alert(str(e))
+        error, row = await db.run(commands.create_user, dict(self.form_data), hashed_password)
+        if error:
+            return rx.window_alert(error)
+        self._patch_user_row(row)
+        self.close_modal()
+
+    async def update_user(self):
+        error, row = await db.run(commands.update_user, dict(self.form_data))
+        if error:
+            return rx.window_alert(error)
+        self._patch_user_row(row)
+        self.close_modal()
+
+    async def delete_user(self, user_id: int):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        error = await db.run(commands.delete_user, user_id)
+        if error:
+            return rx.window_alert(error)
+        self.selected_user_ids.discard(user_id)
+        await self._remove_user_rows({user_id})
+
+    def close_modal(self):
         self.show_modal = False
         self.form_data = {}
-        self.load_users_page()
+
+    # --- 일괄 작업 (선택된 사용자 대상, 작업마다 SQL 문 하나로 실행) ---
+    async def _run_bulk(self, action_name: str, fn, *args) -> Optional[Set[int]]:
+        """
+        일괄 작업을 실행하고 행별 결과를 요약 상태에 반영합니다.
+        처리된 사용자 ID 집합을 반환하며, 화면 행은 호출한 핸들러가 고칩니다.
+        제약 위반으로 작업 전체가 취소되면 요약에 오류를 표시하고 선택은 유지합니다.
+        """
+        if not self.selected_user_ids:
+            return None
+
+        result: commands.BulkResult = await db.run(fn, list(self.selected_user_ids), *args)
+        if result.error:
+            self.bulk_summary = f"{action_name} 실패: {result.error}"
+            self.bulk_failures = []
+            return None
+
+        total = len(result.outcomes)
+        done = result.counts()[commands.BULK_OK]
+        self.bulk_summary = f"{action_name}: 총 {total}명 중 {done}명 처리"
+        if done < total:
+            self.bulk_summary += f", {total - done}명 실패"
+        self.bulk_failures = [
+            {"id": user_id, "reason": commands.BULK_STATUS_LABELS[outcome]}
+            for user_id, outcome in sorted(result.outcomes.items())
+            if outcome != commands.BULK_OK
+        ]
+        self.clear_selection()
+        return set(result.ids_with(commands.BULK_OK))
+
+    async def bulk_activate(self):
+        return await self._bulk_set_active("활성화", True)
+
+    async def bulk_deactivate(self):
+        return await self._bulk_set_active("비활성화", False)
+
+    async def _bulk_set_active(self, action_name: str, is_active: bool):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        changed = await self._run_bulk(action_name, commands.bulk_set_active, is_active)
+        if changed:
+            self._update_user_rows(changed, is_active=is_active)
+
+    async def bulk_change_department(self, department_id: str):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        new_id = int(department_id) if department_id and department_id != NO_DEPARTMENT else None
+        changed = await self._run_bulk("부서 변경", commands.bulk_change_department, new_id)
+        if not changed:
+            return
+        filter_department_id = self._current_filter().department_id
+        if filter_department_id is not None and filter_department_id != new_id:
+            # 부서 필터에서 벗어난 행은 현재 목록에서 뺍니다.
+            await self._remove_user_rows(changed)
+        else:
+            self._update_user_rows(changed, department_name=self._department_names.get(new_id, "N/A"))
+
+    async def bulk_change_role(self, role: str):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        new_role = UserRole(int(role))
+        changed = await self._run_bulk("역할 변경", commands.bulk_change_role, new_role)
+        if changed:
+            self._update_user_rows(changed, role_name=new_role.name)
+
+    async def bulk_delete(self):
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        changed = await self._run_bulk("삭제", commands.bulk_delete_users)
+        if changed:
+            await self._remove_user_rows(changed)
+
+    # --- 일괄 등록 ---
+    def set_show_import_modal(self, value: bool):
+        self.show_import_modal = value
+
+    def open_import_modal(self):
+        self.import_summary = ""
+        self.import_errors = []
+        self._import_error_csv = ""
+        self.show_import_modal = True
+
+    async def handle_import_upload(self, files: list[rx.UploadFile]):
+        """업로드된 파일을 업로드 폴더에 저장하고 백그라운드 등록 작업을 시작합니다."""
+        if (denied := self._deny_access(USERS_ROUTE)) is not None:
+            return denied
+        if self.import_in_progress:
+            return rx.window_alert("이미 일괄 등록이 진행 중입니다.")
+        if not files:
+            return rx.window_alert("업로드할 파일을 선택해주세요.")
+
+        file = files[0]
+        suffix = os.path.splitext(file.name or "")[1].lower()
+        if suffix not in (".csv", ".xlsx"):
+            return rx.window_alert("CSV 또는 XLSX 파일만 업로드할 수 있습니다.")
+
+        # 등록은 작업 큐 워커가 실행하므로 파일은 워커와 공유하는 업로드 폴더에 저장합니다.
+        upload_dir = rx.get_upload_dir() / "user_import"
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        path = upload_dir / f"{uuid.uuid4().hex}{suffix}"
+        path.write_bytes(await file.read())
+
+        self._import_job_id = await enqueue(
+            IMPORT_USERS_TASK,
+            {"path": str(path), "filename": file.name},
+            title=f"사용자 일괄 등록: {file.name}",
+            description=f"요청자: {self.logged_in_user.login_id}",
+        )
+        self.import_in_progress = True
+        self.import_summary = ""
+        self.import_errors = []
+        return UserAdminState.watch_import_job
+
+    @rx.event(background=True)
+    async def watch_import_job(self):
+        """일괄 등록 작업이 끝날 때까지 상태를 확인하고 결과를 화면에 반영합니다. (상태 잠금을 잡지 않음)"""
+        async with self:
+            job_id = self._import_job_id
+        if job_id is None:
+            return
+
+        deadline = time.monotonic() + IMPORT_WATCH_TIMEOUT
+        job = None
+        while time.monotonic() < deadline:
+            await asyncio.sleep(IMPORT_POLL_INTERVAL)
+            job = await db.run(get_job, job_id)
+            if job is None or job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+                break
+
+        async with self:
+            if self._import_job_id != job_id:
+                return
+            self._import_job_id = None
+            self.import_in_progress = False
+            if job is None or job.status not in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+                self.import_summary = "등록 작업이 아직 끝나지 않았습니다. 잠시 후 목록을 새로고침해주세요."
+                return
+            if job.status == JobStatus.FAILED:
+                self.import_summary = "등록 작업이 실패했습니다. 관리자에게 문의해주세요."
+                return
+            if job.result.get("format_error"):
+                self.import_summary = job.result["format_error"]
+                return
+            report = importer.ImportReport.from_dict(job.result)
+            self.import_summary = report.summary
+            self.import_errors = [asdict(error) for error in report.errors[:IMPORT_ERROR_PREVIEW]]
+            self._import_error_csv = report.error_csv() if report.errors else ""
+        return UserAdminState.reload_current_page
+
+    def download_import_errors(self):
+        if not self._import_error_csv:
+            return
+        return rx.download(data=self._import_error_csv, filename="user_import_errors.csv")
+
+    # --- 내보내기 ---
+    def export_users(self, file_format: str):
+        return _export_redirect(self, USERS_ROUTE, "users", file_format)
+
+    def clear_selection(self):
+        """선택을 모두 해제합니다."""
+        self.selected_user_ids = set()
+        self._selected_on_page = 0
+
+    def clear_bulk_result(self):
+        self.bulk_summary = ""
+        self.bulk_failures = []
 
 
 class DeptAdminState(BaseState):
@@ -269,10 +573,14 @@ class DeptAdminState(BaseState):
     def set_form_field(self, field: str, value: str):
         self.form_data = {**self.form_data, field: value}
 
-    def load_depts_page(self):
-        self.check_login()
-        with rx.session() as session:
-            self.departments = session.exec(select(Department).order_by(Department.name)).all()
+    def export_departments(self, file_format: str):
+        return _export_redirect(self, DEPARTMENTS_ROUTE, "departments", file_format)
+
+    async def load_depts_page(self):
+        #  권한이 없으면 DB 조회 없이 바로 리다이렉트합니다.
+        if (denied := self._deny_access(DEPARTMENTS_ROUTE)) is not None:
+            return denied
+        self.departments = list(await get_departments())
 
     def open_create_modal(self):
         self.is_edit = False
@@ -291,64 +599,48 @@ class DeptAdminState(BaseState):
     def set_show_modal(self, open: bool):
         self.show_modal = open
 
-    def handle_submit(self, form_data: dict):
+    async def handle_submit(self, form_data: dict):
+        if (denied := self._deny_access(DEPARTMENTS_ROUTE)) is not None:
+            return denied
         #  기존 form_data에 새로 받은 form_data를 병합합니다.
         self.form_data = {**self.form_data, **form_data}
         if self.is_edit:
-            self.update_department()
-        else:
-            self.create_department()
+            return await self.update_department()
+        return await self.create_department()
 
-    def create_department(self):
+    async def create_department(self):
         code = self.form_data.get("code")
         name = self.form_data.get("name")
         if not code or not name:
             return rx.window_alert("부서 코드와 이름은 필수입니다.")
 
-        with rx.session() as session:
-            if session.exec(select(Department).where(Department.code == code)).first():
-                return rx.window_alert("이미 사용 중인 부서 코드입니다.")
-            if session.exec(select(Department).where(Department.name == name)).first():
-                return rx.window_alert("이미 사용 중인 부서 이름입니다.")
-
-            new_dept = Department(
-                code=code,
-                name=name,
-                notes=self.form_data.get("notes"),
-            )
-            session.add(new_dept)
-            session.commit()
-
-        self.close_and_reload()
-
-    def update_department(self):
-        dept_id = self.form_data.get("id")
-        with rx.session() as session:
-            dept_to_update = session.get(Department, dept_id)
-            if not dept_to_update:
-                return rx.window_alert("부서를 찾을 수 없습니다.")
-
-            dept_to_update.name = self.form_data.get("name")
-            dept_to_update.notes = self.form_data.get("notes")
-
-            session.add(dept_to_update)
-            session.commit()
-
-        self.close_and_reload()
-
-    def delete_department(self, dept_id: int):
-        with rx.session() as session:
-            user_count = session.exec(select(User).where(User.department_id == dept_id)).first()
-            if user_count:
-                return rx.window_alert("소속된 사용자가 있어 부서를 삭제할 수 없습니다.")
-
-            dept_to_delete = session.get(Department, dept_id)
-            if dept_to_delete:
-                session.delete(dept_to_delete)
-                session.commit()
-        self.load_depts_page()
-
-    def close_and_reload(self):
+        error, department = await db.run(commands.create_department, dict(self.form_data))
+        if error:
+            return rx.window_alert(error)
+        self._put_department(department)
+        self.close_modal()
+
+    async def update_department(self):
+        error, department = await db.run(commands.update_department, dict(self.form_data))
+        if error:
+            return rx.window_alert(error)
+        self._put_department(department)
+        self.close_modal()
+
+    async def delete_department(self, dept_id: int):
+        if (denied := self._deny_access(DEPARTMENTS_ROUTE)) is not None:
+            return denied
+        error = await db.run(commands.delete_department, dept_id)
+        if error:
+            return rx.window_alert(error)
+        self.departments = [dept for dept in self.departments if dept.id != dept_id]
+
+    def _put_department(self, department: Department):
+        """저장된 부서 하나를 목록에 넣거나 교체하고, 조회와 같은 이름순을 유지합니다."""
+        departments = [dept for dept in self.departments if dept.id != department.id]
+        departments.append(department)
+        self.departments = sorted(departments, key=lambda dept: dept.name)
+
+    def close_modal(self):
         self.show_modal = False
         self.form_data = {}
-        self.load_depts_page()
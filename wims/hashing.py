@@ -0,0 +1,151 @@
+# /wims_project/wims/hashing.py
+"""
+bcrypt 해싱/검증을 이벤트 루프 밖의 프로세스 풀에서 실행하는 서비스입니다.
+
+bcrypt 한 번에 수십~수백 ms의 CPU를 사용하므로 이벤트 핸들러에서 직접 호출하면
+그동안 같은 워커의 모든 웹소켓 세션이 멈춥니다. 이 모듈은 정해진 크기의 프로세스 풀과
+대기열 상한을 두고, 대기열이 가득 차면 즉시 HashQueueFullError를 발생시켜
+교대 시간처럼 로그인이 몰릴 때 요청이 무한정 쌓이지 않도록 합니다.
+
+환경 변수:
+    WIMS_HASH_WORKERS: 해싱 프로세스 수 (기본값: CPU 수의 절반, 최소 1)
+    WIMS_HASH_QUEUE_SIZE: 작업 중인 것 외에 대기할 수 있는 최대 요청 수 (기본값: 64)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+from .utils import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class HashQueueFullError(RuntimeError):
+    """해싱 대기열이 가득 차 요청을 받을 수 없을 때 발생합니다."""
+
+
+def _hash_chunk(passwords: List[str]) -> List[str]:
+    """작업 프로세스에서 비밀번호 묶음을 해싱합니다. (spawn으로 전달되므로 모듈 수준 함수)"""
+    return [get_password_hash(password) for password in passwords]
+
+
+class PasswordHasher:
+    """
+    크기가 제한된 프로세스 풀과 대기열로 bcrypt 연산을 처리합니다.
+    풀은 첫 요청 시점에 생성됩니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        #  제출되었지만 아직 끝나지 않은 요청 수 (작업 중 + 대기 중)
+        self._pending = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "PasswordHasher":
+        default_workers = max(1, (os.cpu_count() or 2) // 2)
+        return cls(
+            max_workers=int(os.getenv("WIMS_HASH_WORKERS", default_workers)),
+            max_queue=int(os.getenv("WIMS_HASH_QUEUE_SIZE", 64)),
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    #  스레드가 있는 프로세스에서 fork하지 않도록 spawn을 사용합니다.
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _acquire_slot(self):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise HashQueueFullError("비밀번호 처리 요청이 많아 잠시 후 다시 시도해주세요.")
+            self._pending += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._pending - self.max_workers)
+
+    def _release_slot(self):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    async def _submit(self, fn: Callable[..., T], *args) -> T:
+        self._acquire_slot()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._release_slot()
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """verify_password()를 프로세스 풀에서 실행합니다."""
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """get_password_hash()를 프로세스 풀에서 실행합니다."""
+        return await self._submit(get_password_hash, password)
+
+    async def hash_many(self, passwords: Sequence[str], chunk_size: int = 16) -> List[str]:
+        """
+        여러 비밀번호를 입력 순서대로 해싱합니다. (일괄 등록용)
+
+        비밀번호를 chunk_size개씩 묶어 프로세스 간 전달 비용을 줄이고,
+        동시에 실행하는 묶음 수를 워커 수보다 하나 적게 제한해
+        일괄 등록 중에도 로그인 요청이 바로 처리될 워커를 남겨 둡니다.
+        """
+        chunks = [list(passwords[i:i + chunk_size]) for i in range(0, len(passwords), chunk_size)]
+        limit = asyncio.Semaphore(max(1, self.max_workers - 1))
+
+        async def hash_chunk(chunk: List[str]) -> List[str]:
+            async with limit:
+                return await self._submit(_hash_chunk, chunk)
+
+        results = await asyncio.gather(*(hash_chunk(chunk) for chunk in chunks))
+        return [hashed for chunk in results for hashed in chunk]
+
+    def stats(self) -> Dict[str, int]:
+        """대기열 상태 지표를 반환합니다."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_limit": self.max_queue,
+                "in_flight": min(self._pending, self.max_workers),
+                "queue_depth": max(0, self._pending - self.max_workers),
+                "peak_queue_depth": self._peak_queue_depth,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """프로세스 풀을 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+#  프로세스 전역에서 공유하는 해싱 서비스
+hasher = PasswordHasher.from_env()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """이벤트 루프를 막지 않고 비밀번호를 검증합니다."""
+    return await hasher.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """이벤트 루프를 막지 않고 비밀번호를 해싱합니다."""
+    return await hasher.hash(password)
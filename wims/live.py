@@ -0,0 +1,276 @@
+# /wims_project/wims/live.py
+"""
+측정값 실시간 표시를 위한 프로세스 전역 허브입니다.
+
+- 적재 함수는 배치를 publish()로 넘깁니다. 배치는 먼저 태그별 마지막 값 하나로 줄어들고(numpy),
+  화면에 그 태그를 띄운 세션이 있을 때만 값이 보관되고 해당 구독에 '변경됨' 표시가 붙습니다.
+  따라서 publish 비용은 배치 크기 x 세션 수가 아니라 (배치 태그 중 화면에 보이는 태그 수)에 비례합니다.
+- 세션은 화면에 보이는 태그로 subscribe()하고 next_frame()을 반복 호출합니다. next_frame()은
+  세션당 초당 MAX_FPS번을 넘지 않도록 기다린 뒤, 그동안 바뀐 태그의 마지막 값만 돌려줍니다. (합치기)
+  같은 태그가 그 사이 여러 번 바뀌어도 프레임에는 한 번만 들어갑니다.
+- Redis URL(WIMS_LIVE_REDIS_URL, 없으면 WIMS_REDIS_URL)이 있으면 publish()는 Redis 채널로 보내고,
+  각 웹 워커의 수신 태스크가 받아 자기 허브에 반영합니다. 적재가 다른 프로세스(작업 워커, 다른 노드)에서 일어나도 모든 세션이 받습니다.
+  설정하지 않으면 같은 프로세스 안에서만 전달됩니다.
+
+Redis 메시지는 (tag_id, ts, value, quality) 고정 길이 레코드를 이어 붙인 바이너리이며, 태그당 한 개입니다.
+
+환경 변수:
+    WIMS_LIVE_REDIS_URL: 프로세스 간 전달에 사용할 Redis URL (예: redis://localhost:6379/0).
+        지정하지 않으면 세션 상태 저장용 WIMS_REDIS_URL을 함께 사용합니다.
+    WIMS_LIVE_MAX_FPS: 세션당 초당 최대 프레임 수 (기본값: 2)
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("WIMS_LIVE_REDIS_URL") or os.getenv("WIMS_REDIS_URL", "")
+REDIS_CHANNEL = "wims:live"
+MAX_FPS = float(os.getenv("WIMS_LIVE_MAX_FPS", 2))
+
+#  (ts: UTC 기준 Unix epoch 마이크로초, value, quality)
+Point = Tuple[int, float, int]
+
+#  Redis 메시지의 레코드 하나 (리틀 엔디언, 정렬 없음)
+_WIRE_ROW = np.dtype([("tag_id", "<i4"), ("ts", "<i8"), ("value", "<f8"), ("quality", "<i2")])
+
+
+def last_per_tag(tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray) -> np.ndarray:
+    """배치를 태그별로 가장 늦은 시각의 값 하나씩으로 줄여 _WIRE_ROW 배열로 반환합니다."""
+    order = np.lexsort((ts, tag_id))
+    tags = tag_id[order]
+    last = order[np.append(tags[1:] != tags[:-1], True)] if len(tags) else order
+    rows = np.empty(len(last), dtype=_WIRE_ROW)
+    rows["tag_id"] = tag_id[last]
+    rows["ts"] = ts[last]
+    rows["value"] = value[last]
+    rows["quality"] = quality[last]
+    return rows
+
+
+class Subscription:
+    """세션 하나의 구독. 바뀐 태그를 모아 두었다가 next_frame()에서 한 번에 돌려줍니다."""
+
+    def __init__(self, hub: "LiveHub", tags: Iterable[int], loop: asyncio.AbstractEventLoop, max_fps: float):
+        self._hub = hub
+        self._loop = loop
+        self._interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._event = asyncio.Event()
+        #  아래 두 값은 허브 잠금 안에서만 바꿉니다. (publish는 다른 스레드에서 호출될 수 있음)
+        self._dirty: Set[int] = set()
+        self._signaled = False
+        self._last_frame = 0.0
+        self.tags: FrozenSet[int] = frozenset()
+        self.closed = False
+        hub._attach(self, frozenset(tags))
+
+    def _mark(self, tag_id: int):
+        """허브 잠금 안에서 호출됩니다. 프레임당 한 번만 이벤트 루프를 깨웁니다."""
+        self._dirty.add(tag_id)
+        if not self._signaled:
+            self._signaled = True
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def update(self, tags: Iterable[int]):
+        """구독 태그를 바꿉니다. 새로 추가된 태그의 마지막 값은 다음 프레임에 들어갑니다."""
+        self._hub._attach(self, frozenset(tags))
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._hub._detach(self)
+
+    async def next_frame(self, timeout: Optional[float] = None) -> Dict[int, Point]:
+        """
+        바뀐 태그의 마지막 값을 돌려줍니다. 이전 프레임에서 1/MAX_FPS초가 지나기 전에는 돌려주지 않으며,
+        timeout(초) 안에 바뀐 값이 없으면 빈 dict를 돌려줍니다.
+        """
+        started = time.monotonic()
+        wait = self._last_frame + self._interval - started
+        if wait > 0:
+            #  기다리는 동안 들어온 값은 이번 프레임에 합쳐집니다.
+            await asyncio.sleep(wait)
+        remaining = None if timeout is None else max(timeout - (time.monotonic() - started), 0.0)
+        try:
+            await asyncio.wait_for(self._event.wait(), remaining)
+        except asyncio.TimeoutError:
+            return {}
+        frame = self._hub._take(self)
+        self._last_frame = time.monotonic()
+        return frame
+
+
+class LiveHub:
+    """태그 -> 구독 색인과 구독 중인 태그의 마지막 값을 보관하는 허브"""
+
+    def __init__(self, redis_url: str = "", max_fps: float = MAX_FPS):
+        self.redis_url = redis_url
+        self.max_fps = max_fps
+        self._lock = threading.Lock()
+        self._by_tag: Dict[int, Set[Subscription]] = {}
+        #  구독 중인 태그 ID (정렬된 배열, publish의 np.isin용)
+        self._watched = np.empty(0, dtype=np.int32)
+        self._latest: Dict[int, Point] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self.published = 0
+        self.delivered = 0
+
+    # --- 구독 ---
+    def subscribe(self, tags: Iterable[int]) -> Subscription:
+        """이벤트 루프 안에서 호출합니다. Redis를 사용하면 처음 구독할 때 수신 태스크를 시작합니다."""
+        loop = asyncio.get_running_loop()
+        if self.redis_url and (self._listener is None or self._listener.done()):
+            self._listener = loop.create_task(self._listen())
+        return Subscription(self, tags, loop, self.max_fps)
+
+    def _attach(self, subscription: Subscription, tags: FrozenSet[int]):
+        with self._lock:
+            for tag_id in subscription.tags - tags:
+                self._unwatch(subscription, tag_id)
+            for tag_id in tags - subscription.tags:
+                self._by_tag.setdefault(tag_id, set()).add(subscription)
+                if tag_id in self._latest:
+                    subscription._mark(tag_id)
+            subscription.tags = tags
+            self._watched = np.array(sorted(self._by_tag), dtype=np.int32)
+
+    def _detach(self, subscription: Subscription):
+        with self._lock:
+            for tag_id in subscription.tags:
+                self._unwatch(subscription, tag_id)
+            subscription.tags = frozenset()
+            self._watched = np.array(sorted(self._by_tag), dtype=np.int32)
+
+    def _unwatch(self, subscription: Subscription, tag_id: int):
+        subscribers = self._by_tag.get(tag_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._by_tag[tag_id]
+            self._latest.pop(tag_id, None)
+
+    def _take(self, subscription: Subscription) -> Dict[int, Point]:
+        with self._lock:
+            dirty, subscription._dirty = subscription._dirty, set()
+            subscription._event.clear()
+            subscription._signaled = False
+            frame = {tag_id: self._latest[tag_id] for tag_id in dirty if tag_id in self._latest}
+            self.delivered += len(frame)
+            return frame
+
+    # --- 발행 ---
+    def publish(self, tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray):
+        """
+        적재된 배치를 알립니다. 어느 스레드에서든 호출할 수 있으며 예외를 밖으로 내보내지 않습니다.
+        (실시간 표시 실패가 적재를 실패시키지 않도록)
+        """
+        if not len(tag_id):
+            return
+        try:
+            rows = last_per_tag(tag_id, ts, value, quality)
+            if self.redis_url:
+                self._publish_redis(rows)
+            else:
+                self.apply(rows)
+        except Exception:  # noqa: BLE001
+            logger.warning("실시간 값 발행 실패", exc_info=True)
+
+    def apply(self, rows: np.ndarray):
+        """태그별 마지막 값(_WIRE_ROW 배열)을 구독에 반영합니다."""
+        watched = self._watched
+        if not len(watched):
+            return
+        rows = rows[np.isin(rows["tag_id"], watched)]
+        if not len(rows):
+            return
+        with self._lock:
+            for tag_id, ts, value, quality in rows.tolist():
+                subscribers = self._by_tag.get(tag_id)
+                if not subscribers:
+                    continue
+                previous = self._latest.get(tag_id)
+                #  늦게 도착한 과거 값으로 현재값을 되돌리지 않습니다.
+                if previous is not None and previous[0] > ts:
+                    continue
+                self._latest[tag_id] = (ts, value, quality)
+                for subscription in subscribers:
+                    subscription._mark(tag_id)
+            self.published += len(rows)
+
+    # --- Redis ---
+    def _publish_redis(self, rows: np.ndarray):
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(self.redis_url)
+        self._redis.publish(REDIS_CHANNEL, rows.tobytes())
+
+    async def _listen(self):
+        """Redis 채널을 구독해 받은 값을 이 프로세스의 허브에 반영합니다. 연결이 끊기면 다시 연결합니다."""
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            logger.warning("redis 패키지가 없어 다른 프로세스의 실시간 값을 받을 수 없습니다.")
+            return
+        backoff = 1.0
+        while True:
+            client = aioredis.Redis.from_url(self.redis_url)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(REDIS_CHANNEL)
+                    backoff = 1.0
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.apply(np.frombuffer(message["data"], dtype=_WIRE_ROW))
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - 연결 실패 시 재시도합니다.
+                logger.warning("실시간 값 Redis 연결이 끊겼습니다. %.0f초 후 다시 연결합니다.", backoff, exc_info=True)
+            finally:
+                await client.aclose()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+    async def close(self):
+        """수신 태스크를 멈추고 Redis 연결을 닫습니다. (워커 종료 시)"""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+        client, self._redis = self._redis, None
+        if client is not None:
+            client.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "tags": len(self._by_tag),
+                "subscriptions": len({s for subscribers in self._by_tag.values() for s in subscribers}),
+                "published": self.published,
+                "delivered": self.delivered,
+            }
+
+
+#  프로세스 전역 허브
+hub = LiveHub(REDIS_URL)
+
+
+def publish(tag_id: np.ndarray, ts: np.ndarray, value: np.ndarray, quality: np.ndarray):
+    """hub.publish()의 단축 함수"""
+    hub.publish(tag_id, ts, value, quality)
+
+
+def subscribe(tags: Iterable[int]) -> Subscription:
+    """hub.subscribe()의 단축 함수"""
+    return hub.subscribe(tags)
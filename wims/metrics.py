@@ -0,0 +1,271 @@
+# /wims_project/wims/metrics.py
+"""
+이벤트 핸들러 계측과 Prometheus 텍스트 형식 출력입니다.
+
+- HandlerMetricsMiddleware(app.add_middleware): 이벤트마다 다음 값을 핸들러별 히스토그램에 모읍니다.
+    처리 시간: 전처리부터 마지막 상태 갱신까지 (중간 yield 포함)
+    DB 시간: db.run() 안에서 보낸 시간 (연결 대기 + 쿼리 + 결과 변환)
+    SQL 수: SQLAlchemy 엔진 이벤트(before_cursor_execute)로 셉니다. 현재 이벤트는 contextvar로 찾으며,
+        db.run()의 스레드(sync)와 greenlet(async)에도 그대로 전달됩니다.
+    delta 크기: 클라이언트로 보내는 상태 변경의 JSON 바이트 수 (WIMS_METRICS_DELTA_SAMPLE 비율만 측정)
+- 한 이벤트의 SQL 수가 QUERY_BUDGET을 넘으면 가장 많이 반복된 SQL과 함께 경고 로그를 남깁니다. (N+1 탐지)
+- 백그라운드 핸들러(@rx.event(background=True))는 화면을 열어 둔 동안 계속 실행되므로 계측하지 않습니다.
+- Exposition은 Prometheus 텍스트 형식을 만듭니다. 값은 워커 프로세스마다 따로 모이므로 GET /api/ops/metrics(wims.ops)는
+  모든 시계열에 pid 레이블을 붙입니다. 수집기에서 워커별로 긁거나 pid를 합산(sum without (pid))해서 봅니다.
+
+환경 변수:
+    WIMS_METRICS_QUERY_BUDGET: 이벤트 하나에 허용하는 SQL 수. 넘으면 경고 로그 (기본값: 20)
+    WIMS_METRICS_DELTA_SAMPLE: delta 크기를 측정할 이벤트 비율 0~1 (기본값: 1). 측정에는 직렬화가 한 번 더 듭니다.
+"""
+
+import bisect
+import contextlib
+import contextvars
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from reflex.middleware import Middleware
+from reflex.utils.format import json_dumps
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET = int(os.getenv("WIMS_METRICS_QUERY_BUDGET", 20))
+DELTA_SAMPLE = float(os.getenv("WIMS_METRICS_DELTA_SAMPLE", 1))
+
+#  히스토그램 구간 상한
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+#  경고 로그에 넣는 SQL 최대 길이
+_LOGGED_STATEMENT_CHARS = 300
+
+
+class Histogram:
+    """고정 구간 히스토그램. 스레드 안전하며 관측 한 번은 이진 탐색 한 번입니다."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> Dict[str, object]:
+        """구간 상한 -> 누적 개수('+Inf'는 전체), 합계, 개수, 최댓값"""
+        with self._lock:
+            counts, total, largest = list(self._counts), self._sum, self._max
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "sum": total, "count": running, "max": largest}
+
+
+# --- 이벤트 계측 ---
+@dataclass
+class _EventRecord:
+    """처리 중인 이벤트 하나의 측정값. contextvar로 DB 계층에 전달됩니다."""
+    handler: str
+    started: float
+    queries: int = 0
+    db_seconds: float = 0.0
+    delta_bytes: int = 0
+    statements: Counter = field(default_factory=Counter)
+
+
+class _HandlerMetrics:
+    def __init__(self):
+        self.seconds = Histogram(SECONDS_BUCKETS)
+        self.db_seconds = Histogram(SECONDS_BUCKETS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.delta_bytes = Histogram(BYTES_BUCKETS)
+        self.over_budget = 0
+
+
+_current: contextvars.ContextVar[Optional[_EventRecord]] = contextvars.ContextVar("wims_event", default=None)
+_handlers: Dict[str, _HandlerMetrics] = {}
+_handlers_lock = threading.Lock()
+
+
+def _handler_metrics(name: str) -> _HandlerMetrics:
+    metrics = _handlers.get(name)
+    if metrics is None:
+        with _handlers_lock:
+            metrics = _handlers.setdefault(name, _HandlerMetrics())
+    return metrics
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record = _current.get()
+    if record is not None:
+        record.queries += 1
+        record.statements[statement] += 1
+
+
+def install_query_counter():
+    """모든 엔진의 SQL 실행을 현재 이벤트에 셉니다. (여러 번 호출해도 한 번만 등록)"""
+    if not sa_event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        sa_event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextlib.contextmanager
+def db_timer():
+    """db.run()이 DB 작업을 감쌉니다. 처리 중인 이벤트가 있으면 걸린 시간을 더합니다."""
+    record = _current.get()
+    if record is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record.db_seconds += time.perf_counter() - started
+
+
+def _finish(record: _EventRecord):
+    elapsed = time.perf_counter() - record.started
+    metrics = _handler_metrics(record.handler)
+    metrics.seconds.observe(elapsed)
+    metrics.db_seconds.observe(record.db_seconds)
+    metrics.queries.observe(record.queries)
+    if record.delta_bytes:
+        metrics.delta_bytes.observe(record.delta_bytes)
+    if record.queries > QUERY_BUDGET:
+        metrics.over_budget += 1
+        statement, repeats = record.statements.most_common(1)[0]
+        logger.warning(
+            "%s: SQL %d개 실행 (예산 %d, %.0f ms, DB %.0f ms). 가장 많이 반복된 SQL(%d회): %s",
+            record.handler, record.queries, QUERY_BUDGET, elapsed * 1000, record.db_seconds * 1000,
+            repeats, " ".join(statement.split())[:_LOGGED_STATEMENT_CHARS],
+        )
+
+
+class HandlerMetricsMiddleware(Middleware):
+    """이벤트 핸들러별 처리 시간, DB 시간, SQL 수, delta 크기를 모으는 미들웨어"""
+
+    def __init__(self):
+        install_query_counter()
+
+    async def preprocess(self, app, state, event):
+        _, handler = state._get_event_handler(event)
+        if handler.is_background:
+            _current.set(None)
+            return None
+        _current.set(_EventRecord(handler=event.name, started=time.perf_counter()))
+        return None
+
+    async def postprocess(self, app, state, event, update):
+        record = _current.get()
+        if record is None or record.handler != event.name:
+            return update
+        if update.delta and random.random() < DELTA_SAMPLE:
+            record.delta_bytes += len(json_dumps(update.delta).encode())
+        if update.final:
+            _current.set(None)
+            _finish(record)
+        return update
+
+
+# --- Prometheus 텍스트 형식 ---
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, object]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class Exposition:
+    """Prometheus 텍스트 형식(0.0.4) 작성기. 모든 시계열에 공통 레이블을 붙입니다."""
+
+    def __init__(self, common: Dict[str, object]):
+        self.common = common
+        self.lines: List[str] = []
+
+    def _header(self, name: str, kind: str, help_text: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, kind: str, help_text: str, values: Iterable[Tuple[Dict[str, object], float]]):
+        """gauge/counter: (레이블, 값) 목록"""
+        self._header(name, kind, help_text)
+        for labels, value in values:
+            self.lines.append(f"{name}{_labels({**self.common, **labels})} {value}")
+
+    def histogram(self, name: str, help_text: str, values: Iterable[Tuple[Dict[str, object], Dict[str, object]]]):
+        """(레이블, Histogram.snapshot()) 목록"""
+        self._header(name, "histogram", help_text)
+        for labels, snapshot in values:
+            labels = {**self.common, **labels}
+            for bound, count in snapshot["buckets"].items():
+                self.lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {count}")
+            self.lines.append(f"{name}_sum{_labels(labels)} {snapshot['sum']}")
+            self.lines.append(f"{name}_count{_labels(labels)} {snapshot['count']}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def write_handler_metrics(out: Exposition):
+    """핸들러별 계측값을 기록합니다."""
+    with _handlers_lock:
+        handlers = sorted(_handlers.items())
+    out.histogram(
+        "wims_handler_seconds", "이벤트 핸들러 처리 시간(초)",
+        [({"handler": name}, m.seconds.snapshot()) for name, m in handlers],
+    )
+    out.histogram(
+        "wims_handler_db_seconds", "이벤트 하나가 db.run() 안에서 보낸 시간(초)",
+        [({"handler": name}, m.db_seconds.snapshot()) for name, m in handlers],
+    )
+    out.histogram(
+        "wims_handler_queries", "이벤트 하나가 실행한 SQL 수",
+        [({"handler": name}, m.queries.snapshot()) for name, m in handlers],
+    )
+    out.histogram(
+        "wims_handler_delta_bytes", "이벤트 하나가 보낸 상태 변경(JSON) 크기(바이트)",
+        [({"handler": name}, m.delta_bytes.snapshot()) for name, m in handlers],
+    )
+    out.sample(
+        "wims_handler_query_budget_exceeded_total", "counter", "SQL 수가 예산을 넘은 이벤트 수",
+        [({"handler": name}, m.over_budget) for name, m in handlers],
+    )
+
+
+def write_pool_metrics(out: Exposition, pools: List[Dict[str, object]]):
+    """DB 연결 풀 현황(db.pool_stats())을 기록합니다."""
+    gauges = [
+        ("size", "유지하는 연결 수(pool_size)"), ("checked_out", "대여 중인 연결 수"), ("idle", "풀에 남은 연결 수"),
+        ("overflow", "pool_size를 넘어 연 연결 수"), ("peak_checked_out", "최대 동시 대여 수"),
+    ]
+    for key, help_text in gauges:
+        out.sample(f"wims_db_pool_{key}", "gauge", help_text, [({"engine": p["engine"]}, p[key]) for p in pools])
+    counters = [
+        ("checkouts", "연결 대여 횟수"), ("overflow_events", "초과 연결을 새로 연 횟수"),
+        ("timeouts", "pool_timeout 초과로 실패한 횟수"),
+    ]
+    for key, help_text in counters:
+        out.sample(
+            f"wims_db_pool_{key}_total", "counter", help_text, [({"engine": p["engine"]}, p[key]) for p in pools],
+        )
+    out.histogram(
+        "wims_db_pool_wait_seconds", "연결을 얻기까지 기다린 시간(초)",
+        [({"engine": p["engine"]}, p["wait_seconds"]) for p in pools],
+    )
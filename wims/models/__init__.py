@@ -1,10 +1,14 @@
 # /wims_project/wims/models/__init__.py
+"""
+모든 테이블 모델을 등록합니다. (alembic autogenerate 등 전체 메타데이터가 필요한 곳에서 import)
+도메인 모델은 wims.domains 레지스트리에 선언된 모델 모듈만 불러오며 페이지/상태는 불러오지 않습니다.
+"""
 
 # flake8: noqa
 #  SQLModel을 여기서 임포트하여 다른 곳에서 쉽게 사용할 수 있도록 합니다.
 from sqlmodel import SQLModel
 
-#  각 도메인 모델 파일에서 모든 모델 클래스를 임포트합니다.
-from wims.domains.usr.models import * 
+from wims.domains import load_models
+from wims.tasks import models as task_models
 
-print("All models imported successfully!")  #  제대로 임포트되는지 확인용
\ No newline at end of file
+load_models()
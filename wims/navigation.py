@@ -0,0 +1,179 @@
+# /wims_project/wims/navigation.py
+"""
+사이드바 메뉴 및 경로 접근 권한(RBAC) 레지스트리.
+
+각 도메인 패키지는 자신의 menu.py에서 register_menu()/register_route()를 호출해 등록하고,
+레지스트리는 처음 조회될 때 한 번만 다음 두 조회표로 컴파일합니다.
+
+- 역할 -> 불변 메뉴 트리: BaseState.filtered_menu가 딕셔너리 조회만 하도록 합니다.
+- 경로 -> 허용 역할 비트마스크: BaseState의 페이지 가드가 접근을 판단할 때 사용합니다.
+
+메뉴에 등록된 url은 같은 역할 목록으로 경로 테이블에도 들어가므로,
+메뉴에 보이는 것과 실제로 접근할 수 있는 것이 항상 일치합니다.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import reflex as rx
+
+from .domains.dash import DASHBOARD_ROUTE
+from .domains.usr.models import UserRole
+
+
+#  [신규] 메뉴 데이터 구조에 url 필드 추가 (페이지 이동용)
+class SubItem(rx.Base):
+    text: str
+    url: str
+    roles: List[UserRole]
+
+    class Config:
+        frozen = True
+
+
+class MenuItem(rx.Base):
+    icon: str
+    name: str
+    url: Optional[str] = None
+    roles: List[UserRole]
+    sub_items: Optional[List[SubItem]]
+
+    class Config:
+        frozen = True
+
+
+#  역할별 비트: UserRole 정의 순서대로 1, 2, 4, ...
+ROLE_BITS: Dict[UserRole, int] = {role: 1 << index for index, role in enumerate(UserRole)}
+
+
+def roles_to_mask(roles: Sequence[UserRole]) -> int:
+    """역할 목록을 비트마스크로 변환합니다."""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS[UserRole(role)]
+    return mask
+
+
+#  등록 순서와 무관하게 표시 순서를 정하기 위한 (order, 등록 순번, 원본 정의) 목록
+_entries: List[Tuple[int, int, dict]] = []
+#  메뉴에 나타나지 않는 경로의 허용 역할 목록
+_extra_routes: Dict[str, List[UserRole]] = {}
+_menu_by_role: Optional[Dict[UserRole, Tuple[MenuItem, ...]]] = None
+_route_masks: Optional[Dict[str, int]] = None
+_lock = threading.Lock()
+
+
+def register_menu(
+    icon: str,
+    name: str,
+    roles: Sequence[UserRole],
+    url: Optional[str] = None,
+    sub_items: Optional[Sequence[dict]] = None,
+    order: int = 100,
+):
+    """
+    사이드바 메뉴 항목을 등록합니다.
+
+    Args:
+        icon (str): lucide 아이콘 이름.
+        name (str): 메뉴 이름. 서브메뉴 열림 상태의 키로도 사용됩니다.
+        roles (Sequence[UserRole]): 메뉴를 볼 수 있는 역할 목록.
+        url (Optional[str]): 서브메뉴가 없을 때 이동할 경로.
+        sub_items (Optional[Sequence[dict]]): {"text", "url", "roles"} 형태의 서브메뉴 목록.
+        order (int): 표시 순서. 작을수록 위에 표시됩니다.
+    """
+    entry = {"icon": icon, "name": name, "url": url, "roles": list(roles), "sub_items": sub_items}
+    with _lock:
+        _entries.append((order, len(_entries), entry))
+        _invalidate()
+
+
+def register_route(url: str, roles: Sequence[UserRole]):
+    """메뉴에 표시되지 않는 페이지 경로의 허용 역할을 등록합니다."""
+    with _lock:
+        _extra_routes[url] = list(roles)
+        _invalidate()
+
+
+def _invalidate():
+    """컴파일 이후에 등록되면 다음 조회 시 다시 컴파일합니다. (_lock 안에서 호출)"""
+    global _menu_by_role, _route_masks
+    _menu_by_role = None
+    _route_masks = None
+
+
+def _compile_routes() -> Dict[str, int]:
+    """등록된 메뉴와 추가 경로를 '경로 -> 허용 역할 비트마스크' 테이블로 컴파일합니다."""
+    masks: Dict[str, int] = {}
+    for _, _, entry in _entries:
+        if entry["url"]:
+            masks[entry["url"]] = masks.get(entry["url"], 0) | roles_to_mask(entry["roles"])
+        for sub in entry["sub_items"] or []:
+            #  서브메뉴는 상위 메뉴와 서브메뉴 양쪽에 허용된 역할만 접근할 수 있습니다.
+            mask = roles_to_mask(sub["roles"]) & roles_to_mask(entry["roles"])
+            masks[sub["url"]] = masks.get(sub["url"], 0) | mask
+    for url, roles in _extra_routes.items():
+        masks[url] = masks.get(url, 0) | roles_to_mask(roles)
+    return masks
+
+
+def _compile_menus(route_masks: Dict[str, int]) -> Dict[UserRole, Tuple[MenuItem, ...]]:
+    """등록된 메뉴를 역할별 불변 메뉴 트리로 컴파일합니다. (경로 테이블 기준으로 필터링)"""
+    compiled: Dict[UserRole, Tuple[MenuItem, ...]] = {}
+    entries = [entry for _, _, entry in sorted(_entries, key=lambda e: (e[0], e[1]))]
+    for role in UserRole:
+        bit = ROLE_BITS[role]
+        menus = []
+        for entry in entries:
+            mask = route_masks[entry["url"]] if entry["url"] else roles_to_mask(entry["roles"])
+            if not mask & bit:
+                continue
+            sub_items = None
+            if entry["sub_items"]:
+                sub_items = [
+                    SubItem.parse_obj(sub) for sub in entry["sub_items"]
+                    if route_masks.get(sub["url"], 0) & bit
+                ]
+            menus.append(MenuItem.parse_obj({**entry, "sub_items": sub_items}))
+        compiled[role] = tuple(menus)
+    return compiled
+
+
+def _compiled() -> Tuple[Dict[UserRole, Tuple[MenuItem, ...]], Dict[str, int]]:
+    global _menu_by_role, _route_masks
+    menu_by_role, route_masks = _menu_by_role, _route_masks
+    if menu_by_role is None or route_masks is None:
+        with _lock:
+            if _menu_by_role is None or _route_masks is None:
+                _route_masks = _compile_routes()
+                _menu_by_role = _compile_menus(_route_masks)
+            menu_by_role, route_masks = _menu_by_role, _route_masks
+    return menu_by_role, route_masks
+
+
+def menu_for_role(role: UserRole) -> Tuple[MenuItem, ...]:
+    """역할에 해당하는 컴파일된 메뉴 트리를 반환합니다."""
+    menu_by_role, _ = _compiled()
+    return menu_by_role.get(UserRole(role), ())
+
+
+def is_route_allowed(route: str, role: UserRole) -> bool:
+    """
+    역할이 해당 경로에 접근할 수 있는지 비트 연산 한 번으로 판단합니다.
+    테이블에 없는 경로는 로그인한 모든 사용자에게 허용됩니다.
+    """
+    _, route_masks = _compiled()
+    mask = route_masks.get(route.rstrip("/") or "/")
+    if mask is None:
+        return True
+    return bool(mask & ROLE_BITS[UserRole(role)])
+
+
+#  공통 메뉴 (도메인에 속하지 않는 항목)
+register_menu(
+    icon="house", name="홈", url=DASHBOARD_ROUTE,
+    roles=[UserRole.ADMIN, UserRole.GENERAL_USER],
+    order=0,
+)
+#  로그인 후 이동하는 대시보드는 모든 역할이 접근할 수 있어야 합니다.
+register_route(DASHBOARD_ROUTE, list(UserRole))
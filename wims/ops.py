@@ -0,0 +1,46 @@
+# /wims_project/wims/ops.py
+"""
+운영 점검용 HTTP 엔드포인트입니다. 값은 요청을 받은 워커 프로세스 하나의 것입니다. (pid로 구분)
+
+인증: Authorization: Bearer <WIMS_OPS_KEY>. 키를 설정하지 않으면 모든 요청을 거부합니다.
+
+경로:
+    GET /api/ops/db-pool: 엔진별 연결 풀 현황과 연결 대기 시간 히스토그램, 초과 연결/시간 초과 횟수
+    GET /api/ops/metrics: Prometheus 텍스트 형식. 이벤트 핸들러별 지표(wims.metrics)와 연결 풀 지표
+        수집기 설정 예: authorization: {credentials: <WIMS_OPS_KEY>}
+"""
+
+import hmac
+import os
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from . import db, metrics
+
+OPS_KEY = os.getenv("WIMS_OPS_KEY", "")
+
+router = APIRouter(prefix="/api/ops")
+
+
+def _authorize(request: Request):
+    scheme, _, key = request.headers.get("authorization", "").partition(" ")
+    if not OPS_KEY or scheme.lower() != "bearer" or not hmac.compare_digest(key.encode(), OPS_KEY.encode()):
+        raise HTTPException(status_code=403, detail="운영 점검 인증 키가 올바르지 않습니다.")
+
+
+@router.get("/db-pool")
+def db_pool(request: Request):
+    """이 워커의 DB 연결 풀 현황. 아직 사용하지 않은 엔진은 목록에 없습니다."""
+    _authorize(request)
+    return {"pid": os.getpid(), "pools": db.pool_stats()}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics(request: Request):
+    """이 워커의 지표 (Prometheus 텍스트 형식). 모든 시계열에 pid 레이블이 붙습니다."""
+    _authorize(request)
+    out = metrics.Exposition({"pid": os.getpid()})
+    metrics.write_handler_metrics(out)
+    metrics.write_pool_metrics(out, db.pool_stats())
+    return PlainTextResponse(out.text(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,119 @@
+# /wims_project/wims/serve.py
+"""
+운영용 웹 백엔드(Reflex 앱) 실행기입니다. 작업 워커(wims.tasks.worker)처럼 별도 명령으로 실행합니다.
+
+    python -m wims.serve --workers 8
+
+- granian으로 워커 프로세스를 여러 개 띄웁니다. 프런트엔드는 `reflex export --frontend-only`로 만든
+  정적 파일을 웹 서버(nginx 등)에서 제공하고, 백엔드 경로(/_event, /_upload, /ping, /api 등)만 이 프로세스로 전달합니다.
+  (백엔드는 컴파일하지 않으며, 도메인 페이지도 평가하지 않습니다. wims.domains 참고)
+- 워커가 2개 이상이면 WIMS_REDIS_URL이 필요합니다. 세션 상태가 Redis에 저장되어 다시 연결한 세션이
+  다른 워커로 가도 유지되고, 실시간 값(wims.live)도 같은 Redis로 모든 워커에 전달됩니다.
+- 워커별 자원: DB 풀(WIMS_DB_POOL_SIZE, WIMS_DB_MAX_OVERFLOW)과 해싱 프로세스 수(WIMS_HASH_WORKERS)를
+  직접 지정하지 않으면 전체 예산을 워커 수로 나눠 정합니다. 워커를 늘려도 DB 연결 수와 해싱 프로세스 수가
+  같이 늘지 않습니다.
+- 종료와 재시작:
+    SIGTERM/SIGINT: 새 연결을 받지 않고 진행 중인 요청이 끝나면 종료합니다. --grace초가 지나면 강제 종료합니다.
+    SIGHUP: 워커를 하나씩 새로 띄운 뒤 이전 워커를 같은 방식으로 내립니다. (무중단 재시작)
+  워커가 내려갈 때 lifespan 종료 단계에서 실시간 수신, 해싱 프로세스 풀, DB 연결을 정리합니다.
+
+환경 변수:
+    WIMS_WEB_WORKERS: 워커 수 (기본값: CPU 수)
+    WIMS_WEB_HOST, WIMS_WEB_PORT: 수신 주소와 포트 (기본값: 0.0.0.0, 8000)
+    WIMS_WEB_GRACE: 워커 종료 시 진행 중인 요청을 기다리는 최대 시간(초, 기본값: 30)
+    WIMS_DB_MAX_CONNECTIONS: 웹 워커 전체가 엔진마다 열 수 있는 DB 연결 수 (기본값: 64)
+"""
+
+import argparse
+import contextlib
+import logging
+import os
+from typing import Dict
+
+logger = logging.getLogger("wims.serve")
+
+#  granian이 워커마다 불러오는 앱. rx.App 인스턴스를 호출하면 ASGI 앱을 돌려줍니다.
+APP_TARGET = "wims.wims:app"
+
+
+def worker_env(workers: int, cpus: int, max_connections: int) -> Dict[str, str]:
+    """
+    워커 하나가 쓸 자원 설정(환경 변수)을 계산합니다.
+
+    - DB: 워커당 max_connections / workers개를 절반은 유지(pool_size), 나머지는 초과 허용(max_overflow)으로 나눕니다.
+    - 해싱: 단일 프로세스 기본값(CPU 수의 절반)을 워커들이 나눠 씁니다. (워커당 최소 1)
+    """
+    per_worker = max(2, max_connections // workers)
+    pool_size = max(1, per_worker // 2)
+    return {
+        "WIMS_DB_POOL_SIZE": str(pool_size),
+        "WIMS_DB_MAX_OVERFLOW": str(per_worker - pool_size),
+        "WIMS_HASH_WORKERS": str(max(1, cpus // 2 // workers)),
+    }
+
+
+@contextlib.asynccontextmanager
+async def worker_lifespan():
+    """웹 워커의 lifespan. 종료 단계(진행 중인 요청이 끝난 뒤)에서 워커가 잡고 있는 자원을 정리합니다."""
+    #  실행기(부모 프로세스)가 워커별 환경 변수를 정하기 전에 db 등이 import되지 않도록 여기서 불러옵니다.
+    from . import db, live
+    from .hashing import hasher
+
+    yield
+    await live.hub.close()
+    hasher.shutdown(wait=False)
+    await db.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WIMS 웹 백엔드 실행기 (운영용)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WIMS_WEB_WORKERS", os.cpu_count() or 1)))
+    parser.add_argument("--host", default=os.getenv("WIMS_WEB_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("WIMS_WEB_PORT", 8000)))
+    parser.add_argument(
+        "--grace", type=int, default=int(os.getenv("WIMS_WEB_GRACE", 30)),
+        help="워커 종료 시 진행 중인 요청을 기다리는 최대 시간(초)",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if args.workers > 1 and not os.getenv("WIMS_REDIS_URL"):
+        parser.error("워커가 2개 이상이면 세션 상태를 공유할 WIMS_REDIS_URL이 필요합니다.")
+
+    #  직접 지정한 값이 우선합니다. 워커 프로세스는 이 환경 변수를 물려받습니다.
+    resources = worker_env(args.workers, os.cpu_count() or 1, int(os.getenv("WIMS_DB_MAX_CONNECTIONS", 64)))
+    for key, value in resources.items():
+        os.environ.setdefault(key, value)
+
+    from granian import Granian
+    from granian.constants import Interfaces
+    from granian.log import LogLevels
+    from reflex import constants
+    from reflex.environment import environment
+
+    #  운영 모드로 실행하며 백엔드에서는 컴파일하지 않습니다. (reflex run --env prod --backend-only와 같음)
+    environment.REFLEX_ENV_MODE.set(constants.Env.PROD)
+    environment.REFLEX_SKIP_COMPILE.set(True)
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logger.info(
+        "웹 워커 %d개 시작 (%s:%d, DB 풀 %s+%s, 해싱 프로세스 %s, 상태 저장소 %s)",
+        args.workers, args.host, args.port,
+        os.environ["WIMS_DB_POOL_SIZE"], os.environ["WIMS_DB_MAX_OVERFLOW"], os.environ["WIMS_HASH_WORKERS"],
+        "redis" if os.getenv("WIMS_REDIS_URL") else "disk",
+    )
+    Granian(
+        APP_TARGET,
+        address=args.host,
+        port=args.port,
+        interface=Interfaces.ASGI,
+        factory=True,
+        workers=args.workers,
+        workers_kill_timeout=args.grace,
+        respawn_failed_workers=True,
+        log_level=LogLevels(args.log_level.lower()),
+    ).serve()
+
+
+if __name__ == "__main__":
+    main()
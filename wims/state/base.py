@@ -1,24 +1,39 @@
 # /wims_project/wims/state/base.py
 import reflex as rx
-from typing import List, Optional, Dict
-from sqlmodel import select
+from typing import List, Optional
+from .. import db
 from ..domains.usr.models import User, UserRole  #  usr 도메인의 모델 사용
-from ..utils import verify_password  #  유틸리티 함수 임포트 (아래에서 생성)
+from ..domains.usr.queries import get_user_by_login_id
+from ..hashing import HashQueueFullError, verify_password_async
+from ..navigation import MenuItem, SubItem, menu_for_role, is_route_allowed, DASHBOARD_ROUTE  # noqa: F401
 
 
-#  [신규] 메뉴 데이터 구조에 url 필드 추가 (페이지 이동용)
-class SubItem(rx.Base):
-    text: str
-    url: str
-    roles: List[UserRole]
-
-
-class MenuItem(rx.Base):
-    icon: str
-    name: str
-    url: Optional[str] = None
-    roles: List[UserRole]
-    sub_items: Optional[List[SubItem]]
+class Principal(rx.Base):
+    """
+    세션에 보관하는 로그인 사용자 정보.
+    User ORM 객체 대신 권한 판단과 화면 표시에 필요한 값만 담은 불변 객체로,
+    비밀번호 해시나 타임스탬프가 세션 상태에 저장/직렬화되지 않습니다.
+    """
+    id: int
+    login_id: str
+    name: str = ""
+    email: str = ""
+    role: UserRole
+    department_id: Optional[int] = None
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            login_id=user.login_id,
+            name=user.name or "",
+            email=user.email or "",
+            role=UserRole(user.role),
+            department_id=user.department_id,
+        )
 
 
 class BaseState(rx.State):
@@ -27,84 +42,61 @@ class BaseState(rx.State):
     UI 레이아웃 및 인증 상태를 관리합니다.
     """
     #  --- 인증 상태 ---
-    logged_in_user: Optional[User] = None
+    logged_in_user: Optional[Principal] = None
 
     #  --- UI 레이아웃 상태 ---
     is_sidebar_open: bool = True
     open_submenu: str = ""
 
-    #  [수정] 메뉴 데이터를 새 구조에 맞게 정의하고, 역할 기반 접근 제어(RBAC)를 적용합니다.
-    menu_data: List[Dict] = [
-        {
-            "icon": "house", "name": "홈", "url": "/dashboard",
-            "roles": [UserRole.ADMIN, UserRole.GENERAL_USER],
-        },
-        {
-            "icon": "users", "name": "사용자 관리", "roles": [UserRole.ADMIN],
-            "sub_items": [
-                {"text": "사용자 목록", "url": "/admin/users", "roles": [UserRole.ADMIN]},
-                {"text": "부서 목록", "url": "/admin/departments", "roles": [UserRole.ADMIN]},
-            ]
-        },
-        {
-            "icon": "flask-conical", "name": "실험 관리 (LIMS)", "roles": [UserRole.ADMIN, UserRole.LAB_MANAGER, UserRole.LAB_ANALYST],
-            "sub_items": [
-                {"text": "실험 의뢰", "url": "/lims/requests", "roles": [UserRole.ADMIN, UserRole.LAB_MANAGER]},
-                {"text": "분석 결과", "url": "/lims/results", "roles": [UserRole.ADMIN, UserRole.LAB_ANALYST]},
-            ]
-        },
-        {
-            "icon": "package-2", "name": "자재 관리 (INV)", "roles": [UserRole.ADMIN, UserRole.INVENTORY_MANAGER],
-            "sub_items": [
-                {"text": "자재 목록", "url": "/inv/materials", "roles": [UserRole.ADMIN, UserRole.INVENTORY_MANAGER]},
-            ]
-        },
-    ]
-
-    @rx.var
+    @rx.var(cache=True)
     def filtered_menu(self) -> List[MenuItem]:
-        """로그인한 사용자의 역할에 따라 접근 가능한 메뉴만 필터링합니다."""
+        """로그인한 사용자의 역할에 따라 접근 가능한 메뉴만 반환합니다."""
         if not self.logged_in_user:
             return []
-
-        filtered = []
-        for menu_dict in self.menu_data:
-            #  [수정] Pydantic 모델을 사용하여 안전하게 데이터 파싱
-            menu = MenuItem.parse_obj(menu_dict)
-            if self.logged_in_user.role in menu.roles:
-                if menu.sub_items:
-                    menu.sub_items = [
-                        sub for sub in menu.sub_items
-                        if self.logged_in_user.role in sub.roles
-                    ]
-                filtered.append(menu)
-        return filtered
+        #  메뉴는 wims.navigation에서 역할별로 미리 컴파일되어 있으므로 조회만 합니다.
+        return list(menu_for_role(self.logged_in_user.role))
 
     #  --- 인증 이벤트 핸들러 ---
-    def login(self, form_data: dict):
+    async def login(self, form_data: dict):
         """사용자 로그인"""
         login_id = form_data.get("login_id")
         password = form_data.get("password")
         if not login_id or not password:
             return rx.window_alert("아이디와 비밀번호를 입력해주세요.")
 
-        with rx.session() as session:
-            user = session.exec(select(User).where(User.login_id == login_id)).one_or_none()
-            if user and verify_password(password, user.password_hash):
-                self.logged_in_user = user
-                return rx.redirect("/dashboard")
-            else:
-                return rx.window_alert("아이디 또는 비밀번호가 잘못되었습니다.")
+        user = await db.run(get_user_by_login_id, login_id)
+        try:
+            #  bcrypt 검증은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+            password_ok = bool(user) and await verify_password_async(password, user.password_hash)
+        except HashQueueFullError as e:
+            return rx.window_alert(str(e))
+        if password_ok:
+            self.logged_in_user = Principal.from_user(user)
+            return rx.redirect("/dashboard")
+        else:
+            return rx.window_alert("아이디 또는 비밀번호가 잘못되었습니다.")
 
     def logout(self):
         """사용자 로그아웃"""
         self.reset()
         return rx.redirect("/")
 
-    def check_login(self):
-        """페이지 접근 시 로그인 여부 확인"""
-        if not self.is_hydrated or self.logged_in_user is None:
+    # --- 접근 제어 ---
+    def _deny_access(self, route: str):
+        """
+        경로 접근 권한을 wims.navigation의 '경로 -> 역할 비트마스크' 테이블로 검사합니다.
+        허용되면 None을, 아니면 핸들러가 그대로 반환할 이벤트를 돌려줍니다.
+        데이터를 조회하는 핸들러는 DB에 접근하기 전에 이 값을 먼저 확인합니다.
+        """
+        if self.logged_in_user is None:
             return rx.redirect("/")
+        if not is_route_allowed(route, self.logged_in_user.role):
+            return [rx.window_alert("접근 권한이 없습니다."), rx.redirect(DASHBOARD_ROUTE)]
+        return None
+
+    def guard_page(self):
+        """모든 보호된 페이지의 on_load에서 실행되는 공통 가드입니다."""
+        return self._deny_access(self.router.url.path)
 
     # --- UI 이벤트 핸들러 ---
     def toggle_sidebar(self):
@@ -0,0 +1,127 @@
+# /wims_project/wims/tasks/cron.py
+"""
+cron 형식(분 시 일 월 요일) 일정 표현식을 해석하고 다음 실행 시각을 계산합니다.
+
+지원하는 형식:
+    *, 숫자, 범위(1-5), 목록(1,15,30), 간격(*/10, 8-18/2)
+    별칭: @hourly, @daily(@midnight), @weekly, @monthly, @yearly(@annually)
+요일은 0(일요일)~6(토요일)이며 7도 일요일로 취급합니다.
+일과 요일을 모두 지정하면 표준 cron처럼 둘 중 하나만 맞아도 실행합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from typing import FrozenSet, Tuple
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+#  (필드 이름, 최솟값, 최댓값)
+_FIELDS: Tuple[Tuple[str, int, int], ...] = (
+    ("분", 0, 59),
+    ("시", 0, 23),
+    ("일", 1, 31),
+    ("월", 1, 12),
+    ("요일", 0, 7),
+)
+
+#  조건에 맞는 시각을 찾지 못했을 때 탐색을 멈추는 범위 (예: "0 0 31 2 *")
+_SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+def _parse_field(text: str, label: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        expr, has_step, step_text = part.partition("/")
+        try:
+            step = int(step_text) if has_step else 1
+            if expr == "*":
+                start, end = low, high
+            elif "-" in expr:
+                first, last = expr.split("-", 1)
+                start, end = int(first), int(last)
+            else:
+                start = int(expr)
+                end = high if has_step else start
+        except ValueError:
+            raise ValueError(f"cron {label} 필드를 해석할 수 없습니다: {text!r}") from None
+        if step <= 0 or not low <= start <= end <= high:
+            raise ValueError(f"cron {label} 필드의 범위가 올바르지 않습니다: {text!r} ({low}-{high})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    expression: str
+    tz: tzinfo
+    minutes: FrozenSet[int]
+    hours: FrozenSet[int]
+    days: FrozenSet[int]
+    months: FrozenSet[int]
+    weekdays: FrozenSet[int]
+    day_restricted: bool
+    weekday_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str, tz: tzinfo) -> "CronSchedule":
+        """
+        cron 표현식을 해석합니다.
+
+        Args:
+            expression (str): "분 시 일 월 요일" 또는 별칭.
+            tz (tzinfo): 표현식의 시각을 해석할 시간대.
+
+        Raises:
+            ValueError: 표현식이 올바르지 않을 때.
+        """
+        fields = _ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != len(_FIELDS):
+            raise ValueError(f"cron 표현식은 5개 필드(분 시 일 월 요일)여야 합니다: {expression!r}")
+        minutes, hours, days, months, weekdays = (
+            _parse_field(text, label, low, high) for text, (label, low, high) in zip(fields, _FIELDS)
+        )
+        return cls(
+            expression=expression,
+            tz=tz,
+            minutes=minutes,
+            hours=hours,
+            days=days,
+            months=months,
+            weekdays=frozenset(day % 7 for day in weekdays),
+            day_restricted=fields[2] != "*",
+            weekday_restricted=fields[4] != "*",
+        )
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        #  cron 요일: 0=일요일 (datetime.isoweekday: 7=일요일)
+        weekday_ok = moment.isoweekday() % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """after(시간대 포함) 이후 처음으로 일정에 맞는 시각을 이 일정의 시간대로 반환합니다."""
+        moment = after.astimezone(self.tz).replace(tzinfo=None, second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + _SEARCH_LIMIT
+        #  맞지 않는 단위(월 > 일 > 시 > 분)를 통째로 건너뛰며 탐색합니다.
+        while moment <= limit:
+            if moment.month not in self.months:
+                moment = datetime(moment.year + moment.month // 12, moment.month % 12 + 1, 1)
+            elif not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+            elif moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.replace(tzinfo=self.tz)
+        raise ValueError(f"일정에 맞는 실행 시각이 없습니다: {self.expression!r}")
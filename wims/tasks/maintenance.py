@@ -0,0 +1,30 @@
+# /wims_project/wims/tasks/maintenance.py
+"""
+작업 큐 자체의 주기 작업입니다.
+
+환경 변수:
+    WIMS_JOB_RETENTION_DAYS: 완료/실패한 작업과 주기 작업 실행 기록을 보관하는 기간(일, 기본값: 30)
+"""
+
+import os
+
+from sqlalchemy import delete, func, literal_column
+
+from .. import db
+from .models import Job, JobStatus
+from .scheduler import periodic
+
+JOB_RETENTION_DAYS = int(os.getenv("WIMS_JOB_RETENTION_DAYS", 30))
+
+
+@periodic("17 3 * * *", name="tasks.purge_finished_jobs", max_attempts=3)
+def purge_finished_jobs(payload: dict) -> dict:
+    """보관 기간이 지난 완료/실패 작업을 삭제합니다. 연결된 usr.schedule_runs 행도 함께 삭제됩니다."""
+    statement = delete(Job).where(
+        Job.status.in_([JobStatus.SUCCEEDED, JobStatus.FAILED]),
+        Job.finished_at < func.now() - JOB_RETENTION_DAYS * literal_column("interval '1 day'"),
+    )
+    with db.sync_session() as session:
+        deleted = session.execute(statement).rowcount
+        session.commit()
+    return {"deleted": deleted}
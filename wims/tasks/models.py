@@ -0,0 +1,114 @@
+# /wims_project/wims/tasks/models.py
+"""
+작업 큐의 ORM 모델입니다. usr.jobs 테이블(리비전 3a1d75e99904에서 생성)을 작업 큐로 사용하고,
+주기 작업의 실행 기록은 usr.schedule_runs에 남깁니다.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlmodel import Column, Field, Index, TIMESTAMP, func, text
+
+import reflex as rx
+
+
+class JobStatus:
+    """작업 상태 값 (DB에는 문자열로 저장)"""
+    QUEUED = "queued"          # 실행 대기 (run_at 이후 실행 가능)
+    RUNNING = "running"        # 워커가 가져가 실행 중 (locked_until까지 점유)
+    SUCCEEDED = "succeeded"    # 완료
+    FAILED = "failed"          # 재시도 횟수를 모두 사용해 실패
+
+
+class Job(rx.Model, table=True):
+    """
+    PostgreSQL의 usr.jobs 테이블에 매핑되는 모델.
+    워커는 SELECT ... FOR UPDATE SKIP LOCKED로 행을 가져가며, locked_until이 지나도록
+    완료/연장되지 않은 running 작업은 다른 워커가 다시 가져갈 수 있습니다. (가시성 타임아웃)
+    """
+    __tablename__ = "jobs"  # type: ignore
+    __table_args__ = (
+        #  큐별 대기 작업을 우선순위 순으로 꺼내기 위한 부분 인덱스
+        Index(
+            "ix_usr_jobs_claim", "queue", text("priority DESC"), "run_at", "id",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        #  점유 시간이 지난 실행 중 작업을 찾기 위한 부분 인덱스
+        Index("ix_usr_jobs_lease", "queue", "locked_until", postgresql_where=text("status = 'running'")),
+        {'schema': 'usr'},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, index=True)
+    title: str = Field(description="작업 제목 (화면 표시용)")
+    description: str = Field(default="", description="작업 설명")
+
+    queue: str = Field(default="default", max_length=50, description="큐 이름")
+    task: str = Field(max_length=100, description="실행할 작업 이름 (wims.tasks.registry에 등록된 이름)")
+    payload: Optional[dict] = Field(default=None, sa_column=Column(JSONB), description="작업 인자")
+    status: str = Field(default=JobStatus.QUEUED, max_length=16, description="작업 상태")
+    priority: int = Field(default=0, description="우선순위 (클수록 먼저 실행)")
+
+    attempts: int = Field(default=0, description="실행 시도 횟수")
+    max_attempts: int = Field(default=5, description="최대 시도 횟수")
+    timeout_seconds: int = Field(default=300, description="가시성 타임아웃(초)")
+    run_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+        description="이 시각 이후 실행 (재시도 백오프에도 사용)",
+    )
+    locked_until: Optional[datetime] = Field(
+        default=None, sa_column=Column(TIMESTAMP(timezone=True)), description="워커 점유 만료 시각"
+    )
+    locked_by: Optional[str] = Field(default=None, max_length=100, description="점유한 워커 ID")
+
+    last_error: Optional[str] = Field(default=None, description="마지막 실패 사유")
+    result: Optional[Any] = Field(default=None, sa_column=Column(JSONB), description="작업 결과")
+
+    created_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now()),
+        description="레코드 생성 일시"
+    )
+    updated_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()),
+        description="레코드 마지막 업데이트 일시"
+    )
+    started_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(TIMESTAMP(timezone=True)), description="마지막 시도 시작 일시"
+    )
+    finished_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(TIMESTAMP(timezone=True)), description="완료/최종 실패 일시"
+    )
+
+
+class ScheduleRun(rx.Model, table=True):
+    """
+    PostgreSQL의 usr.schedule_runs 테이블에 매핑되는 모델.
+    주기 작업의 실행 예정 시각마다 한 행을 만들며, (schedule, scheduled_for) 유일 제약이
+    여러 백엔드/워커 복제본 중 한 곳에서만 작업을 넣도록 보장하는 점유 역할을 합니다.
+    실행 결과와 소요 시간은 job_id로 연결된 usr.jobs 행에 기록됩니다.
+    """
+    __tablename__ = "schedule_runs"  # type: ignore
+    __table_args__ = (
+        UniqueConstraint("schedule", "scheduled_for"),
+        {'schema': 'usr'},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    schedule: str = Field(max_length=100, description="주기 작업 이름")
+    scheduled_for: datetime = Field(
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False), description="실행 예정 시각"
+    )
+    job_id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(ForeignKey("usr.jobs.id", ondelete="CASCADE")),
+        description="넣은 작업 ID",
+    )
+    created_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now()),
+        description="레코드 생성 일시"
+    )
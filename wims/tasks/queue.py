@@ -0,0 +1,250 @@
+# /wims_project/wims/tasks/queue.py
+"""
+usr.jobs 테이블 기반의 영속 작업 큐 연산입니다.
+
+- 넣기: 이벤트 핸들러에서 `await enqueue(...)`, 또는 다른 쓰기와 같은 트랜잭션에서 add_job(session, ...).
+- 가져오기: claim()이 `SELECT ... FOR UPDATE SKIP LOCKED` 부분 조회를 포함한 UPDATE 한 문으로
+  작업을 점유하므로 여러 워커가 같은 작업을 동시에 가져가지 않습니다.
+- 완료/실패: 점유한 워커만 결과를 기록할 수 있으며(locked_by 조건), 실패하면 지수 백오프로 재시도합니다.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional
+
+from sqlalchemy import and_, func, insert, literal_column, or_, update
+from sqlmodel import Session, select
+
+from .. import db
+from .models import Job, JobStatus
+from .registry import get_task
+
+#  재시도 대기 시간 상한(초)
+MAX_BACKOFF_SECONDS = 3600
+
+_ONE_SECOND = literal_column("interval '1 second'")
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """워커가 점유한 작업"""
+    id: int
+    task: str
+    payload: dict
+    attempts: int
+    max_attempts: int
+    timeout_seconds: int
+
+
+def add_job(
+    session: Session,
+    task_name: str,
+    payload: Optional[dict] = None,
+    *,
+    title: Optional[str] = None,
+    description: str = "",
+    queue: Optional[str] = None,
+    priority: Optional[int] = None,
+    run_at: Optional[datetime] = None,
+) -> int:
+    """
+    작업을 추가하고 ID를 반환합니다. 커밋하지 않으므로 호출자의 다른 쓰기와 함께 커밋됩니다.
+    큐/우선순위/재시도 설정을 지정하지 않으면 @task 등록 값을 사용합니다.
+    """
+    spec = get_task(task_name)
+    values = dict(
+        title=title or task_name,
+        description=description,
+        queue=queue or spec.queue,
+        task=task_name,
+        payload=payload or {},
+        status=JobStatus.QUEUED,
+        priority=spec.priority if priority is None else priority,
+        attempts=0,
+        max_attempts=spec.max_attempts,
+        timeout_seconds=spec.timeout,
+    )
+    if run_at is not None:
+        values["run_at"] = run_at
+    return session.execute(insert(Job).values(**values).returning(Job.id)).scalar_one()
+
+
+def _enqueue(session: Session, task_name: str, payload: Optional[dict], options: dict) -> int:
+    job_id = add_job(session, task_name, payload, **options)
+    session.commit()
+    return job_id
+
+
+async def enqueue(task_name: str, payload: Optional[dict] = None, **options: Any) -> int:
+    """
+    이벤트 핸들러에서 작업을 넣고 ID를 반환합니다.
+
+    Args:
+        task_name (str): @task로 등록된 작업 이름.
+        payload (Optional[dict]): JSON으로 저장할 수 있는 작업 인자.
+        **options: add_job()의 title, description, queue, priority, run_at.
+    """
+    return await db.run(_enqueue, task_name, payload, options)
+
+
+def claim(session: Session, queue: str, worker_id: str, limit: int) -> List[ClaimedJob]:
+    """
+    큐에서 실행할 작업을 최대 limit개 점유합니다.
+
+        UPDATE usr.jobs SET status = 'running', attempts = attempts + 1, started_at = now(),
+               locked_by = :worker, locked_until = now() + timeout_seconds * interval '1 second'
+        WHERE id IN (SELECT id FROM usr.jobs
+                     WHERE queue = :queue AND ((status = 'queued' AND run_at <= now())
+                                               OR (status = 'running' AND locked_until < now()
+                                                   AND attempts < max_attempts))
+                     ORDER BY priority DESC, run_at, id LIMIT :limit
+                     FOR UPDATE SKIP LOCKED)
+        RETURNING ...
+
+    점유 시간이 지난 running 작업(워커가 죽었거나 멈춘 경우)도 시도 횟수가 남았으면 다시 가져갑니다.
+    """
+    if limit <= 0:
+        return []
+    candidates = (
+        select(Job.id)
+        .where(
+            Job.queue == queue,
+            or_(
+                and_(Job.status == JobStatus.QUEUED, Job.run_at <= func.now()),
+                and_(
+                    Job.status == JobStatus.RUNNING,
+                    Job.locked_until < func.now(),
+                    Job.attempts < Job.max_attempts,
+                ),
+            ),
+        )
+        .order_by(Job.priority.desc(), Job.run_at, Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    statement = (
+        update(Job)
+        .where(Job.id.in_(candidates.scalar_subquery()))
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=Job.attempts + 1,
+            locked_by=worker_id,
+            locked_until=func.now() + Job.timeout_seconds * _ONE_SECOND,
+            started_at=func.now(),
+        )
+        .returning(Job.id, Job.task, Job.payload, Job.attempts, Job.max_attempts, Job.timeout_seconds)
+    )
+    rows = session.execute(statement).all()
+    session.commit()
+    return [
+        ClaimedJob(
+            id=row.id, task=row.task, payload=row.payload or {}, attempts=row.attempts,
+            max_attempts=row.max_attempts, timeout_seconds=row.timeout_seconds,
+        )
+        for row in rows
+    ]
+
+
+def _owned(job_id: int, worker_id: str):
+    return and_(Job.id == job_id, Job.status == JobStatus.RUNNING, Job.locked_by == worker_id)
+
+
+def extend_lease(session: Session, job_id: int, worker_id: str) -> bool:
+    """실행 중인 작업의 점유 시간을 연장합니다. 점유를 잃었으면 False를 반환합니다."""
+    statement = (
+        update(Job)
+        .where(_owned(job_id, worker_id))
+        .values(locked_until=func.now() + Job.timeout_seconds * _ONE_SECOND)
+        .returning(Job.id)
+    )
+    extended = session.execute(statement).first() is not None
+    session.commit()
+    return extended
+
+
+def complete(session: Session, job_id: int, worker_id: str, result: Any = None) -> bool:
+    """작업을 완료 처리합니다."""
+    statement = (
+        update(Job)
+        .where(_owned(job_id, worker_id))
+        .values(
+            status=JobStatus.SUCCEEDED, result=result, last_error=None,
+            locked_by=None, locked_until=None, finished_at=func.now(),
+        )
+        .returning(Job.id)
+    )
+    done = session.execute(statement).first() is not None
+    session.commit()
+    return done
+
+
+def release(session: Session, job_ids: List[int], worker_id: str) -> int:
+    """
+    워커가 종료하면서 끝내지 못한 작업의 점유를 바로 풀어 다른 워커가 가져가게 합니다.
+    (점유 시간이 만료될 때까지 기다리지 않도록 대기 상태로 되돌립니다)
+    """
+    if not job_ids:
+        return 0
+    statement = (
+        update(Job)
+        .where(Job.id.in_(job_ids), Job.status == JobStatus.RUNNING, Job.locked_by == worker_id)
+        .values(status=JobStatus.QUEUED, run_at=func.now(), locked_by=None, locked_until=func.now())
+    )
+    released = session.execute(statement).rowcount
+    session.commit()
+    return released
+
+
+def retry_delay(attempts: int, backoff: float) -> float:
+    """attempts번째 실패 후 다음 시도까지의 대기 시간(초). 지수 백오프에 ±20% 지터를 더합니다."""
+    delay = min(backoff * 2 ** (attempts - 1), MAX_BACKOFF_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def fail(session: Session, job: ClaimedJob, worker_id: str, error: str, backoff: float) -> bool:
+    """
+    작업 실패를 기록합니다. 시도 횟수가 남았으면 백오프 후 다시 대기 상태로, 아니면 최종 실패로 둡니다.
+    """
+    if job.attempts < job.max_attempts:
+        run_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(job.attempts, backoff))
+        values = dict(status=JobStatus.QUEUED, run_at=run_at)
+    else:
+        values = dict(status=JobStatus.FAILED, finished_at=func.now())
+    statement = (
+        update(Job)
+        .where(_owned(job.id, worker_id))
+        .values(last_error=error[:4000], locked_by=None, locked_until=None, **values)
+        .returning(Job.id)
+    )
+    recorded = session.execute(statement).first() is not None
+    session.commit()
+    return recorded
+
+
+def get_job(session: Session, job_id: int) -> Optional[Job]:
+    """작업 상태를 조회합니다. (진행 상황 확인용)"""
+    return session.get(Job, job_id)
+
+
+def reap_expired(session: Session, queue: str) -> int:
+    """
+    점유 시간이 지났지만 시도 횟수를 모두 사용해 다시 실행할 수 없는 작업을 최종 실패로 기록합니다.
+    (워커가 마지막 시도 도중 죽은 경우)
+    """
+    statement = (
+        update(Job)
+        .where(
+            Job.queue == queue,
+            Job.status == JobStatus.RUNNING,
+            Job.locked_until < func.now(),
+            Job.attempts >= Job.max_attempts,
+        )
+        .values(
+            status=JobStatus.FAILED, last_error="워커 점유 시간이 만료되었습니다.",
+            locked_by=None, locked_until=None, finished_at=func.now(),
+        )
+    )
+    reaped = session.execute(statement).rowcount
+    session.commit()
+    return reaped
@@ -0,0 +1,76 @@
+# /wims_project/wims/tasks/registry.py
+"""
+작업 함수 레지스트리입니다.
+
+각 도메인은 jobs.py에서 @task로 작업 함수를 등록합니다. 작업 함수는 payload 딕셔너리를 받아
+JSON으로 저장할 수 있는 결과(또는 None)를 반환하며, 동기 함수는 워커의 스레드에서,
+async 함수는 워커의 이벤트 루프에서 실행됩니다. 예외가 발생하면 백오프 후 재시도합니다.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+DEFAULT_QUEUE = "default"
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    name: str
+    fn: Callable[[dict], Any]
+    queue: str
+    priority: int
+    max_attempts: int
+    #  가시성 타임아웃(초): 실행 중인 워커가 이 시간 안에 점유를 연장하지 못하면 다른 워커가 다시 실행합니다.
+    timeout: int
+    #  첫 재시도 대기 시간(초). 시도할 때마다 두 배로 늘어납니다.
+    backoff: float
+
+    @property
+    def is_async(self) -> bool:
+        return asyncio.iscoroutinefunction(self.fn)
+
+
+_tasks: Dict[str, TaskSpec] = {}
+
+
+def task(
+    name: str,
+    *,
+    queue: str = DEFAULT_QUEUE,
+    priority: int = 0,
+    max_attempts: int = 5,
+    timeout: int = 300,
+    backoff: float = 10.0,
+):
+    """
+    작업 함수를 등록하는 데코레이터입니다.
+
+    Args:
+        name (str): 작업 이름. enqueue()에 사용하며 "도메인.동작" 형태를 권장합니다.
+        queue (str): 작업을 넣을 큐. 워커는 큐별로 동시 실행 수를 제한합니다.
+        priority (int): 기본 우선순위 (클수록 먼저 실행).
+        max_attempts (int): 최대 시도 횟수.
+        timeout (int): 가시성 타임아웃(초).
+        backoff (float): 첫 재시도 대기 시간(초).
+    """
+    def decorator(fn: Callable[[dict], Any]) -> Callable[[dict], Any]:
+        if name in _tasks and _tasks[name].fn is not fn:
+            raise ValueError(f"이미 등록된 작업 이름입니다: {name}")
+        _tasks[name] = TaskSpec(
+            name=name, fn=fn, queue=queue, priority=priority,
+            max_attempts=max_attempts, timeout=timeout, backoff=backoff,
+        )
+        return fn
+    return decorator
+
+
+def get_task(name: str) -> TaskSpec:
+    try:
+        return _tasks[name]
+    except KeyError:
+        raise KeyError(f"등록되지 않은 작업입니다: {name}") from None
+
+
+def registered_tasks() -> List[TaskSpec]:
+    return list(_tasks.values())
@@ -0,0 +1,199 @@
+# /wims_project/wims/tasks/scheduler.py
+"""
+cron 일정에 따라 작업을 큐에 넣는 주기 작업 스케줄러입니다.
+
+- 각 도메인은 jobs.py에서 @periodic으로 일정과 작업 함수를 함께 등록합니다.
+  (작업 함수는 @task와 같은 방식으로 등록되어 워커가 실행합니다)
+- 스케줄러는 작업 큐 워커 프로세스(python -m wims.tasks.worker) 안에서 돌며, Reflex 백엔드의
+  이벤트 루프에서는 실행되지 않습니다. 일정 계산은 메모리에서, DB 작업은 db.run()으로 처리합니다.
+- 실행 예정 시각마다 usr.schedule_runs에 (일정 이름, 예정 시각) 행을 INSERT ... ON CONFLICT DO NOTHING으로
+  넣고, 성공한 복제본만 작업을 넣습니다. 여러 워커/서버가 동시에 스케줄러를 돌려도 한 번만 실행됩니다.
+- 실행 결과, 시도 횟수, 소요 시간은 연결된 usr.jobs 행에 기록되며 recent_runs()로 조회합니다.
+- 스케줄러가 멈춰 있던 동안 지나간 실행은 misfire_grace 안의 가장 최근 한 번만 실행합니다.
+
+환경 변수:
+    WIMS_SCHEDULER_TZ: cron 표현식을 해석할 시간대 (기본값: Asia/Seoul)
+    WIMS_SCHEDULER_TICK: 실행할 일정을 확인하는 간격(초, 기본값: 15)
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
+
+from .. import db
+from .cron import CronSchedule
+from .models import Job, ScheduleRun
+from .queue import add_job
+from .registry import task
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_TZ = ZoneInfo(os.getenv("WIMS_SCHEDULER_TZ", "Asia/Seoul"))
+SCHEDULER_TICK = float(os.getenv("WIMS_SCHEDULER_TICK", 15))
+
+
+@dataclass(frozen=True)
+class PeriodicSpec:
+    name: str
+    schedule: CronSchedule
+    payload: Dict[str, Any]
+    #  스케줄러가 시작될 때 이 시간(초) 안에 지나간 실행 예정 시각은 늦게라도 실행합니다.
+    misfire_grace: float
+
+
+_schedules: Dict[str, PeriodicSpec] = {}
+
+
+def periodic(
+    cron: str,
+    *,
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    misfire_grace: float = 300,
+    **task_options: Any,
+):
+    """
+    주기 작업을 등록하는 데코레이터입니다.
+
+    Args:
+        cron (str): cron 표현식 (wims.tasks.cron 참고). WIMS_SCHEDULER_TZ 시간대로 해석합니다.
+        name (str): 일정 겸 작업 이름 ("도메인.동작" 형태).
+        payload (Optional[Dict[str, Any]]): 작업 인자. 실행 예정 시각이 scheduled_for(ISO 8601)로 추가됩니다.
+        misfire_grace (float): 스케줄러가 멈춰 있다 시작될 때 늦게라도 실행할 최대 지연(초).
+        **task_options: @task의 queue, priority, max_attempts, timeout, backoff.
+    """
+    schedule = CronSchedule.parse(cron, SCHEDULER_TZ)
+
+    def decorator(fn: Callable[[dict], Any]) -> Callable[[dict], Any]:
+        task(name, **task_options)(fn)
+        _schedules[name] = PeriodicSpec(
+            name=name, schedule=schedule, payload=dict(payload or {}), misfire_grace=misfire_grace,
+        )
+        return fn
+    return decorator
+
+
+def registered_schedules() -> List[PeriodicSpec]:
+    return list(_schedules.values())
+
+
+def fire(session: Session, spec: PeriodicSpec, scheduled_for: datetime) -> Optional[int]:
+    """
+    실행 예정 시각 하나를 점유하고 작업을 넣습니다.
+    다른 복제본이 이미 점유했으면 None을, 아니면 넣은 작업 ID를 반환합니다.
+    """
+    claimed = session.execute(
+        pg_insert(ScheduleRun)
+        .values(schedule=spec.name, scheduled_for=scheduled_for)
+        .on_conflict_do_nothing(index_elements=["schedule", "scheduled_for"])
+        .returning(ScheduleRun.id)
+    ).scalar_one_or_none()
+    if claimed is None:
+        session.rollback()
+        return None
+    local_time = scheduled_for.astimezone(SCHEDULER_TZ)
+    job_id = add_job(
+        session,
+        spec.name,
+        {**spec.payload, "scheduled_for": scheduled_for.isoformat()},
+        title=f"{spec.name} ({local_time:%Y-%m-%d %H:%M})",
+        description=f"주기 작업 ({spec.schedule.expression})",
+        run_at=scheduled_for,
+    )
+    session.execute(update(ScheduleRun).where(ScheduleRun.id == claimed).values(job_id=job_id))
+    session.commit()
+    return job_id
+
+
+@dataclass(frozen=True)
+class RunInfo:
+    """주기 작업 실행 한 번의 기록"""
+    scheduled_for: datetime
+    job_id: Optional[int]
+    status: Optional[str]
+    attempts: int
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    result: Any
+    last_error: Optional[str]
+
+    @property
+    def duration(self) -> Optional[float]:
+        """마지막 시도의 소요 시간(초). 아직 끝나지 않았으면 None."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+
+def recent_runs(session: Session, schedule: str, limit: int = 20) -> List[RunInfo]:
+    """주기 작업의 최근 실행 기록을 최신순으로 반환합니다."""
+    statement = (
+        select(
+            ScheduleRun.scheduled_for, ScheduleRun.job_id, Job.status, Job.attempts,
+            Job.started_at, Job.finished_at, Job.result, Job.last_error,
+        )
+        .outerjoin(Job, Job.id == ScheduleRun.job_id)
+        .where(ScheduleRun.schedule == schedule)
+        .order_by(ScheduleRun.scheduled_for.desc())
+        .limit(limit)
+    )
+    return [
+        RunInfo(
+            scheduled_for=row.scheduled_for, job_id=row.job_id, status=row.status, attempts=row.attempts or 0,
+            started_at=row.started_at, finished_at=row.finished_at, result=row.result, last_error=row.last_error,
+        )
+        for row in session.execute(statement)
+    ]
+
+
+class Scheduler:
+    """등록된 일정의 다음 실행 시각을 메모리에 두고, 때가 된 일정만 DB에 점유를 시도합니다."""
+
+    def __init__(self, tick: float = SCHEDULER_TICK):
+        self.tick = tick
+        self._next_fire: Dict[str, datetime] = {}
+
+    def due(self, now: datetime) -> List[Tuple[PeriodicSpec, datetime]]:
+        """지금 실행할 (일정, 예정 시각) 목록. 실행이 기록된 뒤 advance()로 다음 시각을 계산합니다."""
+        due = []
+        for spec in registered_schedules():
+            next_fire = self._next_fire.get(spec.name)
+            if next_fire is None:
+                next_fire = spec.schedule.next_after(now - timedelta(seconds=spec.misfire_grace))
+                self._next_fire[spec.name] = next_fire
+            if next_fire <= now:
+                due.append((spec, next_fire))
+        return due
+
+    def advance(self, spec: PeriodicSpec, now: datetime):
+        #  늦게 실행된 경우에도 밀린 시각을 모두 실행하지 않고 다음 예정 시각으로 넘어갑니다.
+        self._next_fire[spec.name] = spec.schedule.next_after(now)
+
+    async def run_once(self, now: Optional[datetime] = None):
+        now = now or datetime.now(timezone.utc)
+        for spec, scheduled_for in self.due(now):
+            try:
+                job_id = await db.run(fire, spec, scheduled_for)
+            except Exception:  # noqa: BLE001 - DB 장애 시 다음 주기에 같은 시각으로 다시 시도합니다.
+                logger.exception("주기 작업 '%s' (%s) 등록 실패", spec.name, scheduled_for)
+                continue
+            if job_id is not None:
+                logger.info("주기 작업 '%s' (%s) → 작업 %d", spec.name, scheduled_for, job_id)
+            self.advance(spec, now)
+
+    async def run(self, stopping: asyncio.Event):
+        logger.info("스케줄러 시작: 일정 %d개, 확인 간격 %.0f초", len(_schedules), self.tick)
+        while not stopping.is_set():
+            await self.run_once()
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=self.tick)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,207 @@
+# /wims_project/wims/tasks/worker.py
+"""
+작업 큐 워커 프로세스입니다. Reflex 백엔드와 별도 프로세스로 실행합니다.
+
+    python -m wims.tasks.worker --queue default=4 --queue import=1
+
+- 큐마다 동시 실행 수 상한을 두고, 빈 자리만큼만 claim()으로 작업을 가져갑니다.
+- 실행 중에는 가시성 타임아웃의 1/3 간격으로 점유를 연장합니다. 워커가 죽으면 점유가 만료되어
+  다른 워커가 작업을 다시 가져갑니다.
+- SIGTERM/SIGINT를 받으면 새 작업을 가져가지 않고, 실행 중인 작업이 끝날 때까지 최대 --grace초 기다립니다.
+  그래도 끝나지 않은 작업은 점유를 풀어 대기 상태로 되돌리므로 다른 워커가 바로 다시 실행합니다.
+  동기 작업(스레드에서 실행)은 중단할 수 없어 끝날 때까지 프로세스가 남아 있으며, 그동안 다른 워커에서
+  같은 작업이 함께 실행될 수 있습니다. (결과는 기록하지 않음) 작업 함수는 다시 실행해도 안전해야 합니다.
+- 주기 작업 스케줄러(wims.tasks.scheduler)도 함께 실행합니다. 여러 워커가 실행해도 일정마다 한 번만
+  작업을 넣으므로 모든 워커에서 켜 두어도 되며, --no-scheduler로 끌 수 있습니다.
+
+환경 변수:
+    WIMS_WORKER_QUEUES: --queue를 지정하지 않았을 때의 큐 설정 (예: "default=4,import=1")
+    WIMS_WORKER_POLL_INTERVAL: 작업이 없을 때 큐를 다시 확인하는 간격(초, 기본값: 1)
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import signal
+import socket
+import time
+import traceback
+from typing import Dict, List, Optional, Set
+
+import rxconfig  # noqa: F401 - DB 설정을 로드합니다.
+
+from .. import db, domains
+from .queue import ClaimedJob, claim, complete, extend_lease, fail, reap_expired, release
+from .registry import get_task
+from .scheduler import Scheduler
+
+logger = logging.getLogger("wims.tasks.worker")
+
+#  워커가 시작할 때 import하여 @task 등록을 완료할 모듈 목록 (도메인 작업은 각 도메인의 DOMAIN.jobs)
+TASK_MODULES = [
+    "wims.tasks.maintenance",
+    *domains.job_modules(),
+]
+
+#  점유 시간이 지나고 재시도 횟수도 모두 쓴 작업을 정리하는 간격(초)
+REAP_INTERVAL = 30
+
+
+class Worker:
+    def __init__(
+        self,
+        concurrency: Dict[str, int],
+        poll_interval: float,
+        grace: float,
+        scheduler: Optional[Scheduler] = None,
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.grace = grace
+        self.scheduler = scheduler
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+        #  실행 중인 작업 태스크 -> 작업
+        self._running: Dict[asyncio.Task, ClaimedJob] = {}
+
+    def stop(self):
+        if not self._stopping.is_set():
+            logger.info("종료 신호를 받았습니다. 새 작업을 가져가지 않습니다.")
+            self._stopping.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
+
+        logger.info("워커 %s 시작: %s", self.worker_id, self.concurrency)
+        pollers = [asyncio.create_task(self._poll_queue(queue, limit)) for queue, limit in self.concurrency.items()]
+        if self.scheduler is not None:
+            pollers.append(asyncio.create_task(self.scheduler.run(self._stopping)))
+        await self._stopping.wait()
+
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+        if self._running:
+            logger.info("실행 중인 작업 %d개를 최대 %.0f초 기다립니다.", len(self._running), self.grace)
+            _, pending = await asyncio.wait(set(self._running), timeout=self.grace)
+            if pending:
+                #  점유를 먼저 풀어 다른 워커가 바로 다시 실행하게 합니다. 태스크를 취소해도 동기 작업의
+                #  스레드는 멈추지 않으므로, 끝나더라도 complete()는 점유 확인에 실패해 결과를 남기지 않습니다.
+                job_ids = [self._running[job_task].id for job_task in pending if job_task in self._running]
+                try:
+                    released = await db.run(release, job_ids, self.worker_id)
+                    logger.warning("끝나지 않은 작업 %d개의 점유를 풀었습니다: %s", released, job_ids)
+                except Exception:  # noqa: BLE001 - 점유는 만료된 뒤 다른 워커가 가져갑니다.
+                    logger.exception("작업 점유 해제 실패: %s", job_ids)
+                for job_task in pending:
+                    job_task.cancel()
+        logger.info("워커 %s 종료", self.worker_id)
+
+    async def _poll_queue(self, queue: str, limit: int):
+        running: Set[asyncio.Task] = set()
+        slot_freed = asyncio.Event()
+        last_reap = 0.0
+        loop = asyncio.get_running_loop()
+
+        def on_done(job_task: asyncio.Task):
+            running.discard(job_task)
+            self._running.pop(job_task, None)
+            slot_freed.set()
+
+        while True:
+            try:
+                if loop.time() - last_reap > REAP_INTERVAL:
+                    await db.run(reap_expired, queue)
+                    last_reap = loop.time()
+                free = limit - len(running)
+                jobs: List[ClaimedJob] = await db.run(claim, queue, self.worker_id, free) if free > 0 else []
+            except Exception:  # noqa: BLE001 - DB 장애 시 잠시 후 다시 시도합니다.
+                logger.exception("큐 '%s' 조회 실패", queue)
+                jobs = []
+
+            for job in jobs:
+                job_task = asyncio.create_task(self._execute(job))
+                running.add(job_task)
+                self._running[job_task] = job
+                job_task.add_done_callback(on_done)
+
+            #  빈 자리를 모두 채웠으면 작업이 끝날 때까지, 가져올 작업이 없었으면 poll_interval만큼 기다립니다.
+            if jobs and len(jobs) == free:
+                continue
+            slot_freed.clear()
+            try:
+                await asyncio.wait_for(slot_freed.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _heartbeat(self, job: ClaimedJob):
+        interval = max(1.0, job.timeout_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            if not await db.run(extend_lease, job.id, self.worker_id):
+                logger.warning("작업 %d의 점유를 잃었습니다. (다른 워커가 다시 실행할 수 있습니다)", job.id)
+                return
+
+    async def _execute(self, job: ClaimedJob):
+        logger.info("작업 %d (%s) 시작, 시도 %d/%d", job.id, job.task, job.attempts, job.max_attempts)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        started = time.monotonic()
+        backoff = 10.0
+        try:
+            spec = get_task(job.task)
+            backoff = spec.backoff
+            if spec.is_async:
+                result = await spec.fn(job.payload)
+            else:
+                result = await asyncio.to_thread(spec.fn, job.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001 - 작업 예외는 모두 재시도 대상입니다.
+            error = traceback.format_exc()
+            logger.warning("작업 %d (%s) 실패 (%.1f초)\n%s", job.id, job.task, time.monotonic() - started, error)
+            await db.run(fail, job, self.worker_id, error, backoff)
+        else:
+            if await db.run(complete, job.id, self.worker_id, result):
+                logger.info("작업 %d (%s) 완료 (%.1f초)", job.id, job.task, time.monotonic() - started)
+            else:
+                logger.warning("작업 %d (%s)는 점유를 잃은 뒤 완료되어 결과를 기록하지 않았습니다.", job.id, job.task)
+        finally:
+            heartbeat.cancel()
+
+
+def parse_queues(values: List[str]) -> Dict[str, int]:
+    """["default=4", "import=1"] 또는 "default=4,import=1" 형태를 {큐: 동시 실행 수}로 변환합니다."""
+    concurrency: Dict[str, int] = {}
+    for value in values:
+        for item in filter(None, (part.strip() for part in value.split(","))):
+            name, _, limit = item.partition("=")
+            concurrency[name] = int(limit or 1)
+    return concurrency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WIMS 작업 큐 워커")
+    parser.add_argument("--queue", action="append", default=[], help="큐 이름=동시 실행 수 (여러 번 지정 가능)")
+    parser.add_argument(
+        "--poll-interval", type=float, default=float(os.getenv("WIMS_WORKER_POLL_INTERVAL", 1.0)),
+        help="작업이 없을 때 다시 확인하는 간격(초)",
+    )
+    parser.add_argument("--grace", type=float, default=30.0, help="종료 시 실행 중인 작업을 기다리는 시간(초)")
+    parser.add_argument("--no-scheduler", action="store_true", help="주기 작업 스케줄러를 실행하지 않습니다.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    for module in TASK_MODULES:
+        importlib.import_module(module)
+
+    concurrency = parse_queues(args.queue or [os.getenv("WIMS_WORKER_QUEUES", "default=4,import=1")])
+    scheduler = None if args.no_scheduler else Scheduler()
+    asyncio.run(Worker(concurrency, args.poll_interval, args.grace, scheduler).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# /wims_project/wims/tokens.py
+"""
+짧은 시간 동안만 유효한 HMAC 서명 토큰입니다.
+
+Reflex 세션 상태는 웹소켓 이벤트에서만 접근할 수 있으므로, 내보내기처럼 일반 HTTP 요청으로
+처리하는 엔드포인트는 이벤트 핸들러가 권한을 확인한 뒤 발급한 토큰으로 요청을 인증합니다.
+
+환경 변수:
+    WIMS_SECRET_KEY: 서명 키. 여러 워커/서버에서 실행할 때는 모두 같은 값으로 설정해야 합니다.
+        설정하지 않으면 프로세스마다 임의의 키를 사용하므로 발급한 워커에서만 검증됩니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from typing import Optional
+
+_SECRET = (os.getenv("WIMS_SECRET_KEY") or secrets.token_hex(32)).encode()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signature(message: bytes) -> str:
+    return _b64encode(hmac.new(_SECRET, message, hashlib.sha256).digest())
+
+
+def sign(purpose: str, subject: str, ttl_seconds: int = 60) -> str:
+    """
+    토큰을 발급합니다.
+
+    Args:
+        purpose (str): 토큰 용도. 다른 용도로 발급된 토큰은 검증에 실패합니다.
+        subject (str): 토큰에 담을 값 (예: 발급한 사용자 ID).
+        ttl_seconds (int): 유효 시간(초).
+    """
+    expires = int(time.time()) + ttl_seconds
+    message = f"{purpose}|{subject}|{expires}".encode()
+    return f"{_b64encode(message)}.{_signature(message)}"
+
+
+def verify(token: str, purpose: str) -> Optional[str]:
+    """토큰이 유효하면 subject를, 위조/만료/용도 불일치이면 None을 반환합니다."""
+    try:
+        encoded, signature = token.split(".", 1)
+        message = _b64decode(encoded)
+        token_purpose, subject, expires = message.decode().split("|")
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not hmac.compare_digest(signature, _signature(message)):
+        return None
+    if token_purpose != purpose or int(expires) < time.time():
+        return None
+    return subject
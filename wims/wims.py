@@ -1,14 +1,15 @@
 # /wims_project/wims/wims.py
 import reflex as rx
+from . import domains, metrics, serve
 from .components.layout import template
 from .pages.index import login_page
-from .domains.usr.pages import user_admin_page, department_admin_page
-# from .domains.lims.pages import ... # 향후 추가될 도메인 페이지
+from .state.base import BaseState
+from .api import api
 
-
-#  [신규] 간단한 대시보드 페이지 정의
-def dashboard() -> rx.Component:
-    return rx.heading("대시보드에 오신 것을 환영합니다.", size="7")
+#  각 도메인의 사이드바 메뉴 및 경로 권한과 상태 클래스 등록 (wims.domains 레지스트리)
+#  상태 클래스는 이벤트 처리에 필요하므로 시작할 때 등록하고, 페이지 내용은 평가될 때 만듭니다.
+domains.load_menus()
+domains.load_states()
 
 
 #  App 인스턴스 생성
@@ -19,17 +20,20 @@ app = rx.App(
         gray_color="slate",
         radius="medium",
     ),
-    style={"font_size": "16px"}
+    style={"font_size": "16px"},
+    #  내보내기 등 HTTP 엔드포인트 (wims/api.py)
+    api_transformer=api,
 )
+#  워커 종료 시 실시간 수신, 해싱 프로세스 풀, DB 연결 정리 (wims/serve.py)
+app.register_lifespan_task(serve.worker_lifespan)
+#  이벤트 핸들러별 처리 시간, DB 시간, SQL 수, delta 크기 계측 (GET /api/ops/metrics, wims/metrics.py)
+app.add_middleware(metrics.HandlerMetricsMiddleware())
 
 #  페이지 추가
 #  로그인 페이지는 템플릿 없이 추가
 app.add_page(login_page, route="/")
 
-#  템플릿을 사용하는 페이지들
-app.add_page(template(page_content=dashboard()), route="/dashboard")
-app.add_page(template(page_content=user_admin_page()), route="/admin/users")
-app.add_page(template(page_content=department_admin_page()), route="/admin/departments")
-
-#  향후 추가될 LIMS 페이지 예시
-# app.add_page(template(page_content=lims_requests_page()), route="/lims/requests")
\ No newline at end of file
+#  도메인 페이지들은 템플릿으로 감싸 추가합니다. (각 도메인 패키지의 DOMAIN.pages)
+#  on_load의 공통 가드가 wims.navigation의 경로 권한 테이블로 접근을 검사합니다.
+#  대시보드는 로드 핸들러가 권한을 확인한 뒤 캐시된 지표로 카드를 만듭니다.
+domains.add_pages(app, wrap=template, default_on_load=BaseState.guard_page)